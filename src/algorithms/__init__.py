@@ -14,11 +14,20 @@ from src.algorithms.teleport import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'DIFFUSION_MODE',
+    'GroverEvolution',
+    'LIMIT_QUBITS_EXACT_GROVER',
     'deutsch_jozsa_algorithm',
     'deutsch_jozsa_oracle',
     'grover_algorithm_from_sat',
+    'grover_evolution_cache',
+    'grover_evolution_from_sat',
     'grover_iterate',
     'grover_iterator_from_sat',
+    'grover_snapshots_from_sat',
+    'grover_success_curve',
+    'PredictionGrover',
+    'predict_grover',
     'random_unitary_parameters',
     'teleportation_protocol_test',
     'teleportation_protocol',
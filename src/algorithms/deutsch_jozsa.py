@@ -8,6 +8,8 @@
 from src.thirdparty.maths import *;
 from src.thirdparty.quantum import *;
 
+from src.core.cache import *;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -74,11 +76,23 @@ def deutsch_jozsa_oracle(
     - `oraclenr` - <integer>, the choice of the 'unknown' function, which determines if the function is balanced or unbalanced.
     '''
     # circuit = QkProblems.dj_problem_oracle(problem=oraclenr, to_gate=True); # gives one out of 4 oracles
+    # NOTE: draw the random constant here, so that the gates themselves can be cached.
+    output = np.random.randint(0, 2) if oraclenr == 1 else 0;
+    return deutsch_jozsa_oracle_gate(n, oraclenr, output);
+
+@cached_gate()
+def deutsch_jozsa_oracle_gate(
+    n: int,
+    oraclenr: int,
+    output: int,
+) -> QkGate:
+    '''
+    Constructs the (shared) gate of the black-box function for the Deutsch-Jozsa problem.
+    '''
     circuit = QuantumCircuit(n + 1);
 
     match oraclenr:
         case 1:
-            output = np.random.randint(0, 2);
             if output == 1:
                 circuit.x(n);
         case _:
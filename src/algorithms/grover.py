@@ -5,9 +5,12 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from src.thirdparty.code import *;
 from src.thirdparty.maths import *;
 from src.thirdparty.quantum import *;
+from src.thirdparty.types import *;
 
+from src.core.cache import *;
 from src.models.boolsat import *;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -15,18 +18,147 @@ from src.models.boolsat import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'DIFFUSION_MODE',
+    'GroverEvolution',
+    'LIMIT_QUBITS_EXACT_GROVER',
     'grover_algorithm_from_sat',
+    'grover_evolution_cache',
+    'grover_evolution_from_sat',
     'grover_iterator_from_sat',
     'grover_iterate',
+    'grover_snapshots_from_sat',
+    'grover_success_curve',
+    'PredictionGrover',
+    'predict_grover',
 ];
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class DIFFUSION_MODE(Enum):
+    '''
+    Choice of construction of the diffusion operator `U_{0^⊥}` in the Grover iterate.
+    '''
+    # dense 2ⁿ x 2ⁿ unitary (only sensible for few qubits)
+    DENSE = 'dense';
+    # X-gates + a multi-controlled Z-gate
+    STRUCTURED = 'structured';
+    # dense for few qubits, otherwise structured
+    AUTO = 'auto';
+
+LIMIT_QUBITS_EXACT_GROVER: int = 10;
+MAX_SIZE_GROVER_EVOLUTION_CACHE: int = 8;
+
+# local usage only
+_DENSE_DIFFUSER_MAX_QUBITS: int = 4;
+_LABEL_SNAPSHOT_ROUND: str = 'round={r}';
+_DEFAULT_MAX_ROUNDS_PREDICTION: int = 256;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@dataclass
+class PredictionGrover():
+    '''
+    Analytic predictions for Grover's Algorithm (see `predict_grover`).
+    All arrays have the (broadcast) shape `S` of the inputs `n` and `m`.
+
+    - `curve` - array of shape `S + (r_max + 1,)` of the success probabilities after `r = 0, 1, ..., r_max` rounds.
+    - `rounds` - the optimal numbers of rounds.
+    - `success` - the success probabilities at the optimal numbers of rounds.
+    - `shots` - the expected numbers of shots required to measure a model at least once with the desired confidence
+        (`inf` if there are no models).
+    '''
+    curve: NDArray[Any, Float];
+    rounds: NDArray[Any, Int64];
+    success: NDArray[Any, Float];
+    shots: NDArray[Any, Float];
+
+class GroverEvolution():
+    '''
+    Exact evolution of the search register under Grover's Algorithm.
+
+    The Grover iterate is held as a dense `2ⁿ x 2ⁿ` matrix `G` restricted to the search register
+    (valid, as the clause ancillas are returned clean and the final bit remains in `|-⟩`):
+
+        `G = (2|s⟩⟨s| - 1) · O`, where `O|x⟩ = (-1)^{f(x)}|x⟩` and `|s⟩ = H⊗ⁿ|0⟩`.
+
+    Output states for any number of rounds are obtained via matrix powers (repeated squaring),
+    instead of simulating the iterates gate by gate.
+
+    NOTE: `G` has real entries, so that all amplitudes are real.
+
+    - `n` - number of search bits.
+    - `operator` - the restricted Grover iterate `G`.
+    - `satisfied` - <bool> mask of the assignments (by index), which satisfy the problem.
+    '''
+    n: int;
+    operator: NDArray[Shape['N, N'], Float];
+    satisfied: NDArray[Shape['N'], Bool];
+
+    def __init__(self, n: int, satisfied: NDArray[Shape['N'], Bool]):
+        self.n = n;
+        self.satisfied = np.asarray(satisfied, dtype=bool);
+        phases = np.where(self.satisfied, -1., 1.);
+        s = self.initial_state;
+        self.operator = 2 * np.outer(s, s * phases) - np.diag(phases);
+        return;
+
+    @property
+    def initial_state(self) -> NDArray[Shape['N'], Float]:
+        N = 2**self.n;
+        return np.full(shape=(N,), fill_value=1/np.sqrt(N), dtype=float);
+
+    def state(self, r: int) -> NDArray[Shape['N'], Float]:
+        '''
+        Returns the state `Gʳ|s⟩` of the search register after `r` rounds
+        (in qiskit's ordering, i.e. bit `i` of an index is the value of search bit `i`).
+        '''
+        return np.linalg.matrix_power(self.operator, r) @ self.initial_state;
+
+    def states(self, r_max: int, r_min: int = 0) -> NDArray[Shape['R, N'], Float]:
+        '''
+        Returns the states of the search register after `r = r_min, ..., r_max` rounds (one per row).
+        '''
+        psi = self.state(r_min);
+        result = np.empty(shape=(max(r_max - r_min + 1, 0), 2**self.n), dtype=float);
+        for k in range(len(result)):
+            result[k] = psi;
+            psi = self.operator @ psi;
+        return result;
+
+    def success_curve(self, r_max: Optional[int] = None) -> tuple[NDArray[Shape['*'], Float], int]:
+        '''
+        Computes the probability of measuring a model after `r = 0, 1, ..., r_max` rounds.
+        By default `r_max = ⌈π/4 · √2ⁿ⌉`.
+
+        @returns
+        - array of the success probabilities;
+        - the optimal number of rounds.
+        '''
+        if r_max is None:
+            r_max = int(np.ceil(pi/4 * np.sqrt(2**self.n)));
+        probs = np.abs(self.states(r_max=r_max))**2;
+        curve = probs[:, self.satisfied].sum(axis=-1);
+        return curve, int(np.argmax(curve));
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+grover_evolution_cache: LruCache[GroverEvolution] = LruCache(maxsize=MAX_SIZE_GROVER_EVOLUTION_CACHE);
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 def grover_algorithm_from_sat(
     problem: ProblemSAT,
-    prob: float = 0,
+    prob: float | Literal['auto'] = 0,
+    diffuser: DIFFUSION_MODE = DIFFUSION_MODE.AUTO,
+    max_qubits: Optional[int] = None,
     verbose: bool = False,
 ) -> QuantumCircuit:
     '''
@@ -35,46 +167,61 @@ def grover_algorithm_from_sat(
     @inputs
     - `problem` - an instance of the SAT problem.
     - `prob` - <float> proportion (if known) of solutions which fulfil problem.
+        Use `prob='auto'` to compute the exact proportion by counting the models of the problem.
+    - `diffuser` - <enum> construction of the diffusion operator (see `grover_iterate`).
+    - `max_qubits` - <integer | None> (optional) upper bound on the width of the circuit,
+        e.g. the number of qubits of the target backend.
+        If set, the clause ancillas are recycled as far as necessary (see `oracle_cnf`).
     - `verbose` - <bool>, whether or not to display feedback.
     '''
     n = problem.number_of_variables;
-    Nc = problem.number_of_clauses;
-    final = n + Nc;
 
     # comput optimal number of iterations:
-    r = heuristic_optimal_rounds(n=n, prob=prob);
+    if prob == 'auto':
+        m = count_models(problem);
+        # NOTE: if there are no models, no number of rounds helps.
+        r = heuristic_optimal_rounds(n=n, m=m) if m > 0 else 0;
+        if verbose:
+            print(f'{m} models out of 2^{n} assignments');
+            print(f'predicted probability of success: {float(predict_grover(n=n, m=m).success):.4f}');
+    else:
+        r = heuristic_optimal_rounds(n=n, prob=prob);
     if verbose:
         print(f'{n} qubits, r={r} rounds');
     # compute Grover iterate:
-    oracle = oracle_cnf(n=n, clauses=problem.clauses);
-    grit = grover_iterate(oracle=oracle, num_ancilla=Nc+1);
+    grit = grover_iterator_from_sat(problem=problem, diffuser=diffuser, max_qubits=max_qubits);
     grit = grit.decompose();
+    num_ancillas = grit.num_qubits - n - 1;
+    final = n + num_ancillas;
+    if verbose:
+        print(f'{num_ancillas} clause ancillas, {grit.num_qubits} qubits in total');
 
     # define circuit shape
     circuit = QuantumCircuit(
         QuantumRegister(n, 'q'),
-        QuantumRegister(Nc, 'a'),
+        QuantumRegister(num_ancillas, 'a'),
         QuantumRegister(1, 'final'),
         ClassicalRegister(n, 'c'),
-        # ClassicalRegister(Nc, 'aux'),
+        # ClassicalRegister(num_ancillas, 'aux'),
         ClassicalRegister(1, 'answer'),
     );
 
     # compose circuit:
 
-    # set ancilla bits to |-⟩ so that oracle functions behave like phase oracle:
-    circuit.x(range(n,n + Nc + 1));
-    circuit.h(range(n,n + Nc + 1));
+    # set final bit to |-⟩ so that oracle functions behave like phase oracle:
+    # NOTE: the clause ancillas must remain clean (|0⟩).
+    circuit.x(final);
+    circuit.h(final);
 
     # main part of grover algorithm:
     circuit.barrier();
     circuit.h(range(n));
     for r in range(r):
-        circuit.append(grit, range(n + Nc + 1), []);
+        circuit.append(grit, range(n + num_ancillas + 1), []);
     circuit.barrier();
 
-    # desire: transform |-⟩ to 1 so only undo the Hadamards on the ancilla bits:
-    circuit.h(range(n,n + Nc + 1));
+    # desire: transform |-⟩ to 1 so only undo the Hadamard on the final bit:
+    circuit.h(final);
 
     # add measurement gates:
     circuit.measure(range(n), range(n));
@@ -82,18 +229,110 @@ def grover_algorithm_from_sat(
 
     return circuit;
 
+def grover_evolution_from_sat(problem: ProblemSAT) -> GroverEvolution:
+    '''
+    Returns the exact evolution of the search register under Grover's Algorithm for a SAT problem.
+    The evolution is cached per problem (identified by its clauses).
+
+    @inputs
+    - `problem` - an instance of the SAT problem (after `setup()`).
+
+    NOTE: Raises a `ValueError` for problems with more than `LIMIT_QUBITS_EXACT_GROVER` variables.
+    '''
+    def create() -> GroverEvolution:
+        n = problem.number_of_variables;
+        if n > LIMIT_QUBITS_EXACT_GROVER:
+            raise ValueError(f'The exact evolution is limited to {LIMIT_QUBITS_EXACT_GROVER} search bits (problem has {n})!');
+        return GroverEvolution(n=n, satisfied=satisfied_assignments(problem));
+    return grover_evolution_cache.get_or_create(problem.fingerprint(), create);
+
+def grover_snapshots_from_sat(
+    problem: ProblemSAT,
+    r_max: Optional[int] = None,
+    diffuser: DIFFUSION_MODE = DIFFUSION_MODE.AUTO,
+    max_qubits: Optional[int] = None,
+) -> QuantumCircuit:
+    '''
+    Constructs a Quantum-Circuit for Grover's Algorithm with `r_max` rounds,
+    which saves the probabilities of the search bits after each application of the Grover iterate
+    (instead of measuring at the end).
+    The snapshots are labelled `round=0`, `round=1`, ..., `round={r_max}`.
+
+    Running this circuit once (e.g. via `get_snapshots_of_circuit`)
+    yields the success probability for every number of rounds upto `r_max`, see `grover_success_curve`.
+
+    @inputs
+    - `problem` - an instance of the SAT problem.
+    - `r_max` - <integer | None> (optional) maximal number of rounds.
+        Defaults to `⌈π/4 · √2ⁿ⌉`, which suffices for problems with at least one model.
+    - `diffuser` - <enum> construction of the diffusion operator (see `grover_iterate`).
+    - `max_qubits` - <integer | None> (optional) upper bound on the width of the circuit (see `grover_algorithm_from_sat`).
+    '''
+    # NOTE: imported here, as importing Aer is slow and not needed elsewhere when building circuits.
+    from qiskit.providers.aer.library import SaveProbabilities as QkSaveProbabilities;
+
+    n = problem.number_of_variables;
+    if r_max is None:
+        r_max = int(np.ceil(pi/4 * np.sqrt(2**n)));
+    grit = grover_iterator_from_sat(problem=problem, diffuser=diffuser, max_qubits=max_qubits);
+    grit = grit.decompose();
+    num_ancillas = grit.num_qubits - n - 1;
+    final = n + num_ancillas;
+
+    circuit = QuantumCircuit(
+        QuantumRegister(n, 'q'),
+        QuantumRegister(num_ancillas, 'a'),
+        QuantumRegister(1, 'final'),
+    );
+    circuit.x(final);
+    circuit.h(final);
+    circuit.h(range(n));
+    circuit.append(QkSaveProbabilities(n, label=_LABEL_SNAPSHOT_ROUND.format(r=0)), range(n));
+    for r in range(1, r_max + 1):
+        circuit.append(grit, range(n + num_ancillas + 1), []);
+        circuit.append(QkSaveProbabilities(n, label=_LABEL_SNAPSHOT_ROUND.format(r=r)), range(n));
+    return circuit;
+
+def grover_success_curve(
+    problem: ProblemSAT,
+    snapshots: dict[str, NDArray[Shape['*'], Float]],
+) -> tuple[NDArray[Shape['*'], Float], int]:
+    '''
+    Computes the success probability of Grover's Algorithm against the number of rounds
+    from the snapshots of a circuit constructed via `grover_snapshots_from_sat`.
+
+    @inputs
+    - `problem` - an instance of the SAT problem.
+    - `snapshots` - dictionary of snapshots by label.
+
+    @returns
+    - array of the probabilities of measuring a model after `r = 0, 1, ..., r_max` rounds;
+    - the (empirically) optimal number of rounds.
+    '''
+    satisfied = satisfied_assignments(problem);
+    curve = [];
+    while _LABEL_SNAPSHOT_ROUND.format(r=len(curve)) in snapshots:
+        probs = np.asarray(snapshots[_LABEL_SNAPSHOT_ROUND.format(r=len(curve))], dtype=float);
+        curve.append(float(probs[satisfied].sum()));
+    curve = np.asarray(curve, dtype=float);
+    r = int(np.argmax(curve)) if len(curve) > 0 else 0;
+    return curve, r;
+
 def grover_iterator_from_sat(
     problem: ProblemSAT,
+    diffuser: DIFFUSION_MODE = DIFFUSION_MODE.AUTO,
+    max_qubits: Optional[int] = None,
 ) -> QuantumCircuit:
     n = problem.number_of_variables;
-    Nc = problem.number_of_clauses;
-    oracle = oracle_cnf(n=n, clauses=problem.clauses);
-    grit = grover_iterate(oracle=oracle, num_ancilla=Nc+1);
+    max_ancillas = None if max_qubits is None else max_qubits - n - 1;
+    oracle = oracle_cnf(n=n, clauses=problem.clauses, max_ancillas=max_ancillas);
+    grit = grover_iterate(oracle=oracle, num_ancilla=oracle.num_qubits - n, diffuser=diffuser);
     return grit;
 
 def grover_iterate(
     oracle: QuantumCircuit,
     num_ancilla: int = 0,
+    diffuser: DIFFUSION_MODE = DIFFUSION_MODE.AUTO,
 ) -> QuantumCircuit:
     '''
     Constructs the Grover Iterate (cf. [§8.1, Kaye (2007)]).
@@ -103,22 +342,117 @@ def grover_iterate(
     - apply the n-qubit Hadamard gate H.
     - apply U_{0^⊥} .
     - apply the n-qubit Hadamard gate H.
+
+    @inputs
+    - `oracle` - the oracle circuit (the search qubits come first, followed by the ancillas).
+    - `num_ancilla` - <integer> number of ancillary qubits of the oracle.
+    - `diffuser` - <enum> construction of `U_{0^⊥}`:
+        - `DIFFUSION_MODE.DENSE` - as a dense `2ⁿ x 2ⁿ` unitary.
+        - `DIFFUSION_MODE.STRUCTURED` - as `X⊗ⁿ · CⁿZ · X⊗ⁿ` (upto global phase),
+          where the ancillas of the oracle are used as dirty ancillas for the multi-controlled gate.
+        - `DIFFUSION_MODE.AUTO` (default) - dense for few qubits, otherwise structured.
     '''
     n = oracle.num_qubits - num_ancilla;
-    U = -np.eye(2**n);
-    U[0, 0] = 1;
+    if diffuser == DIFFUSION_MODE.AUTO:
+        diffuser = DIFFUSION_MODE.DENSE if n <= _DENSE_DIFFUSER_MAX_QUBITS else DIFFUSION_MODE.STRUCTURED;
 
     circuit = oracle.copy();
     circuit.name = 'Grover-Iterate';
     circuit.h(range(n));
-    circuit.unitary(QkOperator(U), range(n));
+    match diffuser:
+        case DIFFUSION_MODE.DENSE:
+            U = -np.eye(2**n);
+            U[0, 0] = 1;
+            circuit.unitary(QkOperator(U), range(n));
+        # case DIFFUSION_MODE.STRUCTURED:
+        case _:
+            # NOTE: X⊗ⁿ · CⁿZ · X⊗ⁿ = 1 - 2|0⟩⟨0| = -U_{0^⊥}
+            circuit.x(range(n));
+            qk_mcz(circuit, controls=list(range(n - 1)), target=n - 1, ancillas=list(range(n, n + num_ancilla)));
+            circuit.x(range(n));
+            circuit.global_phase += pi;
     circuit.h(range(n));
     return circuit;
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def satisfied_assignments(problem: ProblemSAT) -> NDArray[Shape['N'], Bool]:
+    '''
+    Evaluates the problem on all `2ⁿ` assignments of its variables.
+
+    @returns
+    <bool> array indicating which assignments satisfy the problem,
+    where bit `i` of the index of an assignment is the value of the `i`-th variable (= search bit).
+    '''
+    n = problem.number_of_variables;
+    assignments = (np.arange(2**n, dtype=np.int64)[:, np.newaxis] >> np.arange(n, dtype=np.int64)) & 1;
+    satisfied, _ = problem.verify_many(assignments.astype(bool));
+    return satisfied;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # AUXILIARY METHODS - HEURISTICS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+def predict_grover(
+    n: int | NDArray[Any, Int],
+    m: int | NDArray[Any, Int],
+    confidence: float = 0.95,
+    r_max: Optional[int] = None,
+) -> PredictionGrover:
+    '''
+    Predicts the behaviour of Grover's Algorithm without simulating any circuit,
+    based on the 2-dimensional subspace picture (see `heuristic_optimal_rounds`):
+
+        `P(success after r rounds) = sin((2r + 1)θ)²`, where `sin(θ)² = m/2ⁿ`.
+
+    The computation is vectorised over (broadcastable) arrays of `n` and `m`,
+    so that large sweeps of problem sizes can be planned at once.
+
+    @inputs
+    - `n` - <integer | array> number(s) of search bits.
+    - `m` - <integer | array> number(s) of models (e.g. as computed by `count_models`).
+    - `confidence` - <float> desired probability of measuring a model at least once.
+    - `r_max` - <integer | None> (optional) maximal number of rounds of the curve.
+        Defaults to the largest optimal number of rounds plus one (but at most 256).
+        For large sweeps choose `r_max` explicitly, as the curves consist of `r_max + 1` values per pair.
+
+    @returns
+    The predicted success curves, optimal numbers of rounds, success probabilities and expected numbers of shots.
+
+    NOTE: The expected number of shots `k` is the least `k`, such that `1 - (1 - P)ᵏ ≥ confidence`,
+    where `P` is the success probability at the optimal number of rounds.
+    '''
+    n, m = np.broadcast_arrays(np.asarray(n, dtype=float), np.asarray(m, dtype=float));
+    prob = np.clip(m / 2.**n, 0., 1.);
+    theta = np.arcsin(np.sqrt(prob));
+
+    # optimal number of rounds: best integer neighbour of π/(4θ) - 1/2.
+    with np.errstate(divide='ignore'):
+        x = np.where(theta > 0, pi/(4*np.where(theta > 0, theta, 1.)) - 1/2, 0.);
+    r0 = np.maximum(np.floor(x), 0.);
+    r1 = r0 + 1;
+    success0 = np.sin((2*r0 + 1)*theta)**2;
+    success1 = np.sin((2*r1 + 1)*theta)**2;
+    rounds = np.where(success1 > success0, r1, r0).astype(np.int64);
+    success = np.maximum(success0, success1);
+    rounds = np.where(theta > 0, rounds, 0);
+    success = np.where(theta > 0, success, 0.);
+
+    if r_max is None:
+        r_max = min(int(rounds.max(initial=0)) + 1, _DEFAULT_MAX_ROUNDS_PREDICTION);
+    r = np.arange(r_max + 1, dtype=float);
+    curve = np.sin((2*r + 1)*theta[..., np.newaxis])**2;
+
+    # expected number of shots:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shots = np.ceil(np.log1p(-confidence) / np.log1p(-np.minimum(success, 1.)));
+    shots = np.where(success >= 1., 1., shots);
+    shots = np.where(success <= 0., np.inf, np.maximum(shots, 1.));
+
+    return PredictionGrover(curve=curve, rounds=rounds, success=success, shots=shots);
+
 def heuristic_optimal_rounds(
     n: int,
     m: int = 1,
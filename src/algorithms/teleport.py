@@ -9,6 +9,8 @@ from src.thirdparty.maths import *;
 from src.thirdparty.quantum import *;
 from src.thirdparty.types import *;
 
+from src.core.cache import *;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -83,6 +85,7 @@ def teleportation_protocol(include_entanglement: bool = True) -> QuantumCircuit:
 # AUXILIARY METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+@cached_gate()
 def entangle_pair() -> QkGate:
     circuit = QuantumCircuit(2);
     circuit.h(0);
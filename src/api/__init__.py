@@ -5,9 +5,13 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from src.api.analysis import *;
 from src.api.ibm import *;
 from src.api.jobs import *;
 from src.api.latest import *;
+from src.api.manager import *;
+from src.api.registry import *;
+from src.api.results import *;
 from src.api.statistics import *;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -15,16 +19,36 @@ from src.api.statistics import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'analyse_circuit',
+    'backend_metadata_cache',
+    'BackendMetadataCache',
+    'choose_simulator',
+    'CachedJob',
+    'CircuitAnalysis',
     'connect_to_backend',
+    'Counts',
+    'CountsMatrix',
     'CreateBackend',
     'display_backends',
     'display_latest_info',
     'get_counts',
+    'get_job_result',
+    'has_running_loop',
     'get_ibm_account',
+    'iterate_counts_per_experiment',
+    'job_manager',
+    'job_registry',
+    'JobManager',
+    'JobRecord',
+    'JobRegistry',
     'latest_info',
     'latest_state',
     'Latest',
+    'PaddedCounts',
     'recover_job',
     'retrieve_job',
     'RecoverJobWidget',
+    'result_store',
+    'ResultStore',
+    'TrackedJob',
 ];
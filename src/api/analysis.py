@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.code import *;
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.types import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'analyse_circuit',
+    'choose_simulator',
+    'CircuitAnalysis',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+LIMIT_QUBITS_STATEVECTOR: int = 24;
+LIMIT_CUT_MATRIXPRODUCT: int = 12;
+LIMIT_NON_CLIFFORD_EXTENDED_STABILISER: int = 16;
+
+# local usage only
+# NOTE: the Clifford gates accepted by the stabiliser method of Aer (others are expanded via their definitions).
+_CLIFFORD_GATES: list[str] = [
+    'id', 'x', 'y', 'z', 'h', 's', 'sdg', 'sx', 'sxdg',
+    'cx', 'cy', 'cz', 'swap',
+];
+_ROTATION_GATES: list[str] = [ 'p', 'u1', 'rx', 'ry', 'rz' ];
+# NOTE: the further gates accepted by the extended stabiliser method of Aer.
+_EXTENDED_STABILISER_GATES: list[str] = [ 'p', 'u1', 't', 'tdg' ];
+_IGNORED_INSTRUCTIONS: list[str] = [ 'barrier', 'measure', 'reset', 'delay', 'snapshot' ];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@dataclass
+class CircuitAnalysis():
+    '''
+    Structural properties of a circuit, which determine the cost of simulation methods.
+
+    - `num_qubits` - number of qubits.
+    - `num_gates` - number of (elementary) gates.
+    - `num_non_clifford` - number of gates, which are not Clifford gates (e.g. `t`, `ccx`, arbitrary rotations).
+    - `gates` - names of the (elementary) gates.
+    - `max_cut` - estimate of the entanglement: the maximal number of multi-qubit gates
+        crossing a cut between qubits `0, ..., i` and `i + 1, ..., m - 1`
+        (bounded by the size of the smaller side).
+        The bond dimension required by an MPS-simulation is at most `2^max_cut`.
+    '''
+    num_qubits: int = field(default=0);
+    num_gates: int = field(default=0);
+    num_non_clifford: int = field(default=0);
+    max_cut: int = field(default=0);
+    gates: set[str] = field(default_factory=set);
+
+    @property
+    def is_clifford(self) -> bool:
+        return self.num_non_clifford == 0;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def analyse_circuit(circuit: QuantumCircuit) -> CircuitAnalysis:
+    '''
+    Analyses a circuit (without simulating it).
+    Composite gates are expanded via their definitions.
+    '''
+    m = circuit.num_qubits;
+    analysis = CircuitAnalysis(num_qubits=m);
+    crossings = np.zeros(shape=(max(m - 1, 0),), dtype=np.int64);
+    analyse_instructions(circuit, list(range(m)), analysis, crossings);
+    sides = np.minimum(np.arange(1, m), np.arange(m - 1, 0, -1));
+    analysis.max_cut = int(np.minimum(crossings, sides).max(initial=0));
+    return analysis;
+
+def choose_simulator(circuit: QuantumCircuit) -> BACKEND_SIMULATOR:
+    '''
+    Chooses a simulation method for a circuit:
+
+    - Clifford circuits are simulated by the stabiliser method (polynomial cost in the number of qubits);
+    - circuits with few qubits are simulated by the statevector method;
+    - circuits with little entanglement (across linear cuts) are simulated by the MPS method;
+    - circuits with few non-Clifford gates are simulated by the extended stabiliser method;
+    - otherwise the MPS method is used (as the statevector method cannot handle the width).
+
+    NOTE: The (extended) stabiliser methods are only chosen, if all gates are amongst their basis gates,
+    as the transpiler cannot rewrite e.g. `rz(π/2)` as `s`.
+    '''
+    analysis = analyse_circuit(circuit);
+    if analysis.gates.issubset(_CLIFFORD_GATES):
+        return BACKEND_SIMULATOR.CLIFFORD;
+    if analysis.num_qubits <= LIMIT_QUBITS_STATEVECTOR:
+        return BACKEND_SIMULATOR.STATE_VECTOR;
+    if analysis.max_cut <= LIMIT_CUT_MATRIXPRODUCT:
+        return BACKEND_SIMULATOR.STATE_MATRIXPRODUCT;
+    if analysis.num_non_clifford <= LIMIT_NON_CLIFFORD_EXTENDED_STABILISER \
+    and analysis.gates.issubset(_CLIFFORD_GATES + _EXTENDED_STABILISER_GATES):
+        return BACKEND_SIMULATOR.CLIFFORD_EXTENDED;
+    return BACKEND_SIMULATOR.STATE_MATRIXPRODUCT;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def analyse_instructions(
+    circuit: QuantumCircuit,
+    positions: list[int],
+    analysis: CircuitAnalysis,
+    crossings: NDArray[Shape['*'], Int64],
+):
+    '''
+    Accumulates the properties of the instructions of a circuit,
+    whose `i`-th qubit is the qubit `positions[i]` of the analysed circuit.
+    '''
+    index = { qubit: i for i, qubit in enumerate(circuit.qubits) };
+    for instruction in circuit.data:
+        op = instruction.operation;
+        qubits = [ positions[index[qubit]] for qubit in instruction.qubits ];
+        name = op.name;
+        if name in _IGNORED_INSTRUCTIONS or name.startswith('save_'):
+            continue;
+        if name not in _CLIFFORD_GATES and name not in _ROTATION_GATES and name not in _EXTENDED_STABILISER_GATES \
+        and name != 'unitary' and op.definition is not None:
+            analyse_instructions(op.definition, qubits, analysis, crossings);
+            continue;
+        analysis.num_gates += 1;
+        analysis.gates.add(name);
+        if not is_clifford_gate(op):
+            analysis.num_non_clifford += 1;
+        if len(qubits) > 1:
+            crossings[min(qubits):max(qubits)] += 1;
+    return;
+
+def is_clifford_gate(op: QkInstruction) -> bool:
+    '''
+    Determines whether an elementary gate is a Clifford gate.
+    Rotations are Clifford gates, if their angles are multiples of `π/2`.
+    '''
+    if op.name in _CLIFFORD_GATES:
+        return True;
+    if op.name in _ROTATION_GATES:
+        try:
+            angle = float(op.params[0]);
+        except:
+            # unbound parameters:
+            return False;
+        return bool(np.isclose(np.remainder(angle / (pi/2) + 0.5, 1.) - 0.5, 0.));
+    return False;
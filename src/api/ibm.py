@@ -12,10 +12,12 @@ from src.thirdparty.config import *;
 from src.thirdparty.misc import *;
 from src.thirdparty.quantum import *;
 from src.thirdparty.render import *;
+from src.thirdparty.run import *;
 from src.thirdparty.system import *;
 from src.thirdparty.types import *;
 
 from src.core.env import *;
+from src.api.analysis import *;
 from src.api.latest import *;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -23,6 +25,8 @@ from src.api.latest import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'backend_metadata_cache',
+    'BackendMetadataCache',
     'get_ibm_account',
     'CreateBackend',
     'connect_to_backend',
@@ -33,11 +37,153 @@ __all__ = [
 # CONSTANTS / LOCAL VARIABLES
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+TTL_BACKEND_LIST: timedelta = timedelta(hours=1);
+TTL_BACKEND_CONFIGURATION: timedelta = timedelta(hours=6);
+TTL_BACKEND_STATUS: timedelta = timedelta(seconds=30);
+MAX_WORKERS_BACKEND_STATUS: int = 8;
+
 # local usage only
 _provider: Optional[QkAccountProvider] = None;
 T = TypeVar('T');
 ARGS = ParamSpec('ARGS');
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class - backend metadata cache
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class BackendMetadataCache():
+    '''
+    Caches the list of backends of the provider
+    as well as the configuration and status of each backend (by name),
+    each for the duration of its own time-to-live:
+
+    - the list of backends and their (static) configurations are kept for hours;
+    - the status (operational, pending jobs) is only kept for seconds.
+
+    Expired statuses of several backends are refreshed in parallel by a small thread pool.
+
+    NOTE: the cache is bound to a provider. It is cleared, once a different provider is used.
+    '''
+    ttl_backends: timedelta;
+    ttl_configuration: timedelta;
+    ttl_status: timedelta;
+    max_workers: int;
+    provider: Optional[QkAccountProvider];
+    entries_backends: Optional[tuple[datetime, list[IBMQBackend]]];
+    entries_configuration: dict[str, tuple[datetime, Any]];
+    entries_status: dict[str, tuple[datetime, Any]];
+    lock: Lock;
+
+    def __init__(
+        self,
+        ttl_backends: timedelta = TTL_BACKEND_LIST,
+        ttl_configuration: timedelta = TTL_BACKEND_CONFIGURATION,
+        ttl_status: timedelta = TTL_BACKEND_STATUS,
+        max_workers: int = MAX_WORKERS_BACKEND_STATUS,
+    ):
+        self.ttl_backends = ttl_backends;
+        self.ttl_configuration = ttl_configuration;
+        self.ttl_status = ttl_status;
+        self.max_workers = max_workers;
+        self.lock = Lock();
+        self.clear();
+        return;
+
+    def clear(self):
+        with self.lock:
+            self.reset(provider=None);
+        return;
+
+    def reset(self, provider: Optional[QkAccountProvider]):
+        '''
+        Binds the cache to a provider and drops all entries.
+
+        NOTE: the caller must hold the lock.
+        '''
+        self.provider = provider;
+        self.entries_backends = None;
+        self.entries_configuration = dict();
+        self.entries_status = dict();
+        return;
+
+    def backends(self, provider: QkAccountProvider) -> list[IBMQBackend]:
+        '''
+        Returns the (cached) list of backends of the provider.
+        '''
+        now = datetime.now();
+        with self.lock:
+            if provider is not self.provider:
+                self.reset(provider=provider);
+            if self.entries_backends is not None and now - self.entries_backends[0] < self.ttl_backends:
+                return self.entries_backends[1];
+        backends = provider.backends();
+        with self.lock:
+            # NOTE: do not store the list, if another thread has switched the provider in the meantime.
+            if provider is self.provider:
+                self.entries_backends = (now, backends);
+        return backends;
+
+    def backend(self, provider: QkAccountProvider, name: str) -> IBMQBackend:
+        '''
+        Returns the backend of the provider by name.
+        Falls back to querying the provider, if the backend is not in the (cached) list.
+        '''
+        backend = next((be for be in self.backends(provider) if be.name() == name), None);
+        if backend is None:
+            backend = provider.get_backend(name);
+        return backend;
+
+    def configuration(self, backend: IBMQBackend) -> Any:
+        '''
+        Returns the (cached) configuration of a backend.
+        '''
+        return self.get_or_refresh(
+            entries = self.entries_configuration,
+            ttl = self.ttl_configuration,
+            backend = backend,
+            create = lambda: backend.configuration(),
+        );
+
+    def status(self, backend: IBMQBackend) -> Any:
+        '''
+        Returns the (cached) status of a backend.
+        '''
+        return self.get_or_refresh(
+            entries = self.entries_status,
+            ttl = self.ttl_status,
+            backend = backend,
+            create = lambda: backend.status(),
+        );
+
+    def statuses(self, backends: list[IBMQBackend]) -> list[Any]:
+        '''
+        Returns the statuses of several backends.
+        Expired statuses are refreshed in parallel.
+        '''
+        if len(backends) <= 1:
+            return [ self.status(be) for be in backends ];
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(backends))) as pool:
+            return list(pool.map(self.status, backends));
+
+    def get_or_refresh(
+        self,
+        entries: dict[str, tuple[datetime, Any]],
+        ttl: timedelta,
+        backend: IBMQBackend,
+        create: Callable[[], Any],
+    ) -> Any:
+        name = backend.name();
+        now = datetime.now();
+        with self.lock:
+            entry = entries.get(name, None);
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1];
+        # NOTE: queries are performed outside of the lock, so that they can run in parallel.
+        value = create();
+        with self.lock:
+            entries[name] = (now, value);
+        return value;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS: connection
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -53,6 +199,7 @@ def get_ibm_account(force_reload: bool = False) -> QkAccountProvider:
     global _provider;
     if force_reload:
         _provider = connect_to_ibm_account_force_reload();
+        backend_metadata_cache.clear();
     if _provider is None:
         try:
             _provider = IBMQ.load_account();
@@ -72,6 +219,9 @@ class CreateBackend(QkBackend):
     - `n`            - <integer> default=1; Number of qubits required (only relevant for cloud computations).
     - `option`       - enum<BACKEND | BACKEND_SIMULATOR>; choice of simulator/backend.
     - `force_reload` - <boolean> default=false; Whether to force reload IBM account. Only relevant for cloud computations.
+    - `circuit`      - <QuantumCircuit | None> (optional) the circuit to be run.
+        Only relevant for `BACKEND_SIMULATOR.AUTO`, which chooses the simulator based upon an analysis of the circuit
+        (defaults to Aer's automatic method, if no circuit is given).
 
     NOTE: to be used with `with`-blocks.
     '''
@@ -79,36 +229,38 @@ class CreateBackend(QkBackend):
     nr_qubits: int;
     option: BACKEND | BACKEND_SIMULATOR;
     provider: Optional[QkAccountProvider];
+    circuit: Optional[QuantumCircuit];
 
     def __init__(
         self,
         option: BACKEND | BACKEND_SIMULATOR,
         n: int  = 1,
-        force_reload: bool = False
+        force_reload: bool = False,
+        circuit: Optional[QuantumCircuit] = None,
     ):
         self.option = option;
         self.nr_qubits = n;
         self.provider = None;
+        self.circuit = circuit;
         if isinstance(option, BACKEND):
             self.provider = get_ibm_account(force_reload=force_reload);
         return;
 
     def __enter__(self) -> tuple[BACKEND | BACKEND_SIMULATOR, Optional[QkBackend]]:
         option = self.option;
+        if option == BACKEND_SIMULATOR.AUTO:
+            option = choose_simulator(self.circuit) if self.circuit is not None else BACKEND_SIMULATOR.AER;
         if isinstance(option, BACKEND_SIMULATOR):
-            be = QkBackendAer.get_backend(option.value);
+            # NOTE: the native simulator does not run jobs. Jobs are passed on to Aer.
+            be = QkBackendAer.get_backend(aer_backend_name(option));
             latest_state.set_backend(option=option, queue=False);
         elif option == BACKEND.LEAST_BUSY:
-            def filt(x: IBMQSimulator) -> bool:
-                return x.configuration().n_qubits >= self.nr_qubits \
-                    and x.configuration().simulator == False \
-                    and x.status().operational == True;
-            be = ibmq.least_busy(backends=self.provider.backends(filters=filt));
+            be = least_busy_backend(provider=self.provider, n=self.nr_qubits);
             option = backend_from_name(name=str(be))
             latest_state.set_backend(option=option, queue=True);
         else:
             try:
-                be = self.provider.get_backend(option.value);
+                be = backend_metadata_cache.backend(provider=self.provider, name=option.value);
                 latest_state.set_backend(option=option, queue=True);
             except:
                 be = None;
@@ -123,15 +275,17 @@ class CreateBackend(QkBackend):
 def connect_to_backend(
     option: BACKEND | BACKEND_SIMULATOR,
     n: int  = 1,
-    force_reload: bool = False
+    force_reload: bool = False,
+    circuit: Optional[QuantumCircuit] = None,
 ) -> Callable[[Callable[Concatenate[BACKEND | BACKEND_SIMULATOR, QkBackend, ARGS], T]], Callable[ARGS, Optional[T]]]:
     '''
     Decorator to ease connection to IBM backend.
+    See `CreateBackend` for the arguments.
     '''
     def dec(
         action: Callable[Concatenate[BACKEND | BACKEND_SIMULATOR, QkBackend, ARGS], T]
     ) -> Callable[ARGS, Optional[T]]:
-        be = CreateBackend(option=option, n=n, force_reload=force_reload);
+        be = CreateBackend(option=option, n=n, force_reload=force_reload, circuit=circuit);
         @wraps(action)
         def wrapped_action(**kwargs) -> Optional[T]:
             with be as (option, backend):
@@ -169,9 +323,35 @@ def connect_to_ibm_account_force_reload() -> QkAccountProvider:
     provider = IBMQ.load_account();
     return provider;
 
+def least_busy_backend(provider: QkAccountProvider, n: int) -> IBMQBackend:
+    '''
+    Determines the operational (non-simulator) backend with at least `n` qubits,
+    which has the fewest pending jobs.
+
+    NOTE: uses the backend metadata cache, so that only expired statuses are queried (in parallel).
+    '''
+    backends = [
+        be for be in backend_metadata_cache.backends(provider)
+        if isinstance(be, IBMQBackend) and not isinstance(be, IBMQSimulator)
+    ];
+    configurations = [ backend_metadata_cache.configuration(be) for be in backends ];
+    backends = [
+        be for be, config in zip(backends, configurations)
+        if config.n_qubits >= n and config.simulator == False
+    ];
+    statuses = backend_metadata_cache.statuses(backends);
+    candidates = [
+        (status.pending_jobs, k)
+        for k, status in enumerate(statuses)
+        if status.operational == True
+    ];
+    if len(candidates) == 0:
+        raise Exception(f'No operational backend with at least {n} qubits is available!');
+    return backends[min(candidates)[1]];
+
 def display_backends():
     provider = get_ibm_account(force_reload=False);
-    backends = provider.backends();
+    backends = backend_metadata_cache.backends(provider);
     names_simulator = [str(be) for be in backends if isinstance(be, IBMQSimulator)];
     names_queue = [str(be) for be in backends if isinstance(be, IBMQBackend) and not isinstance(be, IBMQSimulator)];
     items_simulator = '\n'.join([ f'<li>{item}</li>' for item in names_simulator]);
@@ -195,3 +375,9 @@ def display_backends():
         )
     ));
     return;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+backend_metadata_cache: BackendMetadataCache = BackendMetadataCache();
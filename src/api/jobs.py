@@ -14,8 +14,12 @@ from src.thirdparty.quantum import *;
 from src.thirdparty.render import *;
 from src.thirdparty.types import *;
 
+from src.core.cache import *;
 from src.api.ibm import *;
 from src.api.latest import *;
+from src.api.manager import *;
+from src.api.registry import *;
+from src.api.results import *;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -31,7 +35,9 @@ __all__ = [
 # CONSTANTS / LOCAL VARIABLES
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-LIMIT_NUM_JOBS: int = 10;
+PAGE_SIZE_JOBS: int = 50;
+PAGE_SIZE_RECORDS: int = 500;
+MAX_SIZE_HYDRATED_JOBS: int = 16;
 
 # local usage only
 T = TypeVar('T');
@@ -45,10 +51,11 @@ def retrieve_job(
     queue: bool,
     job_id: Optional[str] = None,
     backend_option: Optional[BACKEND | BACKEND_SIMULATOR] = None,
-) -> Optional[IBMQJob]:
+) -> Optional[IBMQJob | CachedJob]:
     '''
     Retrieves an IBMQ job by id or else the latest job.
     If not possible, returns None.
+    Completed jobs, whose results are in the local result store, are recovered without connecting to the backend.
 
     @inputs
     - `queue`           - <boolean> `true` if job is from backend queue, `false` if from simulator.
@@ -66,6 +73,9 @@ def retrieve_job(
     # Must provide a job id.
     if job_id is None:
         return None;
+    job = result_store.get(job_id);
+    if job is not None:
+        return job;
     with CreateBackend(option=backend_option) as (_, backend):
         if backend is None:
             return None;
@@ -80,9 +90,16 @@ def retrieve_last_job_and_backend(queue: bool) -> tuple[
 ]:
     '''
     Retrieves latest job + backend which were internally noted.
+    For the backend queue, falls back to the latest job in the (persistent) job registry,
+    e.g. after a restart of the kernel.
     '''
     job = latest_state.get_job(queue);
     backend_option = latest_state.get_backend(queue)
+    if queue and job is None:
+        records = job_registry.find(queue=True, limit=1);
+        if len(records) > 0:
+            backend_option = backend_option or backend_from_name(records[0].backend);
+            job = retrieve_job(queue=True, job_id=records[0].job_id, backend_option=backend_option);
     return job, backend_option;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -113,6 +130,8 @@ def recover_job(
       - Option completely ignored, if `as_widget=True` is used.
     - `ensure_job_done` - <boolean> if `true` (default) hinders action from being performed, when job does not have DONE status.
     - `wait` - <boolean> if `true` waits for job to be finished.
+        Within an event loop (e.g. in a notebook) the job is tracked by the job manager
+        and the action is carried out upon completion, without blocking.
     - `as_widget` - <boolean> if `true` displays a widget interface so that use can select backend + job before carrying out action.
         If `false` (default), attempts to retrieve job and carry out action if job exists and is done.
 
@@ -153,8 +172,17 @@ def recover_job(
                 # retrieve job or else use latest job:
                 job = retrieve_job(queue=queue, job_id=job_id, backend_option=backend_option) or last_job;
                 # if in simulator, forcibly wait until job is done:
-                if wait:
+                if wait and job is not None and not job.done():
                     display(HTML('<p style="color:blue;"><b>[INFO]</b> Wait for job to finish...</b>'));
+                    # NOTE: within an event loop (e.g. notebook kernel), do not block but perform action upon completion.
+                    if has_running_loop():
+                        output = widgets.Output();
+                        display(output);
+                        def on_done(job: IBMQJob):
+                            with output:
+                                action(job, **kwargs);
+                        job_manager.track(job, on_done=on_done, queue=queue);
+                        return;
                     job.wait_for_final_state();
                 # carry out action only if done, unless `ensure_job_done=False`:
                 if not ensure_job_done or is_job_done(job=job, queue=queue):
@@ -189,11 +217,15 @@ class RecoverJobWidget():
     option: Optional[BACKEND];
     queue: bool;
     job: Optional[IBMQJob];
+    jobs_hydrated: LruCache[IBMQJob];
+    pages: Optional[Generator[list[JobRecord], None, None]];
+    records: list[JobRecord];
 
     # widget components
     dropdown_backends: widgets.Dropdown;
     dropdown_jobs: widgets.Dropdown;
     btn_refresh: widgets.ToggleButton;
+    btn_more: widgets.Button;
     text_status: widgets.HTML;
     text_pending: widgets.HTML;
     output: widgets.Output;
@@ -208,6 +240,9 @@ class RecoverJobWidget():
         self.option = option;
         self.queue = queue;
         self.job = job;
+        self.jobs_hydrated = LruCache(maxsize=MAX_SIZE_HYDRATED_JOBS);
+        self.pages = None;
+        self.records = [];
         return;
 
     def show_loading(self):
@@ -230,10 +265,11 @@ class RecoverJobWidget():
                 # embed action into an event handle:
                 def handler(
                     backend_option: Optional[BACKEND | BACKEND_SIMULATOR],
-                    job: Optional[IBMQJob],
+                    job: Optional[IBMQJob | JobRecord],
                     refresh: bool,
                 ) -> None:
                     self.show_loading();
+                    job = self.hydrate(job);
                     if not ensure_job_done or is_job_done(job=job, queue=self.queue):
                         action(job, **kwargs);
                         self.hide_loading();
@@ -270,7 +306,7 @@ class RecoverJobWidget():
                 index_backend = 0;
             index_jobs = 0 if self.job is None else 1;
         else:
-            enums = list(BACKEND_SIMULATOR);
+            enums = [ e for e in BACKEND_SIMULATOR if e not in [ BACKEND_SIMULATOR.NATIVE, BACKEND_SIMULATOR.AUTO ] ];
             if isinstance(self.option, BACKEND_SIMULATOR):
                 enums = [ self.option ];
             options_backend = [ (e.value, e) for e in enums ];
@@ -285,6 +321,11 @@ class RecoverJobWidget():
 
         self.btn_refresh = widgets.ToggleButton(description='Refresh');
 
+        self.btn_more = widgets.Button(
+            description = 'Load more',
+            disabled = not self.queue,
+        );
+
         self.dropdown_backends = widgets.Dropdown(
             description='backend',
             options = options_backend,
@@ -314,6 +355,7 @@ class RecoverJobWidget():
         );
 
         self.btn_refresh.observe(self.handler_update, names='value');
+        self.btn_more.on_click(self.handler_load_more);
         self.dropdown_backends.observe(self.handler_upd_backend, names='value');
         self.dropdown_jobs.observe(self.handler_upd_job, names='value');
         if self.queue:
@@ -330,7 +372,10 @@ class RecoverJobWidget():
                 'display': 'flex',
                 'align_items': 'center',
             }),
-            self.btn_refresh,
+            widgets.HBox([
+                self.btn_refresh,
+                self.btn_more,
+            ]),
             self.text_pending,
         ], layout = {
             'padding': '10pt 10pt',
@@ -362,31 +407,107 @@ class RecoverJobWidget():
             option: BACKEND = change['new'];
         except:
             option = self.dropdown_backends.value;
-        self.show_loading();
-        jobs = get_list_of_jobs(option=option);
-        self.hide_loading();
+        self.pages = iterate_list_of_jobs(option=option);
+        self.records = [];
         value = self.dropdown_jobs.value;
         self.dropdown_jobs.index = 0;
-        self.dropdown_jobs.options = [('—', None)] + [(job.job_id(), job) for job in jobs];
+        self.dropdown_jobs.options = [('—', None)];
+        self.load_page();
         try:
-            id = value.job_id();
-            index = 1 + next(i for i, job in enumerate(jobs) if job.job_id() == id);
+            id = get_job_id(value);
+            index = 1 + next(i for i, record in enumerate(self.records) if record.job_id == id);
             self.dropdown_jobs.index = index;
         except:
             pass;
         return;
 
+    def handler_load_more(self, button: Optional[widgets.Button] = None):
+        '''
+        Handler to load the next page of jobs of the chosen backend.
+        '''
+        index = self.dropdown_jobs.index;
+        self.load_page();
+        self.dropdown_jobs.index = index;
+        return;
+
+    def load_page(self):
+        '''
+        Appends the next page of job descriptors (if any) to the list of jobs.
+        '''
+        if self.pages is None:
+            return;
+        self.show_loading();
+        records = next(self.pages, None);
+        self.hide_loading();
+        if records is None:
+            self.pages = None;
+            self.btn_more.disabled = True;
+            return;
+        self.btn_more.disabled = False;
+        self.records += records;
+        self.dropdown_jobs.options = [('—', None)] + [ (get_job_label(record), record) for record in self.records ];
+        return;
+
     def handler_upd_job(self, change: Optional[dict] = None):
         '''
         Handler to update status upon choice of job.
         '''
         try:
-            job: Optional[IBMQJob] = change['new'];
+            job: Optional[IBMQJob | JobRecord] = change['new'];
         except:
             job = self.dropdown_jobs.value;
+        job = self.hydrate(job);
         self.text_status.value = self.text_status_value(job);
+        if self.queue and job is not None:
+            try:
+                job_registry.update_status(job.job_id(), job.status().name);
+            except:
+                pass;
+        # update the status in the background, while the job is not finished:
+        if job is not None and has_running_loop() and not job.done():
+            job_manager.track(job, on_status=self.handler_status, queue=self.queue);
         return;
 
+    def handler_status(self, job: IBMQJob, status: QkJobStatus):
+        '''
+        Handler to update status upon changes of the status of a tracked job (if still selected).
+        '''
+        if get_job_id(self.hydrate(self.dropdown_jobs.value)) != job.job_id():
+            return;
+        self.text_status.value = self.text_status_value(job);
+        # once finished, trigger the action (as if refreshed by the user):
+        if status in QK_JOB_FINAL_STATES:
+            self.btn_refresh.value = not self.btn_refresh.value;
+        return;
+
+    def hydrate(self, job: Optional[IBMQJob | JobRecord]) -> Optional[IBMQJob]:
+        '''
+        Obtains the job for a job descriptor.
+        Only the most recently selected jobs are kept, so that memory does not grow with the list of jobs.
+
+        NOTE: Failed retrievals (e.g. due to network errors) are not cached, so that these are retried.
+        '''
+        if not isinstance(job, JobRecord):
+            return job;
+        record = job;
+        def create() -> IBMQJob:
+            self.show_loading();
+            try:
+                job = retrieve_job(
+                    queue = True,
+                    job_id = record.job_id,
+                    backend_option = backend_from_name(record.backend),
+                );
+            finally:
+                self.hide_loading();
+            if job is None:
+                raise LookupError(f'The job {record.job_id} could not be retrieved!');
+            return job;
+        try:
+            return self.jobs_hydrated.get_or_create(record.job_id, create);
+        except LookupError:
+            return None;
+
     def text_status_value(self, job: Optional[IBMQJob] = None) -> str:
         aspects = get_job_aspects(job=job);
         return f'''
@@ -405,16 +526,104 @@ class RecoverJobWidget():
 # AUXILIARY METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-def get_list_of_jobs(option: Optional[BACKEND | BACKEND_SIMULATOR]) -> list[IBMQJob]:
+def iterate_list_of_jobs(
+    option: Optional[BACKEND | BACKEND_SIMULATOR],
+    page_size: int = PAGE_SIZE_JOBS,
+    status: Optional[QkJobStatus] = None,
+    tags: list[str] = [],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Generator[list[JobRecord], None, None]:
+    '''
+    Iterates lazily through the jobs of a backend page by page,
+    yielding lightweight job descriptors instead of full job objects.
+
+    The jobs recorded in the job registry are listed first (without connecting to the backend).
+    Subsequent pages are requested from the backend, with the filters applied server-side.
+    Jobs already listed are skipped.
+
+    NOTE: Each of the two sources is listed most recent first,
+    so that the order is not chronological across both sources.
+
+    @inputs
+    - `option` - the backend.
+    - `page_size` - number of jobs requested from the backend per page.
+    - `status`, `tags`, `since`, `until` - (optional) filters by status, tags (all required) and creation date.
+    '''
     if not isinstance(option, BACKEND):
-        return [];
+        return;
+    seen: set[str] = set();
+
+    # jobs from the registry:
+    offset = 0;
+    while True:
+        records = job_registry.find(
+            backend = option.value,
+            queue = True,
+            status = status.name if status is not None else None,
+            tags = tags,
+            since = since,
+            until = until,
+            limit = PAGE_SIZE_RECORDS,
+            offset = offset,
+        );
+        offset += len(records);
+        seen.update(record.job_id for record in records);
+        if len(records) > 0:
+            yield records;
+        if len(records) < PAGE_SIZE_RECORDS:
+            break;
+
+    # jobs from the backend:
     with CreateBackend(option=option) as (_, backend):
         if backend is None:
-            return [];
-        try:
-            return backend.jobs(limit=LIMIT_NUM_JOBS, descending=True);
-        except:
-            return [];
+            return;
+        skip = 0;
+        while True:
+            try:
+                jobs = backend.jobs(
+                    limit = page_size,
+                    skip = skip,
+                    status = status,
+                    start_datetime = since,
+                    end_datetime = until,
+                    job_tags = tags if len(tags) > 0 else None,
+                    job_tags_operator = 'AND',
+                    descending = True,
+                );
+            except:
+                return;
+            skip += len(jobs);
+            # NOTE: only the descriptors are kept, the job objects are dropped.
+            records = [ get_job_descriptor(job, option, status=status) for job in jobs if job.job_id() not in seen ];
+            seen.update(record.job_id for record in records);
+            if len(records) > 0:
+                yield records;
+            # NOTE: a short (or empty) page is the last one.
+            if len(jobs) < page_size:
+                return;
+
+def get_job_descriptor(
+    job: IBMQJob,
+    option: BACKEND,
+    status: Optional[QkJobStatus] = None,
+) -> JobRecord:
+    '''
+    Extracts a lightweight descriptor of a job listed by a backend.
+
+    NOTE: `job.status()` would query the server for every job.
+    Hence the status is only set, if the listing was filtered by status (`status`),
+    and is otherwise left unknown until the job is selected.
+    '''
+    return JobRecord(
+        job_id = job.job_id(),
+        backend = option.value,
+        queue = True,
+        name = Result.of(lambda: job.name()).unwrap_or(None),
+        status = status.name if status is not None else None,
+        submitted = Result.of(lambda: job.creation_date()).unwrap_or(datetime.now()),
+        tags = Result.of(lambda: list(job.tags())).unwrap_or([]),
+    );
 
 @dataclass
 class JobAspects():
@@ -436,13 +645,20 @@ def get_job_aspects(
         status = get_job_status(job),
     );
 
-def get_job_id(job: Optional[IBMQJob]) -> str:
+def get_job_id(job: Optional[IBMQJob | JobRecord]) -> str:
+    if isinstance(job, JobRecord):
+        return job.job_id;
     try:
         return job.job_id();
     except:
         pass;
     return '—';
 
+def get_job_label(job: IBMQJob | JobRecord) -> str:
+    if isinstance(job, JobRecord):
+        return f'{job.job_id} ({job.submitted:%Y-%m-%d %H:%M})';
+    return get_job_id(job);
+
 def get_job_name(job: Optional[IBMQJob]) -> str:
     try:
         label = job.name() or '';
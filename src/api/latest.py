@@ -13,6 +13,9 @@ from src.thirdparty.quantum import *;
 from src.thirdparty.types import *;
 from src.thirdparty.render import *;
 
+from src.api.manager import *;
+from src.api.registry import *;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -67,11 +70,40 @@ class Latest():
         else:
             self.simulator.set_backend(option if isinstance(option, BACKEND_SIMULATOR) else None);
 
-    def set_job(self, job: Optional[IBMQJob], queue: bool):
+    def set_job(
+        self,
+        job: Optional[IBMQJob],
+        queue: bool,
+        name: Optional[str] = None,
+        tags: list[str] = [],
+    ):
+        '''
+        Notes the latest job.
+        Jobs submitted to the backend queue are recorded in the (persistent) job registry,
+        whose status is kept up to date in the background (if an event loop is running).
+
+        NOTE: simulator jobs are not recorded, as their results are not retrievable after a restart.
+        '''
         if queue:
             self.queue.set_job(job);
         else:
             self.simulator.set_job(job);
+        if job is None or not queue:
+            return;
+        backend = self.get_backend(queue);
+        try:
+            job_registry.record(
+                job = job,
+                backend = backend.value if backend is not None else None,
+                queue = queue,
+                name = name,
+                tags = tags,
+            );
+        except:
+            pass;
+        if has_running_loop():
+            job_manager.track(job, queue=True);
+        return;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.code import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.run import *;
+from src.thirdparty.types import *;
+
+from src.core.calls import *;
+from src.core.log import *;
+from src.api.registry import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'has_running_loop',
+    'job_manager',
+    'JobManager',
+    'TrackedJob',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+INTERVAL_POLL_MIN: float = 1.; # seconds
+INTERVAL_POLL_MAX: float = 60.; # seconds
+FACTOR_BACKOFF: float = 1.5;
+MAX_WORKERS_POLLING: int = 8;
+MAX_SIZE_FINISHED_JOBS: int = 256;
+
+# local usage only
+_executor_polling = ThreadPoolExecutor(max_workers=MAX_WORKERS_POLLING);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@dataclass
+class TrackedJob():
+    '''
+    A job tracked by the job manager.
+
+    - `job` - the job.
+    - `future` - resolves to the job, once the job has reached a final state.
+    - `queue` - <boolean> `true` if submitted to the backend queue (statuses are then kept in the job registry).
+    - `status` - last known status.
+    - `interval` - current polling interval (in seconds).
+    - `on_done` - callbacks, called with the job, once the job has reached a final state.
+    - `on_status` - callbacks, called with the job and its status, whenever the status changes.
+    '''
+    job: IBMQJob;
+    future: Future;
+    queue: bool = field(default=False);
+    status: Optional[QkJobStatus] = field(default=None);
+    interval: float = field(default=INTERVAL_POLL_MIN);
+    on_done: list[Callable[[IBMQJob], None]] = field(default_factory=list, repr=False);
+    on_status: list[Callable[[IBMQJob, QkJobStatus], None]] = field(default_factory=list, repr=False);
+
+class JobManager():
+    '''
+    Tracks jobs and polls their statuses concurrently (without blocking the event loop),
+    so that many outstanding jobs across backends can be awaited together.
+
+    Each job is polled with an adaptive backoff:
+    the polling interval grows by `factor` (up to `interval_max`) while the status does not change,
+    and is reset to `interval_min` upon every change of status.
+
+    Once a job has reached a final state, it is no longer tracked.
+    Only the most recently finished jobs are remembered (see `finished`),
+    so that the manager does not grow in long-running processes.
+
+    ### Example usage ###
+    ```py
+    job_manager.track(job1, on_done=lambda job: print(job.job_id()));
+    job_manager.track(job2);
+    jobs = await job_manager.wait(); # or job_manager.wait_sync() outside of an event loop
+    ```
+    '''
+    interval_min: float;
+    interval_max: float;
+    factor: float;
+    loop: Optional[AbstractEventLoop];
+    jobs: dict[str, TrackedJob];
+    finished: OrderedDict[str, IBMQJob];
+
+    def __init__(
+        self,
+        interval_min: float = INTERVAL_POLL_MIN,
+        interval_max: float = INTERVAL_POLL_MAX,
+        factor: float = FACTOR_BACKOFF,
+        loop: Optional[AbstractEventLoop] = None,
+    ):
+        self.interval_min = interval_min;
+        self.interval_max = interval_max;
+        self.factor = factor;
+        self.loop = loop;
+        self.jobs = dict();
+        self.finished = OrderedDict();
+        return;
+
+    def get_loop(self) -> AbstractEventLoop:
+        '''
+        Uses the running event loop (e.g. of the notebook kernel or of a service),
+        or else a loop of its own.
+        '''
+        if self.loop is None or self.loop.is_closed():
+            try:
+                self.loop = asyncio_get_running_loop();
+            except RuntimeError:
+                self.loop = asyncio_new_event_loop();
+                asyncio_set_event_loop(self.loop);
+        return self.loop;
+
+    def track(
+        self,
+        job: IBMQJob,
+        on_done: Optional[Callable[[IBMQJob], None]] = None,
+        on_status: Optional[Callable[[IBMQJob, QkJobStatus], None]] = None,
+        queue: bool = False,
+    ) -> Future:
+        '''
+        Starts tracking a job (if not already tracked) and registers the callbacks.
+
+        @inputs
+        - `job` - the job.
+        - `on_done` - (optional) called with the job, once the job has reached a final state
+            (immediately, if the job is known to have finished).
+        - `on_status` - (optional) called with the job and its status, whenever the status changes.
+        - `queue` - <boolean> whether the job was submitted to the backend queue.
+            Only then are the statuses recorded in the job registry.
+
+        @returns
+        a future, which resolves to the job, once the job has reached a final state.
+        '''
+        id = job.job_id();
+        loop = self.get_loop();
+        if id in self.finished:
+            future = loop.create_future();
+            future.set_result(self.finished[id]);
+            if on_done is not None:
+                call_safely(on_done, self.finished[id]);
+            return future;
+        tracked = self.jobs.get(id, None);
+        if tracked is None:
+            tracked = TrackedJob(job=job, future=loop.create_future(), queue=queue, interval=self.interval_min);
+            self.jobs[id] = tracked;
+            loop.create_task(self.poll(tracked));
+        tracked.queue = tracked.queue or queue;
+        if on_done is not None:
+            tracked.on_done.append(on_done);
+        if on_status is not None:
+            tracked.on_status.append(on_status);
+        return tracked.future;
+
+    def untrack(self, job_id: str):
+        '''
+        Stops tracking a job. Pending futures are cancelled.
+        '''
+        self.finished.pop(job_id, None);
+        tracked = self.jobs.pop(job_id, None);
+        if tracked is not None and not tracked.future.done():
+            tracked.future.cancel();
+        return;
+
+    async def wait(self, job_ids: Optional[list[str]] = None) -> list[IBMQJob]:
+        '''
+        Awaits the completion of the tracked jobs (by default all of them).
+
+        NOTE: Raises a `ValueError` for ids of jobs, which are neither tracked nor (recently) finished.
+        '''
+        ids = list(self.jobs.keys()) if job_ids is None else job_ids;
+        unknown = [ id for id in ids if id not in self.jobs and id not in self.finished ];
+        if len(unknown) > 0:
+            raise ValueError(f'The jobs {", ".join(unknown)} are not tracked!');
+        # NOTE: a finished job resolves immediately.
+        futures = [ self.jobs[id].future if id in self.jobs else self.track(self.finished[id]) for id in ids ];
+        return list(await asyncio_gather(*futures));
+
+    def wait_sync(self, job_ids: Optional[list[str]] = None) -> list[IBMQJob]:
+        '''
+        Blocks until the tracked jobs have completed.
+
+        NOTE: only to be used, if no event loop is running (e.g. in scripts).
+        '''
+        return self.get_loop().run_until_complete(self.wait(job_ids=job_ids));
+
+    async def poll(self, tracked: TrackedJob):
+        '''
+        Polls the status of a job until it reaches a final state.
+        '''
+        loop = self.get_loop();
+        job = tracked.job;
+        while not tracked.future.done():
+            try:
+                status = await get_job_status(job, loop=loop);
+            except Exception:
+                # NOTE: transient failures (e.g. network) only lead to a longer interval.
+                tracked.interval = min(tracked.interval * self.factor, self.interval_max);
+                await asyncio_sleep(tracked.interval);
+                continue;
+            if status != tracked.status:
+                tracked.status = status;
+                tracked.interval = self.interval_min;
+                if tracked.queue:
+                    try:
+                        job_registry.update_status(job.job_id(), status.name);
+                    except:
+                        pass;
+                for callback in tracked.on_status:
+                    call_safely(callback, job, status);
+            else:
+                tracked.interval = min(tracked.interval * self.factor, self.interval_max);
+            if status in QK_JOB_FINAL_STATES:
+                self.finish(tracked);
+                break;
+            await asyncio_sleep(tracked.interval);
+        return;
+
+    def finish(self, tracked: TrackedJob):
+        '''
+        Resolves a job, which has reached a final state, and stops tracking it.
+        '''
+        job = tracked.job;
+        id = job.job_id();
+        self.jobs.pop(id, None);
+        self.finished[id] = job;
+        while len(self.finished) > MAX_SIZE_FINISHED_JOBS:
+            self.finished.popitem(last=False);
+        if not tracked.future.done():
+            tracked.future.set_result(job);
+        for callback in tracked.on_done:
+            call_safely(callback, job);
+        tracked.on_done.clear();
+        return;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+job_manager: JobManager = JobManager();
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def has_running_loop() -> bool:
+    '''
+    Determines whether an event loop is running (e.g. in a notebook kernel),
+    in which case tracked jobs are polled in the background.
+    '''
+    try:
+        asyncio_get_running_loop();
+        return True;
+    except RuntimeError:
+        return False;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@to_async(executor=_executor_polling)
+def get_job_status(job: IBMQJob) -> QkJobStatus:
+    return job.status();
+
+def call_safely(callback: Callable[..., Any], *args: Any):
+    try:
+        callback(*args);
+    except Exception as err:
+        log_error(f'Callback for job failed: {err}');
+    return;
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.code import *;
+from src.thirdparty.db import *;
+from src.thirdparty.misc import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.run import *;
+from src.thirdparty.system import *;
+from src.thirdparty.types import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'job_registry',
+    'JobRecord',
+    'JobRegistry',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+PATH_JOB_REGISTRY: str = '.cache/jobs.db';
+LIMIT_NUM_RECORDS: int = 500;
+
+# local usage only
+_SEPARATOR_TAGS: str = '\x1f';
+_SCHEMA_REGISTRY: list[str] = [
+    '''
+    CREATE TABLE IF NOT EXISTS jobs (
+        job_id    TEXT PRIMARY KEY,
+        backend   TEXT,
+        queue     INTEGER NOT NULL,
+        name      TEXT,
+        status    TEXT,
+        submitted TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS job_tags (
+        tag    TEXT NOT NULL,
+        job_id TEXT NOT NULL REFERENCES jobs(job_id) ON DELETE CASCADE,
+        PRIMARY KEY (tag, job_id)
+    ) WITHOUT ROWID
+    ''',
+    'CREATE INDEX IF NOT EXISTS index_jobs_backend ON jobs(backend, submitted)',
+    'CREATE INDEX IF NOT EXISTS index_jobs_status ON jobs(status, submitted)',
+    'CREATE INDEX IF NOT EXISTS index_jobs_submitted ON jobs(submitted)',
+    'CREATE INDEX IF NOT EXISTS index_job_tags_job ON job_tags(job_id)',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@dataclass
+class JobRecord():
+    '''
+    Entry of the job registry.
+
+    - `job_id` - id of the job.
+    - `backend` - name of the backend, to which the job was submitted.
+    - `queue` - <boolean> `true` if submitted to the backend queue, `false` if to a simulator.
+    - `name` - label of the job.
+    - `status` - last known status of the job (name of the `JobStatus` value).
+    - `submitted` - time of submission.
+    - `tags` - tags of the job.
+    '''
+    job_id: str = field(default='');
+    backend: Optional[str] = field(default=None);
+    queue: bool = field(default=False);
+    name: Optional[str] = field(default=None);
+    status: Optional[str] = field(default=None);
+    submitted: datetime = field(default_factory=datetime.now);
+    tags: list[str] = field(default_factory=list);
+
+class JobRegistry():
+    '''
+    Persistent registry of the jobs submitted via the demos to the backend queue (sqlite).
+    Provides filtered lookups by backend, status, submission time and tags,
+    which do not require any connection to the backends.
+    '''
+    path: str;
+    connection: Optional[Connection];
+    lock: Lock;
+
+    def __init__(self, path: str = PATH_JOB_REGISTRY):
+        self.path = path;
+        self.connection = None;
+        self.lock = Lock();
+        return;
+
+    def connect(self) -> Connection:
+        '''
+        Opens the database (once) and creates the tables/indexes if necessary.
+        '''
+        if self.connection is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True);
+            connection = connect(self.path, check_same_thread=False);
+            connection.execute('PRAGMA foreign_keys = ON');
+            connection.execute('PRAGMA journal_mode = WAL');
+            with connection:
+                for statement in _SCHEMA_REGISTRY:
+                    connection.execute(statement);
+            self.connection = connection;
+        return self.connection;
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close();
+                self.connection = None;
+        return;
+
+    def record(
+        self,
+        job: IBMQJob,
+        backend: Optional[str],
+        queue: bool,
+        name: Optional[str] = None,
+        tags: list[str] = [],
+        status: Optional[str] = QkJobStatus.QUEUED.name,
+    ) -> JobRecord:
+        '''
+        Adds a submitted job to the registry (or replaces its entry).
+
+        NOTE: The status is not queried (to avoid a network call upon submission).
+        It is updated later, e.g. by the job manager.
+        '''
+        record = JobRecord(
+            job_id = job.job_id(),
+            backend = backend,
+            queue = queue,
+            name = name,
+            status = status,
+            submitted = datetime.now(),
+            tags = list(dict.fromkeys(tags)),
+        );
+        with self.lock:
+            connection = self.connect();
+            with connection:
+                connection.execute('DELETE FROM job_tags WHERE job_id = ?', (record.job_id,));
+                connection.execute(
+                    'INSERT OR REPLACE INTO jobs (job_id, backend, queue, name, status, submitted) VALUES (?, ?, ?, ?, ?, ?)',
+                    (record.job_id, record.backend, int(record.queue), record.name, record.status, record.submitted.isoformat()),
+                );
+                connection.executemany(
+                    'INSERT INTO job_tags (tag, job_id) VALUES (?, ?)',
+                    [ (tag, record.job_id) for tag in record.tags ],
+                );
+        return record;
+
+    def update_status(self, job_id: str, status: str):
+        with self.lock:
+            connection = self.connect();
+            with connection:
+                connection.execute('UPDATE jobs SET status = ? WHERE job_id = ?', (status, job_id));
+        return;
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        records = self.find(job_id=job_id, limit=1);
+        return records[0] if len(records) > 0 else None;
+
+    def find(
+        self,
+        job_id: Optional[str] = None,
+        backend: Optional[str] = None,
+        queue: Optional[bool] = None,
+        status: Optional[str] = None,
+        tags: list[str] = [],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = LIMIT_NUM_RECORDS,
+        offset: int = 0,
+    ) -> list[JobRecord]:
+        '''
+        Looks up jobs in the registry, most recently submitted first.
+
+        @inputs
+        - `job_id`, `backend`, `queue`, `status` - (optional) exact values to filter by.
+        - `tags` - jobs must carry all of these tags.
+        - `since`, `until` - (optional) bounds on the time of submission.
+        - `limit`, `offset` - for pagination.
+        '''
+        conditions = [];
+        values = [];
+        for column, value in [ ('job_id', job_id), ('backend', backend), ('status', status) ]:
+            if value is not None:
+                conditions.append(f'jobs.{column} = ?');
+                values.append(value);
+        if queue is not None:
+            conditions.append('jobs.queue = ?');
+            values.append(int(queue));
+        if since is not None:
+            conditions.append('jobs.submitted >= ?');
+            values.append(since.isoformat());
+        if until is not None:
+            conditions.append('jobs.submitted <= ?');
+            values.append(until.isoformat());
+        tags = list(dict.fromkeys(tags));
+        if len(tags) > 0:
+            conditions.append(dedent(
+                f'''
+                jobs.job_id IN (
+                    SELECT job_id FROM job_tags
+                    WHERE tag IN ({', '.join('?' * len(tags))})
+                    GROUP BY job_id
+                    HAVING COUNT(*) = ?
+                )
+                '''
+            ));
+            values += tags + [ len(tags) ];
+        query = dedent(
+            f'''
+            SELECT jobs.job_id, jobs.backend, jobs.queue, jobs.name, jobs.status, jobs.submitted,
+                (SELECT GROUP_CONCAT(tag, ?) FROM job_tags WHERE job_tags.job_id = jobs.job_id)
+            FROM jobs
+            {'WHERE ' + ' AND '.join(conditions) if len(conditions) > 0 else ''}
+            ORDER BY jobs.submitted DESC
+            LIMIT ? OFFSET ?
+            '''
+        );
+        with self.lock:
+            connection = self.connect();
+            rows = connection.execute(query, [ _SEPARATOR_TAGS ] + values + [ limit, offset ]).fetchall();
+        return [
+            JobRecord(
+                job_id = job_id_,
+                backend = backend_,
+                queue = bool(queue_),
+                name = name_,
+                status = status_,
+                submitted = datetime.fromisoformat(submitted_),
+                tags = tags_.split(_SEPARATOR_TAGS) if tags_ else [],
+            )
+            for job_id_, backend_, queue_, name_, status_, submitted_, tags_ in rows
+        ];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+job_registry: JobRegistry = JobRegistry();
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.code import *;
+from src.thirdparty.config import *;
+from src.thirdparty.maths import *;
+from src.thirdparty.misc import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.system import *;
+from src.thirdparty.types import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'CachedJob',
+    'get_job_result',
+    'result_store',
+    'ResultStore',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+PATH_RESULT_STORE: str = '.cache/results';
+MAX_SIZE_RESULT_STORE: int = 256 * 1024**2; # bytes
+
+# local usage only
+_SUFFIX_RESULT: str = '.json.z';
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class - stored jobs
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class CachedJob():
+    '''
+    Stand-in for a completed IBMQ job, whose result was recovered from the result store.
+    Provides the methods of `IBMQJob`, which are used by the actions and widgets.
+    '''
+    id: str;
+    label: Optional[str];
+    labels: list[str];
+    backend_name: Optional[str];
+    payload: QkResult;
+
+    def __init__(
+        self,
+        id: str,
+        result: QkResult,
+        label: Optional[str] = None,
+        labels: list[str] = [],
+        backend_name: Optional[str] = None,
+    ):
+        self.id = id;
+        self.payload = result;
+        self.label = label;
+        self.labels = list(labels);
+        self.backend_name = backend_name;
+        return;
+
+    def job_id(self) -> str:
+        return self.id;
+
+    def name(self) -> Optional[str]:
+        return self.label;
+
+    def tags(self) -> list[str]:
+        return self.labels;
+
+    def status(self) -> QkJobStatus:
+        return QkJobStatus.DONE;
+
+    def done(self) -> bool:
+        return True;
+
+    def wait_for_final_state(self, *_, **__):
+        return;
+
+    def result(self, *_, **__) -> QkResult:
+        return self.payload;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class - result store
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class ResultStore():
+    '''
+    Local store of the results of completed jobs.
+    Each result is kept as zlib-compressed JSON in a file named by the hash of the job id.
+    Once the total size exceeds `maxsize` bytes, the least recently used files are evicted.
+
+    NOTE: results of completed jobs are immutable, so entries never need to be invalidated.
+    '''
+    path: Path;
+    maxsize: int;
+
+    def __init__(self, path: str = PATH_RESULT_STORE, maxsize: int = MAX_SIZE_RESULT_STORE):
+        self.path = Path(path);
+        self.maxsize = maxsize;
+        return;
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.file(job_id).exists();
+
+    def file(self, job_id: str) -> Path:
+        return self.path / (sha256(job_id.encode('utf-8')).hexdigest() + _SUFFIX_RESULT);
+
+    def get(self, job_id: str) -> Optional[CachedJob]:
+        '''
+        Recovers a job from the store, if present.
+        '''
+        path = self.file(job_id);
+        try:
+            contents = json.loads(zlib.decompress(path.read_bytes()), object_hook=decode_value);
+            # mark as recently used:
+            os.utime(path);
+            return CachedJob(
+                id = job_id,
+                result = QkResult.from_dict(contents['result']),
+                label = contents.get('name', None),
+                labels = contents.get('tags', []),
+                backend_name = contents.get('backend', None),
+            );
+        except:
+            return None;
+
+    def put(self, job: IBMQJob, result: QkResult):
+        '''
+        Stores the result of a completed job and evicts old entries if necessary.
+
+        NOTE: Raises a `TypeError` if the result contains values, which cannot be serialised.
+        '''
+        contents = dict(
+            job_id = job.job_id(),
+            name = Result.of(lambda: job.name()).unwrap_or(None),
+            tags = Result.of(lambda: list(job.tags())).unwrap_or([]),
+            backend = Result.of(lambda: job.backend().name()).unwrap_or(None),
+            result = result.to_dict(),
+        );
+        data = zlib.compress(json.dumps(contents, default=encode_value).encode('utf-8'));
+        self.path.mkdir(parents=True, exist_ok=True);
+        path = self.file(job.job_id());
+        # NOTE: write to a temporary file first, so that readers never see partial files.
+        path_tmp = path.with_suffix('.tmp');
+        path_tmp.write_bytes(data);
+        os.replace(path_tmp, path);
+        self.evict();
+        return;
+
+    def evict(self):
+        '''
+        Removes the least recently used entries, until the total size is within the bound.
+        '''
+        entries = [];
+        for path in self.path.glob(f'*{_SUFFIX_RESULT}'):
+            try:
+                stat = path.stat();
+                entries.append((stat.st_mtime, stat.st_size, path));
+            except:
+                pass;
+        total = sum(size for _, size, _ in entries);
+        for _, size, path in sorted(entries, key=itemgetter(0)):
+            if total <= self.maxsize:
+                break;
+            try:
+                path.unlink();
+                total -= size;
+            except:
+                pass;
+        return;
+
+    def clear(self):
+        for path in self.path.glob(f'*{_SUFFIX_RESULT}'):
+            path.unlink(missing_ok=True);
+        return;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+result_store: ResultStore = ResultStore();
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def get_job_result(job: IBMQJob | CachedJob) -> QkResult:
+    '''
+    Obtains the result of a job.
+    Results of completed jobs from the IBM backends are read from/written to the result store,
+    so that revisiting a job does not download its result again.
+
+    NOTE: results of simulator jobs are held in memory anyway and are not stored.
+    '''
+    if not isinstance(job, IBMQJob):
+        return job.result();
+    stored = result_store.get(job.job_id());
+    if stored is not None:
+        return stored.result();
+    result = job.result();
+    # NOTE: use the state of the result (rather than querying the status of the job again).
+    if result.success:
+        try:
+            result_store.put(job, result);
+        except:
+            # e.g. values, which cannot be serialised (see `encode_value`), are not stored.
+            pass;
+    return result;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def encode_value(value: Any) -> Any:
+    '''
+    Converts values, which `json` cannot serialise, in the dictionary form of results.
+
+    NOTE: Raises a `TypeError` for any other values, as these could not be restored faithfully.
+    '''
+    if isinstance(value, (complex, np.complexfloating)):
+        return { '__complex__': [ float(value.real), float(value.imag) ] };
+    if isinstance(value, np.ndarray):
+        return value.tolist();
+    if isinstance(value, np.generic):
+        return value.item();
+    if isinstance(value, datetime):
+        return value.isoformat();
+    if isinstance(value, Enum):
+        # e.g. measurement levels
+        return value.value;
+    if hasattr(value, 'data') and isinstance(value.data, np.ndarray):
+        # e.g. statevectors, density matrices
+        return value.data.tolist();
+    raise TypeError(f'Values of type {type(value).__name__} cannot be stored!');
+
+def decode_value(value: dict) -> Any:
+    if '__complex__' in value:
+        x, y = value['__complex__'];
+        return complex(x, y);
+    return value;
@@ -9,6 +9,7 @@ from __future__ import annotations;
 
 from src.thirdparty.code import *;
 from src.thirdparty.config import *;
+from src.thirdparty.maths import *;
 from src.thirdparty.misc import *;
 from src.thirdparty.quantum import *;
 from src.thirdparty.system import *;
@@ -21,9 +22,376 @@ from src.core.utils import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'Counts',
+    'CountsMatrix',
     'get_counts',
+    'iterate_counts_per_experiment',
+    'PaddedCounts',
 ];
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+LIMIT_BITS_VECTORISED_COUNTS: int = 64;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class Counts():
+    '''
+    Compact storage of measurement counts.
+
+    - `outcomes` - <uint64> sorted array of the distinct measured outcomes,
+        where bit `i` is the value of classical bit `i`.
+    - `values`   - <int64> array of the counts of the outcomes.
+    - `num_bits` - number of classical bits.
+
+    NOTE: Bitstrings are only formed upon conversion via `to_dict`,
+    whose keys satisfy `key[i]` = value of classical bit `i`.
+    '''
+    __slots__ = ('outcomes', 'values', 'num_bits');
+
+    outcomes: NDArray[Shape['*'], UInt64];
+    values: NDArray[Shape['*'], Int64];
+    num_bits: int;
+
+    def __init__(
+        self,
+        outcomes: NDArray[Shape['*'], UInt64],
+        values: NDArray[Shape['*'], Int64],
+        num_bits: int,
+    ):
+        if num_bits > LIMIT_BITS_VECTORISED_COUNTS:
+            raise ValueError(f'Counts are limited to {LIMIT_BITS_VECTORISED_COUNTS} bits (got {num_bits})!');
+        outcomes = np.asarray(outcomes, dtype=np.uint64);
+        values = np.asarray(values, dtype=np.int64);
+        # aggregate repeated outcomes and sort:
+        self.outcomes, inverse = np.unique(outcomes, return_inverse=True);
+        self.values = np.bincount(inverse.ravel(), weights=values, minlength=len(self.outcomes)).astype(np.int64);
+        self.num_bits = num_bits;
+        return;
+
+    @staticmethod
+    def from_dict(counts: dict[str, int], reverse: bool = True) -> Counts:
+        '''
+        Builds counts from a dictionary of bitstrings.
+
+        @inputs
+        - `counts` - <dict> bitstrings and their counts. Whitespace in the keys is ignored.
+        - `reverse` - <boolean> if `true` (default) the keys are in the order of qiskit,
+            i.e. the last character is classical bit `0`.
+            Otherwise `key[i]` is the value of classical bit `i`.
+        '''
+        outcomes, num_bits = parse_keys(list(counts.keys()), reverse=reverse);
+        values = np.asarray(list(counts.values()), dtype=np.int64);
+        return Counts(outcomes=outcomes, values=values, num_bits=num_bits);
+
+    @staticmethod
+    def from_result(result: QkResult) -> Counts:
+        '''
+        Builds counts from the result of a job.
+        The counts of all experiments are merged.
+        '''
+        counts_raw = result.get_counts();
+        if not isinstance(counts_raw, list):
+            counts_raw = [ counts_raw ];
+        # NOTE: aggregate all experiments at once (rather than merging pairwise).
+        keys = [ key for counts_experiment in counts_raw for key in counts_experiment.keys() ];
+        outcomes, num_bits = parse_keys(keys, reverse=True);
+        values = np.asarray([ value for counts_experiment in counts_raw for value in counts_experiment.values() ], dtype=np.int64);
+        return Counts(outcomes=outcomes, values=values, num_bits=num_bits);
+
+    def __len__(self) -> int:
+        return len(self.outcomes);
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Counts):
+            return False;
+        return self.num_bits == other.num_bits \
+            and np.array_equal(self.outcomes, other.outcomes) \
+            and np.array_equal(self.values, other.values);
+
+    def __repr__(self) -> str:
+        return f'Counts(bits={self.num_bits}, outcomes={len(self)}, total={self.total})';
+
+    @property
+    def total(self) -> int:
+        return int(self.values.sum());
+
+    def to_bits(self) -> NDArray[Shape['*, *'], Bool]:
+        '''
+        Returns the outcomes as a <bool> array of shape `(#outcomes, num_bits)`,
+        where column `i` contains the values of classical bit `i`.
+        '''
+        shifts = np.arange(self.num_bits, dtype=np.uint64);
+        return ((self.outcomes[:, np.newaxis] >> shifts) & np.uint64(1)).astype(bool);
+
+    def to_dict(self, pad: bool = False) -> dict[str, int]:
+        '''
+        Converts the counts to a dictionary with keys ordered lexicographically,
+        where `key[i]` is the value of classical bit `i`.
+
+        @inputs
+        - `pad` - <boolean> if `true`, all `2^num_bits` keys are included (with 0 if not measured).
+
+        NOTE: Padding materialises all `2^num_bits` keys.
+        Use `to_padded` for a lazy view instead.
+        '''
+        n = self.num_bits;
+        # NOTE: bit 0 becomes the most significant bit, so that the outcomes are in lexicographic order of the keys.
+        marginal = self.marginalise(list(range(n))[::-1]);
+        if pad:
+            totals = np.zeros(shape=(2**n,), dtype=np.int64);
+            totals[marginal.outcomes.astype(np.int64)] = marginal.values;
+            return dict(zip(binary_sequences(n), totals.tolist()));
+        fmt = f'0{n}b';
+        return {
+            (format(outcome, fmt) if n > 0 else ''): value
+            for outcome, value in zip(marginal.outcomes.tolist(), marginal.values.tolist())
+        };
+
+    def to_padded(self) -> PaddedCounts:
+        '''
+        Returns a lazy view of the counts, which includes all `2^num_bits` keys
+        (with 0 if not measured). See `PaddedCounts`.
+        '''
+        n = self.num_bits;
+        marginal = self.marginalise(list(range(n))[::-1]);
+        return PaddedCounts(index=marginal.outcomes, values=marginal.values, num_bits=n);
+
+    def to_dense(self) -> NDArray[Shape['*'], Int64]:
+        '''
+        Returns the counts as a dense array of length `2^num_bits`,
+        indexed by the outcomes (bit `i` = classical bit `i`).
+        '''
+        totals = np.zeros(shape=(2**self.num_bits,), dtype=np.int64);
+        totals[self.outcomes.astype(np.int64)] = self.values;
+        return totals;
+
+    def marginalise(self, C: list[int]) -> Counts:
+        '''
+        Returns the marginal counts for the classical bits `C`,
+        where bit `j` of the new outcomes is the value of classical bit `C[j]`.
+        '''
+        outcomes = np.zeros(shape=self.outcomes.shape, dtype=np.uint64);
+        for j, c in enumerate(C):
+            outcomes |= ((self.outcomes >> np.uint64(c)) & np.uint64(1)) << np.uint64(j);
+        return Counts(outcomes=outcomes, values=self.values, num_bits=len(C));
+
+    def reorder_bits(self, order: list[int]) -> Counts:
+        '''
+        Permutes the classical bits, such that new bit `j` is old bit `order[j]`.
+        '''
+        assert sorted(order) == list(range(self.num_bits)), 'The order must be a permutation of the bits!';
+        return self.marginalise(order);
+
+    def merge(self, other: Counts) -> Counts:
+        '''
+        Returns the sum of two counts.
+        '''
+        return Counts(
+            outcomes = np.concatenate([ self.outcomes, other.outcomes ]),
+            values = np.concatenate([ self.values, other.values ]),
+            num_bits = max(self.num_bits, other.num_bits),
+        );
+
+    def top_k(self, k: int) -> list[tuple[int, int]]:
+        '''
+        Returns the `k` most frequent outcomes (as integers) with their counts,
+        in descending order of counts (ties broken by outcome).
+        '''
+        order = np.lexsort((self.outcomes, -self.values))[:k];
+        return list(zip(self.outcomes[order].tolist(), self.values[order].tolist()));
+
+class PaddedCounts(Mapping):
+    '''
+    Lazy read-only view of counts, which includes all `2^n` keys of length `n`.
+    Missing outcomes are reported as `0`, without materialising the keys.
+
+    - `index`    - <uint64> sorted array of the measured outcomes,
+        where the key of index `k` is `format(k, '0nb')`
+        (i.e. the order of the indexes is the lexicographic order of the keys).
+    - `values`   - <int64> array of the counts of the measured outcomes.
+    - `num_bits` - the length `n` of the keys.
+
+    NOTE: Iteration yields the keys in lexicographic order on demand.
+    Use `nonzero` for the measured keys only or `to_dense` for an explicit dense array.
+    '''
+    __slots__ = ('index', 'values', 'num_bits');
+
+    index: NDArray[Shape['*'], UInt64];
+    values: NDArray[Shape['*'], Int64];
+    num_bits: int;
+
+    def __init__(
+        self,
+        index: NDArray[Shape['*'], UInt64],
+        values: NDArray[Shape['*'], Int64],
+        num_bits: int,
+    ):
+        self.index = np.asarray(index, dtype=np.uint64);
+        self.values = np.asarray(values, dtype=np.int64);
+        self.num_bits = num_bits;
+        return;
+
+    def __len__(self) -> int:
+        return 2**self.num_bits;
+
+    def __iter__(self) -> Generator[str, None, None]:
+        n = self.num_bits;
+        if n == 0:
+            yield '';
+            return;
+        fmt = f'0{n}b';
+        for k in range(2**n):
+            yield format(k, fmt);
+        return;
+
+    def __contains__(self, key: Any) -> bool:
+        return isinstance(key, str) \
+            and len(key) == self.num_bits \
+            and set(key) <= { '0', '1' };
+
+    def __getitem__(self, key: str) -> int:
+        if key not in self:
+            raise KeyError(key);
+        k = np.uint64(int(key or '0', 2));
+        pos = int(np.searchsorted(self.index, k));
+        if pos < len(self.index) and self.index[pos] == k:
+            return int(self.values[pos]);
+        return 0;
+
+    def __repr__(self) -> str:
+        return f'PaddedCounts(bits={self.num_bits}, nonzero={len(self.index)})';
+
+    def nonzero(self) -> dict[str, int]:
+        '''
+        Returns the measured keys (in lexicographic order) and their counts.
+        '''
+        n = self.num_bits;
+        fmt = f'0{n}b';
+        return {
+            (format(k, fmt) if n > 0 else ''): value
+            for k, value in zip(self.index.tolist(), self.values.tolist())
+        };
+
+    def to_dense(self) -> NDArray[Shape['*'], Int64]:
+        '''
+        Returns the counts of all keys in lexicographic order as a dense array of length `2^n`.
+        '''
+        totals = np.zeros(shape=(2**self.num_bits,), dtype=np.int64);
+        totals[self.index.astype(np.int64)] = self.values;
+        return totals;
+
+class CountsMatrix():
+    '''
+    Counts of the experiments of a (multi-circuit) job, kept separately.
+
+    - `outcomes` - <uint64> sorted array of all distinct outcomes across the experiments,
+        where bit `i` is the value of classical bit `i`.
+    - `matrix`   - <int64> array of shape `(#experiments, #outcomes)`;
+        entry `(e, k)` is the count of outcome `outcomes[k]` in experiment `e`.
+    - `num_bits` - number of classical bits.
+    '''
+    __slots__ = ('outcomes', 'matrix', 'num_bits');
+
+    outcomes: NDArray[Shape['*'], UInt64];
+    matrix: NDArray[Shape['*, *'], Int64];
+    num_bits: int;
+
+    def __init__(
+        self,
+        outcomes: NDArray[Shape['*'], UInt64],
+        matrix: NDArray[Shape['*, *'], Int64],
+        num_bits: int,
+    ):
+        self.outcomes = np.asarray(outcomes, dtype=np.uint64);
+        self.matrix = np.asarray(matrix, dtype=np.int64);
+        self.num_bits = num_bits;
+        return;
+
+    @staticmethod
+    def from_result(result: QkResult) -> CountsMatrix:
+        '''
+        Builds the count matrix from the result of a job in a single pass.
+        '''
+        counts_raw = result.get_counts();
+        if not isinstance(counts_raw, list):
+            counts_raw = [ counts_raw ];
+        experiments = [];
+        outcomes = [];
+        values = [];
+        num_bits = 0;
+        for e, counts_experiment in enumerate(counts_raw):
+            for key, value in counts_experiment.items():
+                key = ''.join(key.split());
+                num_bits = max(num_bits, len(key));
+                experiments.append(e);
+                outcomes.append(int(key or '0', 2));
+                values.append(value);
+        if num_bits > LIMIT_BITS_VECTORISED_COUNTS:
+            raise ValueError(f'Counts are limited to {LIMIT_BITS_VECTORISED_COUNTS} bits (got {num_bits})!');
+        outcomes_unique, inverse = np.unique(np.asarray(outcomes, dtype=np.uint64), return_inverse=True);
+        E, K = len(counts_raw), len(outcomes_unique);
+        flat = np.asarray(experiments, dtype=np.int64) * K + inverse.ravel();
+        matrix = np.bincount(flat, weights=np.asarray(values, dtype=np.int64), minlength=E*K).astype(np.int64);
+        return CountsMatrix(outcomes=outcomes_unique, matrix=matrix.reshape((E, K)), num_bits=num_bits);
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0];
+
+    def __getitem__(self, e: int) -> Counts:
+        '''
+        Returns the counts of experiment `e`.
+        '''
+        row = self.matrix[e];
+        support = row > 0;
+        return Counts(outcomes=self.outcomes[support], values=row[support], num_bits=self.num_bits);
+
+    def __repr__(self) -> str:
+        return f'CountsMatrix(bits={self.num_bits}, experiments={len(self)}, outcomes={len(self.outcomes)})';
+
+    @property
+    def totals(self) -> NDArray[Shape['*'], Int64]:
+        '''
+        Returns the number of shots of each experiment.
+        '''
+        return self.matrix.sum(axis=1);
+
+    def merged(self) -> Counts:
+        '''
+        Returns the counts summed over all experiments.
+        '''
+        return Counts(outcomes=self.outcomes, values=self.matrix.sum(axis=0), num_bits=self.num_bits);
+
+    def marginalise(self, C: list[int]) -> CountsMatrix:
+        '''
+        Returns the marginal count matrix for the classical bits `C`,
+        where bit `j` of the new outcomes is the value of classical bit `C[j]`.
+        '''
+        outcomes = np.zeros(shape=self.outcomes.shape, dtype=np.uint64);
+        for j, c in enumerate(C):
+            outcomes |= ((self.outcomes >> np.uint64(c)) & np.uint64(1)) << np.uint64(j);
+        outcomes_unique, inverse = np.unique(outcomes, return_inverse=True);
+        matrix = np.zeros(shape=(len(self), len(outcomes_unique)), dtype=np.int64);
+        np.add.at(matrix, (slice(None), inverse.ravel()), self.matrix);
+        return CountsMatrix(outcomes=outcomes_unique, matrix=matrix, num_bits=len(C));
+
+    def success_rates(self, C: list[int], value: str) -> NDArray[Shape['*'], Float64]:
+        '''
+        Computes for each experiment the proportion of shots,
+        in which the classical bits `C` were measured as `value`
+        (`value[j]` = expected value of classical bit `C[j]`).
+        '''
+        mask = np.uint64(sum(1 << c for c in C));
+        target = np.uint64(sum(1 << c for c, x in zip(C, value) if x == '1'));
+        success = (self.outcomes & mask) == target;
+        totals = self.totals;
+        hits = self.matrix[:, success].sum(axis=1);
+        return np.divide(hits, totals, out=np.zeros(shape=hits.shape, dtype=float), where=totals > 0);
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -32,30 +400,93 @@ def get_counts(
     result: QkResult,
     *bits: list[int],
     pad: bool = False,
+) -> tuple[
+    int,
+    dict[str, int] | PaddedCounts,
+    list[PaddedCounts],
+]:
+    '''
+    Returns statistics of job results.
+
+    @inputs
+    - `result` - the result of a job.
+    - `bits` - lists `C` of (indexes of) classical bits, for which marginal counts are to be computed.
+    - `pad` - <boolean> if `true`, all possible keys are included in the counts (with 0 if not measured).
+
+    @returns
+    - the total number of measurements;
+    - the counts, where `key[i]` is the value of classical bit `i`;
+    - for each `C` the marginal counts, where `key[j]` is the value of classical bit `C[j]`.
+
+    NOTE: This is a wrapper around `Counts`, which should be used directly
+    to avoid forming bitstrings.
+    Padded counts and marginals are lazy views (see `PaddedCounts`),
+    which report 0 for missing keys. Use `dict(...)` to materialise these,
+    e.g. for plotting.
+    '''
+    try:
+        counts = Counts.from_result(result);
+    except (ValueError, OverflowError):
+        return get_counts_from_strings(result, *bits, pad=pad);
+    statistic = [ counts.marginalise(C).to_padded() for C in bits ];
+    return counts.total, counts.to_padded() if pad else counts.to_dict(), statistic;
+
+def iterate_counts_per_experiment(result: QkResult) -> Generator[Counts, None, None]:
+    '''
+    Yields the counts of the experiments of a (multi-circuit) job one by one.
+    '''
+    counts_raw = result.get_counts();
+    if not isinstance(counts_raw, list):
+        counts_raw = [ counts_raw ];
+    for counts_experiment in counts_raw:
+        yield Counts.from_dict(counts_experiment);
+    return;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def parse_keys(keys: list[str], reverse: bool = True) -> tuple[NDArray[Shape['*'], UInt64], int]:
+    '''
+    Converts bitstrings to integer outcomes (see `Counts.from_dict`).
+
+    @returns
+    - the outcomes, where bit `i` is the value of classical bit `i`;
+    - the number of classical bits.
+
+    NOTE: Raises a `ValueError` if the keys do not fit into 64-bit integers
+    (checked before conversion, as numpy cannot hold larger integers).
+    '''
+    keys = [ ''.join(key.split()) for key in keys ];
+    num_bits = max([ len(key) for key in keys ], default=0);
+    if num_bits > LIMIT_BITS_VECTORISED_COUNTS:
+        raise ValueError(f'Counts are limited to {LIMIT_BITS_VECTORISED_COUNTS} bits (got {num_bits})!');
+    if not reverse:
+        keys = [ key[::-1] for key in keys ];
+    outcomes = np.asarray([ int(key or '0', 2) for key in keys ], dtype=np.uint64);
+    return outcomes, num_bits;
+
+def get_counts_from_strings(
+    result: QkResult,
+    *bits: list[int],
+    pad: bool = False,
 ) -> tuple[
     int,
     dict[str, int],
     list[dict[str, int]],
 ]:
     '''
-    Returns statistics of job results.
+    Fallback of `get_counts` for keys which do not fit into 64-bit integers.
     '''
     counts_raw = result.get_counts();
-    counts: dict[str, int] = {};
-    if isinstance(counts_raw, list):
-        if len(counts_raw) > 0:
-            keys = counts_raw[0].keys();
-            counts = {
-                key: sum([count.get(key, 0) for count in counts_raw])
-                for key in keys
-            };
-    else:
-        counts = counts_raw;
+    if not isinstance(counts_raw, list):
+        counts_raw = [ counts_raw ];
     # NOTE: Qiskit places spaces in key to signify different blocks of registered cbits. Remove these here:
-    counts = {
-        re.sub(pattern=r'\s+', repl='', string=key): value
-        for key, value in counts.items()
-    };
+    counts: dict[str, int] = {};
+    for counts_experiment in counts_raw:
+        for key, value in counts_experiment.items():
+            key = ''.join(key.split());
+            counts[key] = counts.get(key, 0) + value;
     # NOTE: qiskit orders the measured bits from buttom to top, so reverse this.
     if pad:
         n = get_key_length(counts);
@@ -77,10 +508,6 @@ def get_counts(
     ];
     return tot, counts, statistic;
 
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# AUXILIARY METHODS
-# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-
 def get_key_length(X: dict[str, Any]):
     for key in X.keys():
         return len(key);
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.code import *;
+from src.thirdparty.types import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'CacheStatistics',
+    'LruCache',
+    'cached_gate',
+    'gate_cache',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+MAX_SIZE_GATE_CACHE: int = 4096;
+
+# local usage only
+T = TypeVar('T');
+ARGS = ParamSpec('ARGS');
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@dataclass
+class CacheStatistics():
+    hits: int = field(default=0);
+    misses: int = field(default=0);
+    size: int = field(default=0);
+    maxsize: int = field(default=0);
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses;
+        return self.hits / total if total > 0 else 0.;
+
+class LruCache(Generic[T]):
+    '''
+    A bounded cache, which evicts the least recently used entry once full.
+    Keeps track of hits and misses.
+    '''
+    maxsize: int;
+    hits: int;
+    misses: int;
+    entries: OrderedDict[Any, T];
+
+    def __init__(self, maxsize: int = MAX_SIZE_GATE_CACHE):
+        self.maxsize = maxsize;
+        self.entries = OrderedDict();
+        self.clear();
+        return;
+
+    def __len__(self) -> int:
+        return len(self.entries);
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.entries;
+
+    def get_or_create(self, key: Any, create: Callable[[], T]) -> T:
+        '''
+        Returns the cached value for `key`,
+        or else creates, stores and returns a new value.
+        '''
+        if key in self.entries:
+            self.hits += 1;
+            self.entries.move_to_end(key);
+            return self.entries[key];
+        self.misses += 1;
+        value = create();
+        self.entries[key] = value;
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False);
+        return value;
+
+    def clear(self):
+        self.entries.clear();
+        self.hits = 0;
+        self.misses = 0;
+        return;
+
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits = self.hits,
+            misses = self.misses,
+            size = len(self.entries),
+            maxsize = self.maxsize,
+        );
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# LOCAL VARIABLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+gate_cache: LruCache = LruCache(maxsize=MAX_SIZE_GATE_CACHE);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# DECORATOR - memoises gate builders
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def cached_gate(cache: Optional[LruCache] = None):
+    '''
+    Creates a decorator for a gate builder, which memoises the gates
+    keyed by the builder and its (hashable, structural) arguments.
+
+    NOTE: The same gate object is returned for repeated calls.
+    The gates are shared definitions and must not be modified by the caller.
+
+    ### Example usage ###
+    ```py
+    @cached_gate()
+    def entangle_pair() -> QkGate:
+        ...
+
+    assert entangle_pair() is entangle_pair();
+    print(gate_cache.statistics());
+    ```
+    '''
+    def dec(builder: Callable[ARGS, T]) -> Callable[ARGS, T]:
+        @wraps(builder)
+        def wrapped_builder(*_: ARGS.args, **__: ARGS.kwargs) -> T:
+            key = (builder.__module__, builder.__qualname__, _, tuple(sorted(__.items())));
+            return (cache if cache is not None else gate_cache).get_or_create(key, lambda: builder(*_, **__));
+        return wrapped_builder;
+    return dec;
@@ -42,12 +42,17 @@ def flatten(X: list[list[Any]]) -> list[Any]:
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 def binary_sequences(n: int, reversed: bool = False) -> list[str]:
-    seq = itertools_product(*([[0,1]]*n));
-    words = [ ''.join([str(x) for x in c]) for c in seq ];
+    '''
+    Returns all binary words of length `n` in lexicographic order
+    (or in lexicographic order of the reversed words if `reversed=True`).
+    '''
+    if n <= 0:
+        return [ '' ];
+    fmt = f'0{n}b';
     if reversed:
-        return sorted(words, key=lambda x: x[::-1]);
+        return [ format(k, fmt)[::-1] for k in range(2**n) ];
     else:
-        return sorted(words);
+        return [ format(k, fmt) for k in range(2**n) ];
 
 def basis_state_from_string(word: str, reversed: bool = False) -> list[int]:
     if reversed:
@@ -40,16 +40,17 @@ def action_prepare_circuit_and_job(
     - `n` - <integer> size of input space for function (should be even).
     - `num_shots` - number of shots of the job prepared.
     '''
-    @connect_to_backend(option=option, n=n+1)
+    # create circuit (before connecting, so that the simulator can be chosen based upon the circuit):
+    circuit = deutsch_jozsa_algorithm(n=n, verbose=True);
+
+    @connect_to_backend(option=option, n=n+1, circuit=circuit)
     def action(
         option: BACKEND | BACKEND_SIMULATOR,
         backend: QkBackend,
         num_shots: int,
         n: int,
     ):
-        # create circuit:
         display(HTML('<h3>Quantumcircuit for testing Deutsch-Josza algorithm</h3>'));
-        circuit = deutsch_jozsa_algorithm(n=n, verbose=True);
 
         # display circuit:
         display(circuit.draw(
@@ -70,7 +71,12 @@ def action_prepare_circuit_and_job(
             # tags = ['algorithm=deutsch-jozsa', f'shots={num_shots}', f'bits={n}'],
         );
         display_latest_info(backend=backend, job=job);
-        latest_state.set_job(job, queue=isinstance(option, BACKEND));
+        latest_state.set_job(
+            job,
+            queue = isinstance(option, BACKEND),
+            name = 'deutsch-jozsa-algorithm',
+            tags = ['algorithm=deutsch-jozsa', f'shots={num_shots}', f'bits={n}'],
+        );
         return;
 
     action(num_shots=num_shots, n=n);
@@ -103,10 +109,10 @@ def action_display_statistics(
         wait = not queue,
     )
     def action(job: IBMQJob):
-        result = job.result();
+        result = get_job_result(job);
         N, counts, _ = get_counts(result, pad=True);
         if N > 0:
-            display(QkVisualisation.plot_distribution(counts, title=f'Measurements (batch size: {N})'));
+            display(QkVisualisation.plot_distribution(dict(counts), title=f'Measurements (batch size: {N})'));
         else:
             display(HTML('<p style="color:red;"><b>[WARNING]</b> No measurements were found!</p>'));
 
@@ -77,7 +77,12 @@ def action_prepare_circuit_and_job(
             optimization_level = 3,
         );
         display_latest_info(backend=backend, job=job);
-        latest_state.set_job(job, queue=queue);
+        latest_state.set_job(
+            job,
+            queue = queue,
+            name = 'example-circuit',
+            tags = ['algorithm=example', f'shots={num_shots}'],
+        );
         return;
 
     action(num_shots=num_shots);
@@ -110,12 +115,12 @@ def action_display_statistics(
         wait = not queue,
     )
     def action(job: IBMQJob):
-        result = job.result();
+        result = get_job_result(job);
         N, counts, [counts_0, counts_1] = get_counts(result, [0], [1], pad=True);
         if N > 0:
-            display(QkVisualisation.plot_distribution(counts, title=f'Measurements (batch size: {N})' ));
-            display(QkVisualisation.plot_distribution(counts_0, title=f'Measurements of QBit 0 (batch size: {N})'));
-            display(QkVisualisation.plot_distribution(counts_1, title=f'Measurements of QBit 1 (batch size: {N})'));
+            display(QkVisualisation.plot_distribution(dict(counts), title=f'Measurements (batch size: {N})' ));
+            display(QkVisualisation.plot_distribution(dict(counts_0), title=f'Measurements of QBit 0 (batch size: {N})'));
+            display(QkVisualisation.plot_distribution(dict(counts_1), title=f'Measurements of QBit 1 (batch size: {N})'));
         else:
             display(HTML('<p style="color:red;"><b>[WARNING]</b> No measurements were found!</p>'));
 
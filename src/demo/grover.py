@@ -24,8 +24,16 @@ __all__ = [
     'action_display_statistics',
     'action_prepare_circuit_and_job',
     'basic_action_display_circuit',
+    'basic_action_display_success_curve',
 ];
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# NOTE: beyond this, plots only show the measured outcomes (padding yields 2ⁿ mostly empty bars).
+MAX_BITS_PADDED_PLOT: int = 6;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS - ACTIONS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -34,7 +42,8 @@ def action_prepare_circuit_and_job(
     option: BACKEND | BACKEND_SIMULATOR,
     num_shots: int,
     problem: ProblemSAT,
-    prob: float = 0.,
+    prob: float | Literal['auto'] = 0.,
+    simplify: bool = True,
 ):
     '''
     Prepares the quntum circuit and jobs for the Grover algorithm.
@@ -44,23 +53,39 @@ def action_prepare_circuit_and_job(
     - `num_shots` - number of shots of the job prepared.
     - `problem` - an instance of a SAT problem.
     - `prob` - <float> estimated proportion of models which satisfy the problem (leave as 0. if unknown).
+        Use `prob='auto'` to compute the exact proportion by counting models.
+    - `simplify` - <boolean> if `true` (default) the circuit is constructed for the simplified problem
+        (see `simplify_problem`). Use the same value in `action_display_statistics`.
 
     NOTE: At least one of `path` or `text` must be set!
     '''
+    problem_circuit, reduction = prepare_problem_for_circuit(problem=problem, simplify=simplify);
+    if problem_circuit is None:
+        return;
+    problem = problem_circuit;
     n = problem.number_of_variables;
     Nc = problem.number_of_clauses;
 
-    @connect_to_backend(option=option, n=n + Nc + 1)
+    # NOTE: for the automatic choice of simulator, the circuit is constructed before connecting.
+    circuit_auto = grover_algorithm_from_sat(problem=problem, prob=prob) if option == BACKEND_SIMULATOR.AUTO else None;
+
+    # NOTE: request the least width, for which the oracle can be constructed.
+    @connect_to_backend(option=option, n=n + minimal_ancillas_cnf(Nc) + 1, circuit=circuit_auto)
     def action(
         option: BACKEND | BACKEND_SIMULATOR,
         backend: QkBackend,
         num_shots: int,
         problem: ProblemSAT,
-        prob: float = 0.,
+        prob: float | Literal['auto'] = 0.,
     ):
         # create circuit:
         display(HTML('<h3>Quantumcircuit for testing Grover algorithm</h3>'));
-        circuit = grover_algorithm_from_sat(problem=problem, prob=prob);
+        if circuit_auto is not None:
+            circuit = circuit_auto;
+        else:
+            # use as many clause ancillas as the backend permits:
+            max_qubits = backend.configuration().n_qubits;
+            circuit = grover_algorithm_from_sat(problem=problem, prob=prob, max_qubits=max_qubits);
 
         # display circuit:
         display(circuit.draw(
@@ -81,7 +106,12 @@ def action_prepare_circuit_and_job(
             # tags = ['algorithm=grover', f'shots={num_shots}', f'size={k}'],
         );
         display_latest_info(backend=backend, job=job);
-        latest_state.set_job(job, queue=isinstance(option, BACKEND));
+        latest_state.set_job(
+            job,
+            queue = isinstance(option, BACKEND),
+            name = 'grovers-algorithm',
+            tags = ['algorithm=grover', f'shots={num_shots}', f'size={n}', f'problem={problem.name}'],
+        );
         return;
 
     # construct SAT problem from file:
@@ -94,17 +124,24 @@ def action_display_statistics(
     job_id: Optional[str] = None,
     backend_option: Optional[BACKEND | BACKEND_SIMULATOR] = None,
     as_widget: bool = False,
+    simplify: bool = True,
 ):
     '''
     Displays statistics of the job results of running the Grover algorithm.
 
     @inputs
+    - `problem` - the (original) SAT problem.
     - `queue` - <boolean> `true` = display widget to choose job from IBM backend queue. `false` = use latest simulation.
     - `job_id` - <string | None> if set, will attempt to recover this job and display output.
     - `backend_option` - <enum | None> if set, will be used in combination with `job_id` to retrieve job.
     - `as_widget` - <boolean> if `true` displays a widget interface so that use can select backend + job before carrying out action.
         If `false` (default), attempts to retrieve job and carry out action if job exists and is done.
+    - `simplify` - <boolean> whether the circuit was constructed for the simplified problem
+        (as in `action_prepare_circuit_and_job`). If so, the measurements are lifted back to the original problem.
     '''
+    # NOTE: the simplification is deterministic, so the reduction used for the circuit is recovered.
+    reduction = simplify_problem(problem)[1] if simplify else None;
+
     @recover_job(
         queue = queue,
         ensure_job_done = True,
@@ -117,11 +154,29 @@ def action_display_statistics(
     )
     def action(job: IBMQJob):
         n = problem.number_of_variables;
-        result = job.result();
-        N, counts, [counts_inputs] = get_counts(result, list(range(n)), pad=True);
+        result = get_job_result(job);
+        try:
+            counts = Counts.from_result(result);
+            if reduction is not None:
+                # NOTE: search bits of the reduced problem ⟶ variables of the original problem (answer bit kept last).
+                counts = Counts.from_dict(reduction.lift_counts(counts.to_dict()), reverse=False);
+        except ValueError as err:
+            display(HTML(f'<p style="color:red;"><b>[WARNING]</b> The measurements cannot be evaluated: {err}</p>'));
+            return;
+        counts_inputs = counts.marginalise(list(range(n)));
+        N = counts.total;
         if N > 0:
-            display(QkVisualisation.plot_distribution(counts, title=f'Measurements (batch size: {N})'));
-            display(QkVisualisation.plot_distribution(counts_inputs, title=f'Measurements of search bits (batch size: {N})'));
+            display(QkVisualisation.plot_distribution(
+                counts.to_dict(pad=counts.num_bits <= MAX_BITS_PADDED_PLOT),
+                title=f'Measurements (batch size: {N})',
+            ));
+            display(QkVisualisation.plot_distribution(
+                counts_inputs.to_dict(pad=n <= MAX_BITS_PADDED_PLOT),
+                title=f'Measurements of search bits (batch size: {N})',
+            ));
+            satisfied, _ = problem.verify_many(counts_inputs.to_bits());
+            N_sat = int(counts_inputs.values[satisfied].sum());
+            display(HTML(f'<p><b>{N_sat}</b> out of <b>{N}</b> measurements of the search bits satisfy the problem.</p>'));
         else:
             display(HTML('<p style="color:red;"><b>[WARNING]</b> No measurements were found!</p>'));
 
@@ -132,6 +187,36 @@ def action_display_statistics(
 # BASIC ACTIONS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+def prepare_problem_for_circuit(
+    problem: ProblemSAT,
+    simplify: bool = True,
+) -> tuple[Optional[ProblemSAT], Optional[ReductionSAT]]:
+    '''
+    Optionally simplifies a SAT problem before its circuit is constructed.
+
+    @returns
+    - the problem, for which the circuit is to be constructed,
+        or `None`, if the simplification already decides the problem (a message is displayed);
+    - the mapping back to the original problem (if simplified).
+    '''
+    if not simplify:
+        return problem, None;
+    problem_reduced, reduction = simplify_problem(problem);
+    if reduction.unsatisfiable:
+        display(HTML('<p style="color:red;"><b>[INFO]</b> The simplification shows, that the problem is unsatisfiable.</p>'));
+        return None, reduction;
+    if problem_reduced.number_of_variables == 0:
+        solution = reduction.lift_solution([]);
+        bits = ''.join([ '1' if value else '0' for value in solution ]);
+        display(HTML(f'<p style="color:blue;"><b>[INFO]</b> The simplification solves the problem: <tt>{bits}</tt>.</p>'));
+        return None, reduction;
+    display(HTML(
+        f'<p><b>[INFO]</b> Simplified problem: '
+        f'<b>{problem_reduced.number_of_variables}</b> of {problem.number_of_variables} variables, '
+        f'<b>{problem_reduced.number_of_clauses}</b> of {problem.number_of_clauses} clauses.</p>'
+    ));
+    return problem_reduced, reduction;
+
 def basic_action_prepare_problem(
     path: Optional[str] = None,
     text: Optional[str] = None,
@@ -194,8 +279,49 @@ def basic_action_display_circuit(
         title = 'Example resulting state after one iteration upon appropriate inputs',
         mode = PLOT_VALUES.POWER,
         sort_by = lambda key, value: (-abs(value), key),
-        filter_by = lambda key, value: (abs(value)**2 >= prob_min),
+        threshold = prob_min,
         figsize = (10, 4),
         q_min = q_min,
     );
     return;
+
+def basic_action_display_success_curve(
+    problem: ProblemSAT,
+    r_max: Optional[int] = None,
+    figsize: tuple[int, int] = (10, 4),
+    dpi: int = 360,
+) -> int:
+    '''
+    Displays the success probability of the Grover algorithm against the number of rounds.
+    The probabilities for all numbers of rounds are obtained from the exact evolution of the search register
+    (for few search bits), resp. from a single simulation run.
+
+    @inputs
+    - `problem` - an instance of a SAT problem.
+    - `r_max` - <integer | None> (optional) maximal number of rounds (see `grover_snapshots_from_sat`).
+    - `figsize` - <(integer, integer)> Size of figure.
+    - `dpi` - <integer> resolution of image.
+
+    @returns
+    The (empirically) optimal number of rounds.
+    '''
+    if problem.number_of_variables <= LIMIT_QUBITS_EXACT_GROVER:
+        # NOTE: for few search bits, the exact evolution of the search register is cheaper than any simulation.
+        evolution = grover_evolution_from_sat(problem=problem);
+        curve, r = evolution.success_curve(r_max=r_max);
+    else:
+        circuit = grover_snapshots_from_sat(problem=problem, r_max=r_max);
+        snapshots = get_snapshots_of_circuit(circuit=circuit);
+        curve, r = grover_success_curve(problem=problem, snapshots=snapshots);
+    if len(curve) == 0:
+        display(HTML('<p style="color:red;"><b>[WARNING]</b> No snapshots were found. Plot cancelled.</p>'));
+        return r;
+
+    fig, ax = mplt.subplots(1, 1, constrained_layout=True, figsize=figsize, dpi=dpi);
+    mplt.title(label='Probability of measuring a model against the number of rounds', fontdict={'size': 12});
+    ax.stem(list(range(len(curve))), curve);
+    ax.set_xlabel('rounds');
+    ax.set_ylabel('probability');
+    ax.set_ylim(0, 1);
+    display(HTML(f'<p>Optimal number of rounds: <b>{r}</b> (success probability <b>{curve[r]:.4f}</b>).</p>'));
+    return r;
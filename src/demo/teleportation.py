@@ -5,6 +5,7 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from src.thirdparty.misc import *;
 from src.thirdparty.quantum import *;
 from src.thirdparty.render import *;
 from src.thirdparty.types import *;
@@ -44,16 +45,17 @@ def action_prepare_circuit_and_job(
     - `num_shots` - number of shots of the job prepared for each random state.
     - `num_samples` - number of 'random' states to teleport
     '''
-    @connect_to_backend(option=option, n=3)
+    # create circuit (before connecting, so that the simulator can be chosen based upon the circuit):
+    circuit_scheme, params = teleportation_protocol_test();
+
+    @connect_to_backend(option=option, n=3, circuit=circuit_scheme)
     def action(
         option: BACKEND | BACKEND_SIMULATOR,
         backend: QkBackend,
         num_shots: int,
         num_samples: int,
     ):
-        # create circuit:
         display(HTML('<h3>Quantumcircuit for testing teleportation protocol</h3>'));
-        circuit_scheme, params = teleportation_protocol_test();
 
         # display circuit:
         display(circuit_scheme.draw(
@@ -86,7 +88,12 @@ def action_prepare_circuit_and_job(
             # tags = ['algorithm=teleportation', 'state=random', f'shots={num_shots}', f'samples={num_samples}'],
         );
         display_latest_info(backend=backend, job=job);
-        latest_state.set_job(job, queue=isinstance(option, BACKEND));
+        latest_state.set_job(
+            job,
+            queue = isinstance(option, BACKEND),
+            name = 'teleportation-protocoll-with-random-states',
+            tags = ['algorithm=teleportation', 'state=random', f'shots={num_shots}', f'samples={num_samples}'],
+        );
         return;
 
     action(num_shots=num_shots, num_samples=num_samples);
@@ -119,11 +126,24 @@ def action_display_statistics(
         wait = not queue,
     )
     def action(job: IBMQJob):
-        result = job.result();
+        result = get_job_result(job);
         N, _, [counts_alice, counts_bob] = get_counts(result, [0,1], [2]);
         if N > 0:
-            display(QkVisualisation.plot_distribution(counts_alice, title=f'Measurements of Alice\'s QBits (batch size: {N})'));
-            display(QkVisualisation.plot_distribution(counts_bob, title=f'Measurements of Bob\'s QBits (batch size: {N})'));
+            display(QkVisualisation.plot_distribution(dict(counts_alice), title=f'Measurements of Alice\'s QBits (batch size: {N})'));
+            display(QkVisualisation.plot_distribution(dict(counts_bob), title=f'Measurements of Bob\'s QBits (batch size: {N})'));
+            # NOTE: per random state, Bob ought to measure 0 after applying the inverse unitary.
+            fidelities = CountsMatrix.from_result(result).success_rates([2], '0');
+            display(HTML(dedent(
+                f'''
+                <p>
+                Proportion of Bob's measurements of 0 per random state ({len(fidelities)} states):
+                mean <b>{fidelities.mean():.4f}</b>,
+                std <b>{fidelities.std():.4f}</b>,
+                min <b>{fidelities.min():.4f}</b>,
+                max <b>{fidelities.max():.4f}</b>.
+                </p>
+                '''
+            )));
         else:
             display(HTML('<p style="color:red;"><b>[WARNING]</b> No measurements were found!</p>'));
         return;
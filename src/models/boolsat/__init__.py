@@ -5,7 +5,10 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from src.models.boolsat.clauses import *;
 from src.models.boolsat.problems import *;
+from src.models.boolsat.counting import *;
+from src.models.boolsat.preprocessing import *;
 from src.models.boolsat.dimacs import *;
 from src.models.boolsat.circuits import *;
 
@@ -14,9 +17,15 @@ from src.models.boolsat.circuits import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'ClausesCSR',
+    'count_models',
+    'minimal_ancillas_cnf',
     'oracle_cnf',
     'oracle_disjunct',
+    'oracle_disjunct_gate',
     'phase_oracle_dnf',
     'ProblemSAT',
     'read_problem_sat_from_dimacs_cnf',
+    'ReductionSAT',
+    'simplify_problem',
 ];
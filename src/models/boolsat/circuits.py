@@ -9,46 +9,91 @@ from src.thirdparty.maths import *;
 from src.thirdparty.quantum import *;
 from src.thirdparty.types import *;
 
+from src.core.cache import *;
+from src.models.boolsat.clauses import *;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'minimal_ancillas_cnf',
     'oracle_cnf',
     'oracle_disjunct',
+    'oracle_disjunct_gate',
     'phase_oracle_dnf',
 ];
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# local usage only
+_PHASE_ORACLE_DIAGONAL_MAX_QUBITS: int = 10;
+# capacities C(0), C(1), ..., C(64) of the recursive oracle construction (see `capacity_cnf`):
+_CAPACITIES: list[int] = [ 1 ];
+for _p in range(1, 65):
+    _CAPACITIES.append(max(g * _CAPACITIES[_p - g] for g in range(1, _p + 1)));
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 def oracle_cnf(
     n: int,
-    clauses: list[list[tuple[Literal[0]|Literal[1],int]]],
+    clauses: ClausesCSR | list[list[tuple[Literal[0]|Literal[1],int]]],
+    max_ancillas: Optional[int] = None,
 ) -> QuantumCircuit:
+    '''
+    Constructs an oracle for a problem in CNF,
+    which flips the `final` qubit iff all clauses are satisfied.
+
+    @inputs
+    - `n` - <integer> number of variables (search qubits).
+    - `clauses` - the clauses of the problem.
+    - `max_ancillas` - <integer | None> (optional) upper bound on the number of clause ancillas.
+        By default one ancilla per clause is used.
+        Otherwise the clauses are evaluated in blocks, whose partial conjunctions
+        are accumulated in the ancillas and subsequently uncomputed,
+        which trades circuit depth for width (see `minimal_ancillas_cnf`).
+
+    The qubits of the circuit are ordered as `q` (search), `a` (clause ancillas), `final`.
+    All ancillas are returned to their initial state.
+    '''
+    if not isinstance(clauses, ClausesCSR):
+        clauses = ClausesCSR.from_clauses(clauses);
     Nc = len(clauses);
-    final = n + Nc;
+    num_ancillas = Nc if max_ancillas is None else max(0, min(Nc, max_ancillas));
+    if capacity_cnf(num_ancillas) < Nc:
+        raise ValueError(f'{num_ancillas} ancillas do not suffice for {Nc} clauses (at least {minimal_ancillas_cnf(Nc)} required)!');
+    final = n + num_ancillas;
     circuit = QuantumCircuit(
         QuantumRegister(n, 'q'),
-        QuantumRegister(Nc, 'a'),
+        QuantumRegister(num_ancillas, 'a'),
         QuantumRegister(1, 'final'),
     );
-    variables = [ [ index for sgn, index in clause] for clause in clauses ];
-    codes = [ tuple( sgn for sgn, index in clause ) for clause in clauses ];
-    disjuncts = list(map(oracle_disjunct, codes));
-    preprocessing_items = list(zip(range(Nc), variables, disjuncts));
-
-    # encode clauses
-    for k, vars, D in preprocessing_items:
-        circuit.append(D, vars + [n + k]);
-    # conjunction of disjunctions:
-    circuit.mcx(list(range(n,n + Nc)), final);
-    # undo preprocessing
-    for k, vars, D in preprocessing_items[::-1]:
-        circuit.append(D, vars + [n + k]);
+    variables = [ indices.tolist() for _, indices in clauses.views() ];
+    codes = [ tuple(signs.tolist()) for signs, _ in clauses.views() ];
+    # NOTE: clauses with the same sign pattern share a single (cached) gate.
+    disjuncts = list(map(oracle_disjunct_gate, codes));
+    items = list(zip(variables, disjuncts));
+    append_conjunction_of_clauses(
+        circuit = circuit,
+        items = items,
+        target = final,
+        pool = list(range(n, n + num_ancillas)),
+    );
     return circuit;
 
+def minimal_ancillas_cnf(Nc: int) -> int:
+    '''
+    Returns the least number of clause ancillas needed by `oracle_cnf` for `Nc` clauses.
+    '''
+    p = 0;
+    while capacity_cnf(p) < Nc:
+        p += 1;
+    return p;
+
 def oracle_disjunct(
     code: tuple[Literal[0]|Literal[1]],
 ) -> QuantumCircuit:
@@ -65,9 +110,23 @@ def oracle_disjunct(
         circuit.x(literals_pos);
     # store conjunction in ancillary bit
     circuit.mcx(list(range(n)), final)
-    circuit.x(range(n + 1));
+    # negate the ancillary bit and restore the inputs:
+    if len(literals_pos) > 0:
+        circuit.x(literals_pos);
+    circuit.x(final);
     return circuit;
 
+@cached_gate()
+def oracle_disjunct_gate(
+    code: tuple[Literal[0]|Literal[1]],
+) -> QkGate:
+    '''
+    Returns the (shared) gate of `oracle_disjunct` for a sign pattern.
+    '''
+    gate = oracle_disjunct(code).to_gate();
+    gate.name = 'OR';
+    return gate;
+
 # NOTE: This method is only useful if the conjuncts are all encoded in a homogenous manner.
 def phase_oracle_dnf(
     n:     int,
@@ -78,14 +137,91 @@ def phase_oracle_dnf(
     @inputs
     - `n` - <integer> number of qbits
     - `codes` - <[(0|1, ...)]> list of 'conjunction' of literals.
+
+    NOTE: Qubit `i` corresponds to `code[i]`.
+    If there are few conjuncts (relative to `2ⁿ`), each is implemented
+    as a multi-controlled Z-gate conjugated by X-gates.
+    Otherwise (and only for small `n`) a native diagonal gate is used.
     '''
     circuit = QuantumCircuit(n, 0);
     circuit.name = 'phase oracle'
     N = 2**n;
-    u = np.ones(shape=[2]*n);
+    # NOTE: flipping the phase is idempotent per basis state, so duplicates are ignored.
+    codes = list(dict.fromkeys(tuple(code) for code in codes));
+    if n <= _PHASE_ORACLE_DIAGONAL_MAX_QUBITS and len(codes) * n >= N:
+        u = np.ones(shape=(N,), dtype=complex);
+        if len(codes) > 0:
+            weights = 1 << np.arange(n, dtype=np.int64);
+            u[np.asarray(codes, dtype=np.int64) @ weights] = -1;
+        circuit.append(QkDiagonal(u.tolist()), range(n));
+        return circuit;
     for code in codes:
-        code = code[::-1];
-        u[code] = -1;
-    U = np.diag(u.reshape(N));
-    circuit.unitary(QkOperator(U), range(n));
+        literals_neg = [ index for index, x in enumerate(code) if x == 0 ];
+        if len(literals_neg) > 0:
+            circuit.x(literals_neg);
+        qk_mcz(circuit, controls=list(range(n - 1)), target=n - 1);
+        if len(literals_neg) > 0:
+            circuit.x(literals_neg);
     return circuit;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def capacity_cnf(p: int) -> int:
+    '''
+    Returns the maximal number of clauses, whose conjunction can be computed
+    into a target qubit with the aid of `p` clean ancillas.
+
+    Recursion: `C(0) = 1` (a single clause is computed directly into the target)
+    and `C(p) = max{ g·C(p - g) | 1 ≤ g ≤ p }`
+    (the clauses are split into `g` blocks, whose conjunctions are held in `g` ancillas).
+
+    NOTE: For `p` beyond the tabulated range a lower bound is returned,
+    which suffices, as `C` grows exponentially.
+    '''
+    if p <= 0:
+        return 1;
+    return max(p, _CAPACITIES[min(p, len(_CAPACITIES) - 1)]);
+
+def append_conjunction_of_clauses(
+    circuit: QuantumCircuit,
+    items: list[tuple[list[int], QkGate]],
+    target: int,
+    pool: list[int],
+):
+    '''
+    Flips the `target` qubit iff all clauses are satisfied (in place).
+    Each item consists of the variables of a clause and the gate of its disjunction.
+    The qubits in `pool` must be clean ancillas and are restored.
+    '''
+    if len(items) == 0:
+        circuit.x(target);
+        return;
+    if len(items) == 1:
+        vars, D = items[0];
+        circuit.append(D, vars + [target]);
+        return;
+    # use as many blocks as possible (shallowest circuit):
+    p = len(pool);
+    g = max(
+        g for g in range(1, min(p, len(items)) + 1)
+        if g * capacity_cnf(p - g) >= len(items)
+    ) if len(items) > p else len(items);
+    size, rest = divmod(len(items), g);
+    blocks = [];
+    start = 0;
+    for k in range(g):
+        stop = start + size + (1 if k < rest else 0);
+        blocks.append(items[start:stop]);
+        start = stop;
+    ancillas, pool_rest = pool[:g], pool[g:];
+    # compute partial conjunctions:
+    for block, a in zip(blocks, ancillas):
+        append_conjunction_of_clauses(circuit, block, target=a, pool=pool_rest);
+    # conjunction of partial conjunctions:
+    circuit.mcx(ancillas, target);
+    # uncompute partial conjunctions:
+    for block, a in list(zip(blocks, ancillas))[::-1]:
+        append_conjunction_of_clauses(circuit, block, target=a, pool=pool_rest);
+    return;
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.maths import *;
+from src.thirdparty.types import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'ClausesCSR',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+TYPE_LITERAL: TypeAlias = tuple[Literal[0] | Literal[1], int];
+TYPE_DISJ: TypeAlias = list[TYPE_LITERAL];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class ClausesCSR():
+    '''
+    Array-backed storage of a list of clauses (compressed sparse rows).
+
+    - `indices`   - <int32> flat array of the (0-based) indexes of all literals.
+    - `offsets`   - <int64> array of length `#clauses + 1`;
+        clause `k` consists of the literals `offsets[k]:offsets[k+1]`.
+    - `sign_bits` - <uint8> bitmap of the signs of the literals (`1` = positive, `0` = negative).
+
+    NOTE: Iterating over or indexing the object yields clauses in the format
+    `[(sgn, index), ...]` for compatibility. This list is materialised lazily (once).
+    For array-based passes use `view`, `views` or `evaluate` instead.
+    '''
+    __slots__ = ('indices', 'offsets', 'sign_bits', '_tuples');
+
+    indices: NDArray[Shape['*'], Int32];
+    offsets: NDArray[Shape['*'], Int64];
+    sign_bits: NDArray[Shape['*'], UInt8];
+    _tuples: Optional[list[TYPE_DISJ]];
+
+    def __init__(
+        self,
+        indices: NDArray[Shape['*'], Int32],
+        offsets: NDArray[Shape['*'], Int64],
+        sign_bits: NDArray[Shape['*'], UInt8],
+    ):
+        self.indices = np.asarray(indices, dtype=np.int32);
+        self.offsets = np.asarray(offsets, dtype=np.int64);
+        self.sign_bits = np.asarray(sign_bits, dtype=np.uint8);
+        self._tuples = None;
+        return;
+
+    @staticmethod
+    def from_clauses(clauses: Iterable[TYPE_DISJ]) -> ClausesCSR:
+        '''
+        Builds the storage from clauses of the form `[(sgn, index), ...]`.
+        The clauses are consumed lazily, so that generators can be passed directly.
+        '''
+        indices = array('i');
+        signs = array('B');
+        offsets = array('q', [0]);
+        for clause in clauses:
+            for sgn, index in clause:
+                indices.append(index);
+                signs.append(sgn);
+            offsets.append(len(indices));
+        return ClausesCSR.from_arrays(
+            indices = np.asarray(indices, dtype=np.int32),
+            offsets = np.asarray(offsets, dtype=np.int64),
+            signs = np.asarray(signs, dtype=np.uint8),
+        );
+
+    @staticmethod
+    def from_arrays(
+        indices: NDArray[Shape['*'], Int32],
+        offsets: NDArray[Shape['*'], Int64],
+        signs: NDArray[Shape['*'], Bool],
+    ) -> ClausesCSR:
+        '''
+        Builds the storage from (unpacked) arrays of indexes, offsets and signs.
+        '''
+        sign_bits = np.packbits(np.asarray(signs, dtype=bool), bitorder='little');
+        return ClausesCSR(indices=indices, offsets=offsets, sign_bits=sign_bits);
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1;
+
+    def __iter__(self) -> Generator[TYPE_DISJ, None, None]:
+        yield from self.tuples;
+
+    def __getitem__(self, k: int | slice) -> TYPE_DISJ | list[TYPE_DISJ]:
+        return self.tuples[k];
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ClausesCSR):
+            return False;
+        return np.array_equal(self.indices, other.indices) \
+            and np.array_equal(self.offsets, other.offsets) \
+            and np.array_equal(self.signs, other.signs);
+
+    def __repr__(self) -> str:
+        return f'ClausesCSR(clauses={len(self)}, literals={self.number_of_literals})';
+
+    @property
+    def number_of_literals(self) -> int:
+        return len(self.indices);
+
+    @property
+    def lengths(self) -> NDArray[Shape['*'], Int64]:
+        '''
+        Returns the number of literals in each clause.
+        '''
+        return np.diff(self.offsets);
+
+    @property
+    def signs(self) -> NDArray[Shape['*'], UInt8]:
+        '''
+        Returns the signs of all literals as an (unpacked) array of 0s and 1s.
+        '''
+        return np.unpackbits(self.sign_bits, count=self.number_of_literals, bitorder='little');
+
+    @property
+    def tuples(self) -> list[TYPE_DISJ]:
+        '''
+        Returns (and caches) the clauses in the format `[[(sgn, index), ...], ...]`.
+        '''
+        if self._tuples is None:
+            self._tuples = [
+                list(zip(signs.tolist(), indices.tolist()))
+                for signs, indices in self.views()
+            ];
+        return self._tuples;
+
+    def view(self, k: int) -> tuple[
+        NDArray[Shape['*'], UInt8],
+        NDArray[Shape['*'], Int32],
+    ]:
+        '''
+        Returns the signs and indexes of the literals in clause `k`.
+
+        NOTE: The indexes are a view on the underlying storage (no copy).
+        '''
+        start, stop = int(self.offsets[k]), int(self.offsets[k+1]);
+        bits = np.unpackbits(self.sign_bits[start >> 3 : (stop + 7) >> 3], bitorder='little');
+        signs = bits[(start & 7) : (start & 7) + (stop - start)];
+        return signs, self.indices[start:stop];
+
+    def views(self) -> Generator[
+        tuple[NDArray[Shape['*'], UInt8], NDArray[Shape['*'], Int32]],
+        None,
+        None,
+    ]:
+        '''
+        Yields the signs and indexes of the literals clause by clause.
+        '''
+        signs = self.signs;
+        for start, stop in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()):
+            yield signs[start:stop], self.indices[start:stop];
+        return;
+
+    def evaluate(self, values: NDArray[Any, Bool]) -> NDArray[Any, Bool]:
+        '''
+        Evaluates all clauses simultaneously.
+
+        @inputs
+        - `values` - <bool> array of shape `(..., V)`, where the last axis contains
+            the truth values of the variables indexed by `0, 1, ..., V - 1`.
+
+        @returns
+        <bool> array of shape `(..., #clauses)` indicating which clauses are satisfied.
+        '''
+        values = np.asarray(values, dtype=bool);
+        literals = values[..., self.indices] == self.signs.astype(bool);
+        # count the satisfied literals per clause via cumulative sums:
+        cumulative = np.zeros(shape=literals.shape[:-1] + (literals.shape[-1] + 1,), dtype=np.int64);
+        np.cumsum(literals, axis=-1, out=cumulative[..., 1:]);
+        counts = cumulative[..., self.offsets[1:]] - cumulative[..., self.offsets[:-1]];
+        return counts > 0;
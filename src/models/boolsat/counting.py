@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *;
+from src.thirdparty.run import *;
+from src.thirdparty.types import *;
+
+from src.models.boolsat.problems import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'count_models',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+LIMIT_VARIABLES_MODEL_COUNT: int = 36;
+
+# local usage only
+_WORD_BITS: int = 6; # 64 = 2^6 assignments per uint64 word
+_CHUNK_WORDS: int = 1 << 16;
+_PARALLEL_MIN_WORDS: int = 1 << 18;
+# bit patterns of the first 6 variables within a word:
+_PATTERNS = np.asarray([
+    0xAAAAAAAAAAAAAAAA,
+    0xCCCCCCCCCCCCCCCC,
+    0xF0F0F0F0F0F0F0F0,
+    0xFF00FF00FF00FF00,
+    0xFFFF0000FFFF0000,
+    0xFFFFFFFF00000000,
+], dtype=np.uint64);
+_POPCOUNT = np.asarray([ bin(k).count('1') for k in range(256) ], dtype=np.int64);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def count_models(
+    problem: ProblemSAT,
+    processes: Optional[int] = None,
+) -> int:
+    '''
+    Computes the exact number of models of a SAT problem,
+    i.e. the number of assignments of the `n` variables of the problem,
+    which satisfy all clauses.
+
+    All `2ⁿ` assignments are evaluated bit-parallel,
+    packing 64 assignments into each `uint64` word.
+    The `k`-th variable (in the order of `problem.variables`) is bit `k` of the assignment.
+
+    @inputs
+    - `problem` - an instance of the SAT problem.
+    - `processes` - <integer | None> number of processes to use for large problems
+        (defaults to the number of cpus). Use `processes=1` to force a single process.
+    '''
+    n = problem.number_of_variables;
+    if n > LIMIT_VARIABLES_MODEL_COUNT:
+        raise Exception(f'Model counting is limited to {LIMIT_VARIABLES_MODEL_COUNT} variables (problem has {n})!');
+    clauses = problem.clauses;
+    # relabel variables by their position in the problem:
+    positions = np.searchsorted(np.asarray(problem.variables, dtype=np.int64), clauses.indices);
+    signs = clauses.signs;
+    offsets = clauses.offsets;
+
+    num_words = 1 << max(n - _WORD_BITS, 0);
+    tasks = [
+        (signs, positions, offsets, n, start, min(_CHUNK_WORDS, num_words - start))
+        for start in range(0, num_words, _CHUNK_WORDS)
+    ];
+    if num_words >= _PARALLEL_MIN_WORDS and processes != 1:
+        with Pool(processes=processes) as pool:
+            counts = pool.starmap(count_models_in_chunk, tasks);
+    else:
+        counts = [ count_models_in_chunk(*task) for task in tasks ];
+    return int(sum(counts));
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def count_models_in_chunk(
+    signs: NDArray[Shape['*'], UInt8],
+    positions: NDArray[Shape['*'], Int64],
+    offsets: NDArray[Shape['*'], Int64],
+    n: int,
+    start: int,
+    num_words: int,
+) -> int:
+    '''
+    Counts the models amongst the assignments `64·start, ..., 64·(start + num_words) - 1`.
+    '''
+    words = evaluate_chunk(signs, positions, offsets, n, start, num_words);
+    return int(_POPCOUNT[words.view(np.uint8)].sum());
+
+def evaluate_chunk(
+    signs: NDArray[Shape['*'], UInt8],
+    positions: NDArray[Shape['*'], Int64],
+    offsets: NDArray[Shape['*'], Int64],
+    n: int,
+    start: int,
+    num_words: int,
+) -> NDArray[Shape['*'], UInt64]:
+    '''
+    Evaluates the conjunction of the clauses for the assignments `64·start, ..., 64·(start + num_words) - 1`.
+
+    @returns
+    array of `num_words` words, where bit `b` of word `w` is set
+    iff assignment `64·(start + w) + b` satisfies all clauses.
+    '''
+    full = np.uint64(0xFFFFFFFFFFFFFFFF);
+    word_index = np.arange(start, start + num_words, dtype=np.uint64);
+    cache: dict[int, NDArray[Shape['*'], UInt64]] = dict();
+
+    def values_of(k: int) -> NDArray[Shape['*'], UInt64]:
+        if k not in cache:
+            if k < _WORD_BITS:
+                cache[k] = np.full(shape=(num_words,), fill_value=_PATTERNS[k], dtype=np.uint64);
+            else:
+                bit = (word_index >> np.uint64(k - _WORD_BITS)) & np.uint64(1);
+                cache[k] = np.uint64(0) - bit; # 0 ↦ 0…0, 1 ↦ 1…1
+        return cache[k];
+
+    result = np.full(shape=(num_words,), fill_value=full, dtype=np.uint64);
+    # NOTE: for n < 6 only the first 2ⁿ bits of the single word are valid assignments.
+    if n < _WORD_BITS:
+        result[:] = np.uint64((1 << (1 << n)) - 1);
+    for a, b in zip(offsets[:-1].tolist(), offsets[1:].tolist()):
+        disjunction = np.zeros(shape=(num_words,), dtype=np.uint64);
+        for sgn, k in zip(signs[a:b].tolist(), positions[a:b].tolist()):
+            disjunction |= values_of(k) if sgn == 1 else ~values_of(k);
+        result &= disjunction;
+        if not result.any():
+            break;
+    return result;
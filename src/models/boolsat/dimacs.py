@@ -28,6 +28,7 @@ def read_problem_sat_from_dimacs_cnf(
     name: str,
     path: Optional[str] = None,
     problem_text: Optional[str] = None,
+    validate: bool = False,
 ) -> ProblemSAT:
     '''
     NOTE: A cnf file encodes 0th order logic propositions in conjunctive normal form
@@ -63,11 +64,18 @@ def read_problem_sat_from_dimacs_cnf(
             ```
 
     cf. <https://people.sc.fsu.edu/~jburkardt/data/cnf/cnf.html>
+
+    NOTE: By default files are streamed line by line.
+    Use `validate=True` to parse the text against the full DIMACS grammar instead
+    (considerably slower and memory intensive for large problems).
     '''
-    if path is not None:
-        problem_text = read_file(path=path);
-    assert problem_text is not None, 'Either a path to a text file or text must be provided!';
-    clauses = parse_text_as_dimacs(problem_text);
+    if path is not None and not validate:
+        clauses = ClausesCSR.from_clauses(parse_file_as_dimacs(path=path));
+    else:
+        if path is not None:
+            problem_text = read_file(path=path);
+        assert problem_text is not None, 'Either a path to a text file or text must be provided!';
+        clauses = parse_text_as_dimacs(problem_text, validate=validate);
     problem = ProblemSAT(name=name, clauses=clauses);
     problem.setup();
     return problem;
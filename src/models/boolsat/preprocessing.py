@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from __future__ import annotations;
+
+from src.thirdparty.code import *;
+from src.thirdparty.types import *;
+
+from src.models.boolsat.problems import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'ReductionSAT',
+    'simplify_problem',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@dataclass
+class ReductionSAT():
+    '''
+    Mapping between a simplified SAT problem and the original problem.
+
+    - `number_of_variables` - number of variables of the original problem.
+    - `positions` - the `i`-th variable of the reduced problem
+        is the variable at position `positions[i]` of the original problem.
+    - `fixed` - values of the variables (by position in the original problem),
+        which were fixed during the simplification.
+    - `free` - positions of variables of the original problem,
+        whose values do not influence satisfiability (set to false when lifting).
+    - `unsatisfiable` - <boolean> whether a contradiction was derived.
+    '''
+    number_of_variables: int = field(default=0);
+    positions: list[int] = field(default_factory=list);
+    fixed: dict[int, bool] = field(default_factory=dict);
+    free: list[int] = field(default_factory=list);
+    unsatisfiable: bool = field(default=False);
+
+    def lift_solution(self, solution: list[bool]) -> list[bool]:
+        '''
+        Converts a solution of the reduced problem to a solution of the original problem.
+        '''
+        values = [ False ] * self.number_of_variables;
+        for position, value in self.fixed.items():
+            values[position] = value;
+        for position, value in zip(self.positions, solution):
+            values[position] = bool(value);
+        return values;
+
+    def lift_counts(self, counts: dict[str, int]) -> dict[str, int]:
+        '''
+        Converts counts as returned by `get_counts` for the reduced problem
+        to counts in terms of the variables of the original problem.
+
+        NOTE: The first `k` characters of each key are the search bits of the reduced problem
+        (`k` = number of variables of the reduced problem).
+        Any remaining characters (e.g. further measured bits) are kept as a suffix.
+        '''
+        k = len(self.positions);
+        template = [ '0' ] * self.number_of_variables;
+        for position, value in self.fixed.items():
+            template[position] = '1' if value else '0';
+        counts_lifted: dict[str, int] = {};
+        for key, value in counts.items():
+            chars = template.copy();
+            for position, char in zip(self.positions, key[:k]):
+                chars[position] = char;
+            key_lifted = ''.join(chars) + key[k:];
+            counts_lifted[key_lifted] = counts_lifted.get(key_lifted, 0) + value;
+        return counts_lifted;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def simplify_problem(problem: ProblemSAT) -> tuple[ProblemSAT, ReductionSAT]:
+    '''
+    Simplifies a SAT problem before constructing circuits for it.
+    The following steps are carried out (repeatedly until nothing changes):
+
+    - removal of tautologies (clauses containing `x` and `¬x`) and duplicate literals/clauses;
+    - unit propagation;
+    - pure literal elimination;
+    - removal of subsumed clauses.
+
+    The surviving variables are relabelled as `0, 1, ..., k - 1` (in their original order).
+
+    @inputs
+    - `problem` - an instance of the SAT problem (after `setup()`).
+
+    @returns
+    - the reduced problem;
+    - the mapping back to the (positions of the) variables of the original problem.
+
+    NOTE: The reduced problem is equisatisfiable with the original problem,
+    and every model of the reduced problem lifts to a model of the original problem.
+    Pure literal elimination does not preserve the number of models, however.
+    If a contradiction is derived, the reduced problem consists of a single empty clause.
+    '''
+    position_of = { index: position for position, index in enumerate(problem.variables) };
+    reduction = ReductionSAT(number_of_variables=problem.number_of_variables);
+
+    # NOTE: literals are encoded as ±(position + 1).
+    clauses: list[frozenset[int]] = [];
+    for signs, indices in problem.clauses.views():
+        clause = frozenset(
+            (position_of[index] + 1) if sgn == 1 else -(position_of[index] + 1)
+            for sgn, index in zip(signs.tolist(), indices.tolist())
+        );
+        if any(-lit in clause for lit in clause):
+            continue;
+        clauses.append(clause);
+    clauses = list(dict.fromkeys(clauses));
+    reduction.unsatisfiable = any(len(clause) == 0 for clause in clauses);
+
+    assignment: dict[int, bool] = {};
+    changed = True;
+    while changed and not reduction.unsatisfiable:
+        changed = False;
+
+        # unit propagation:
+        units = [ next(iter(clause)) for clause in clauses if len(clause) == 1 ];
+        if len(units) > 0:
+            changed = True;
+            for lit in units:
+                if assignment.get(abs(lit), lit > 0) != (lit > 0):
+                    reduction.unsatisfiable = True;
+                assignment[abs(lit)] = lit > 0;
+            clauses = assign_literals(clauses, assignment);
+            if any(len(clause) == 0 for clause in clauses):
+                reduction.unsatisfiable = True;
+            if reduction.unsatisfiable:
+                break;
+
+        # pure literal elimination:
+        literals = set().union(*clauses);
+        pure = [ lit for lit in literals if -lit not in literals ];
+        if len(pure) > 0:
+            changed = True;
+            for lit in pure:
+                assignment[abs(lit)] = lit > 0;
+            clauses = assign_literals(clauses, assignment);
+
+        # subsumption:
+        clauses_kept = remove_subsumed_clauses(clauses);
+        if len(clauses_kept) < len(clauses):
+            changed = True;
+            clauses = clauses_kept;
+
+    if reduction.unsatisfiable:
+        reduction.fixed = {};
+        reduction.free = [];
+        reduction.positions = [];
+        problem_reduced = ProblemSAT(name=problem.name, clauses=[[]]);
+        problem_reduced.setup();
+        return problem_reduced, reduction;
+
+    # relabel the remaining variables:
+    remaining = sorted(set(abs(lit) for clause in clauses for lit in clause));
+    label_of = { var: label for label, var in enumerate(remaining) };
+    reduction.positions = [ var - 1 for var in remaining ];
+    reduction.fixed = { var - 1: value for var, value in sorted(assignment.items()) };
+    reduction.free = [
+        position
+        for position in range(problem.number_of_variables)
+        if (position + 1) not in label_of and position not in reduction.fixed
+    ];
+    problem_reduced = ProblemSAT(
+        name = problem.name,
+        clauses = [
+            [ (1 if lit > 0 else 0, label_of[abs(lit)]) for lit in sorted(clause, key=abs) ]
+            for clause in clauses
+        ],
+    );
+    problem_reduced.setup();
+    return problem_reduced, reduction;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def assign_literals(
+    clauses: list[frozenset[int]],
+    assignment: dict[int, bool],
+) -> list[frozenset[int]]:
+    '''
+    Removes satisfied clauses and falsified literals.
+    '''
+    result = [];
+    for clause in clauses:
+        if any(assignment.get(abs(lit), None) == (lit > 0) for lit in clause):
+            continue;
+        result.append(frozenset(lit for lit in clause if abs(lit) not in assignment));
+    return list(dict.fromkeys(result));
+
+def remove_subsumed_clauses(clauses: list[frozenset[int]]) -> list[frozenset[int]]:
+    '''
+    Removes all clauses, which are proper supersets of other clauses.
+
+    NOTE: Uses occurrence lists: only the clauses containing the rarest literal
+    of a clause `C` need to be checked for containing `C`.
+    '''
+    occurrences: dict[int, list[int]] = {};
+    for k, clause in enumerate(clauses):
+        for lit in clause:
+            occurrences.setdefault(lit, []).append(k);
+    removed = [ False ] * len(clauses);
+    for k in sorted(range(len(clauses)), key=lambda k: len(clauses[k])):
+        clause = clauses[k];
+        if removed[k] or len(clause) == 0:
+            continue;
+        lit = min(clause, key=lambda lit: len(occurrences[lit]));
+        for j in occurrences[lit]:
+            if j != k and not removed[j] and len(clauses[j]) > len(clause) and clause <= clauses[j]:
+                removed[j] = True;
+    return [ clause for clause, flag in zip(clauses, removed) if not flag ];
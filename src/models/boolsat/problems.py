@@ -6,10 +6,13 @@
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 from src.thirdparty.code import *;
+from src.thirdparty.maths import *;
 from src.thirdparty.misc import *;
 from src.thirdparty.render import *;
 from src.thirdparty.types import *;
 
+from src.models.boolsat.clauses import *;
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -26,13 +29,19 @@ __all__ = [
 class ProblemSAT():
     name: str = field(default='SAT problem');
 
-    clauses: list[list[tuple[Literal[0]|Literal[1], int]]] = field(default_factory=list);
+    # NOTE: lists of clauses `[[(sgn, index), ...], ...]` are converted upon initialisation.
+    clauses: ClausesCSR = field(default_factory=lambda: ClausesCSR.from_clauses([]));
 
     variables: list[int] = field(init=False);
     variable_range: int = field(init=False);
     number_of_variables: int = field(init=False);
     number_of_clauses: int = field(init=False);
 
+    def __post_init__(self):
+        if not isinstance(self.clauses, ClausesCSR):
+            self.clauses = ClausesCSR.from_clauses(self.clauses);
+        return;
+
     def __str__(self) -> str:
         return self.repr(mode=PRINT_MODE.PLAIN, linebreaks=False);
 
@@ -44,10 +53,10 @@ class ProblemSAT():
         match mode:
             case PRINT_MODE.LATEX:
                 lines = [];
-                for clause in self.clauses:
+                for signs, indices in self.clauses.views():
                     literals = [
                         f'x_{{{index}}}' if sgn == 1 else f'\\neg x_{{{index}}}'
-                        for sgn, index in clause
+                        for sgn, index in zip(signs.tolist(), indices.tolist())
                     ];
                     D = r'\,\vee\,'.join(literals);
                     if len(literals) == 1:
@@ -70,10 +79,10 @@ class ProblemSAT():
             case _:
                 lb = '\n' if linebreaks else '';
                 lines = [];
-                for clause in self.clauses:
+                for signs, indices in self.clauses.views():
                     literals = [
                         f'x[{index}]' if sgn == 1 else f'¬ x[{index}]'
-                        for sgn, index in clause
+                        for sgn, index in zip(signs.tolist(), indices.tolist())
                     ];
                     D = r' ⋁ '.join(literals);
                     if len(literals) == 1:
@@ -86,15 +95,23 @@ class ProblemSAT():
 
     def setup(self):
         # extract basic information about variables and clauses:
-        variables = set();
-        for clause in self.clauses:
-            variables = variables.union([index for sgn, index in clause]);
-        self.variables = sorted(list(variables), reverse=False);
+        self.variables = np.unique(self.clauses.indices).tolist();
+        self.variable_range = (self.variables[-1] + 1) if len(self.variables) > 0 else 0;
         # there may be redundancies:
         self.number_of_variables = len(self.variables);
         self.number_of_clauses = len(self.clauses);
         pass;
 
+    def fingerprint(self) -> str:
+        '''
+        Returns a hash, which identifies the problem by its clauses (independently of its name).
+        '''
+        h = sha256();
+        for values in [ self.clauses.indices, self.clauses.offsets, self.clauses.sign_bits ]:
+            h.update(np.ascontiguousarray(values).tobytes());
+            h.update(b'|');
+        return h.hexdigest();
+
     def map_solution_to_literals(self, solution: list[bool]) -> dict[str, bool]:
         '''
         Converts a solution to the SAT-problem in terms of the named atoms in the problem.
@@ -114,11 +131,53 @@ class ProblemSAT():
 
         NOTE: If a solution does not cover an atom, then atom is set to false.
         '''
-        soln = self.map_solution_to_literals(solution);
-        return all(
-            any(
-                (sgn == 1 and soln[index]) or (sgn == 0 and not soln[index])
-                for sgn, index in clause
-            )
-            for clause in self.clauses
-        );
+        m = min(len(solution), self.number_of_variables);
+        values = np.zeros(shape=(self.variable_range,), dtype=bool);
+        values[self.variables[:m]] = np.asarray(solution[:m], dtype=bool);
+        return bool(np.all(self.clauses.evaluate(values)));
+
+    def verify_many(
+        self,
+        solutions: NDArray[Shape['*, *'], Bool] | Mapping[str, int],
+        packed: bool = False,
+    ) -> tuple[
+        NDArray[Shape['*'], Bool],
+        NDArray[Shape['*'], Int64],
+    ]:
+        '''
+        Verifies many candidate solutions to the SAT-problem simultaneously.
+
+        @inputs
+        - `solutions` - either
+            - a 2-D <bool> array, one candidate per row (ordered as in `verify`); or
+            - a dictionary of counts as returned by `get_counts`, whose keys `'x₀x₁...'` are the candidates.
+        - `packed` - <boolean> if `true`, the rows of the array are bit-packed via `np.packbits(..., axis=1)`.
+
+        @returns
+        - a <bool> array indicating which candidates satisfy the problem;
+        - an <integer> array with the number of violated clauses per candidate.
+
+        NOTE: For dictionaries, the results are ordered as the keys of the dictionary.
+        If a solution does not cover an atom, then atom is set to false.
+        '''
+        n = self.number_of_variables;
+        # NOTE: the shapes are given explicitly, as `-1` cannot be inferred for empty inputs or if `n = 0`.
+        if isinstance(solutions, Mapping):
+            text = ''.join([ key[:n].ljust(n, '0') for key in solutions.keys() ]);
+            X = (np.frombuffer(text.encode('ascii'), dtype=np.uint8) == ord('1')).reshape((len(solutions), n));
+        else:
+            X = np.asarray(solutions, dtype=np.uint8 if packed else bool);
+            width = (X.size // len(X)) if len(X) > 0 else (n + 7) // 8 if packed else n;
+            X = X.reshape((len(X), width));
+            if packed:
+                X = np.unpackbits(X, axis=1, count=n).astype(bool);
+        M = X.shape[0];
+        m = min(X.shape[1], n);
+        violated = np.zeros(shape=(M,), dtype=np.int64);
+        # NOTE: evaluate in batches to bound memory usage (#candidates × #literals).
+        batch = max(1, (1 << 22) // max(1, self.clauses.number_of_literals));
+        for start in range(0, M, batch):
+            values = np.zeros(shape=(min(batch, M - start), self.variable_range), dtype=bool);
+            values[:, self.variables[:m]] = X[start:start + batch, :m];
+            violated[start:start + batch] = np.sum(~self.clauses.evaluate(values), axis=-1);
+        return violated == 0, violated;
@@ -5,6 +5,7 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from src.models.quantum.simulator import *;
 from src.models.quantum.states import *;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -12,6 +13,13 @@ from src.models.quantum.states import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'LIMIT_QUBITS_NATIVE_SIMULATOR',
+    'evolve_statevectors',
     'get_ouput_state_of_circuit',
+    'get_ouput_states_of_circuit',
+    'get_snapshots_of_circuit',
     'plot_ouput_state_of_circuit',
+    'simulate_snapshots',
+    'simulate_statevector',
+    'simulate_statevectors',
 ];
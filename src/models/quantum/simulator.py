@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.types import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# EXPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+__all__ = [
+    'LIMIT_QUBITS_NATIVE_SIMULATOR',
+    'evolve_statevectors',
+    'simulate_snapshots',
+    'simulate_statevector',
+    'simulate_statevectors',
+];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# CONSTANTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+LIMIT_QUBITS_NATIVE_SIMULATOR: int = 22;
+
+# local usage only
+_MAX_QUBITS_DENSE_OPERATION: int = 4;
+_MAX_AMPLITUDES_PER_BATCH: int = 1 << 22;
+_IGNORED_INSTRUCTIONS: list[str] = [ 'barrier', 'delay', 'id' ];
+_NON_UNITARY_INSTRUCTIONS: list[str] = [ 'measure', 'reset', 'initialize' ];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def simulate_statevector(
+    circuit: QuantumCircuit,
+    state: Optional[list[Literal[0]|Literal[1]]] = None,
+) -> NDArray[Shape['*'], Complex]:
+    '''
+    Computes the output state of a (unitary) circuit in-process,
+    without submitting a job to a simulator backend.
+
+    @inputs
+    - `ciruit` - the quantum circuit.
+    - `state` - (optional) desired input (basis) state. Defaults to `[0, 0, ..., 0]`.
+
+    @returns
+    The output state as a vector of length `2^m` (in qiskit's ordering, i.e. bit `i` of an index is the value of qbit `i`).
+    '''
+    m = circuit.num_qubits;
+    if state is None:
+        state = [0]*m;
+    psi = basis_states(m, [ sum(int(value) << i for i, value in enumerate(state)) ]);
+    return evolve_statevectors(circuit=circuit, vectors=psi)[0];
+
+def simulate_snapshots(
+    circuit: QuantumCircuit,
+    state: Optional[list[Literal[0]|Literal[1]]] = None,
+) -> dict[str, NDArray[Shape['*'], Any]]:
+    '''
+    Computes the labelled snapshots (`save_probabilities` / `save_statevector` instructions)
+    of a (unitary) circuit in a single in-process simulation.
+
+    @inputs
+    - `ciruit` - the quantum circuit.
+    - `state` - (optional) desired input (basis) state. Defaults to `[0, 0, ..., 0]`.
+
+    @returns
+    dictionary of snapshots by label, formatted as by Aer
+    (probabilities over the saved qbits, resp. state vectors, in qiskit's ordering).
+    '''
+    m = circuit.num_qubits;
+    if state is None:
+        state = [0]*m;
+    psi = basis_states(m, [ sum(int(value) << i for i, value in enumerate(state)) ]);
+    snapshots = dict();
+    evolve_statevectors(circuit=circuit, vectors=psi, snapshots=snapshots);
+    return { label: values[0] for label, values in snapshots.items() };
+
+def simulate_statevectors(
+    circuit: QuantumCircuit,
+    states: Optional[list[list[Literal[0]|Literal[1]]]] = None,
+) -> NDArray[Shape['B, N'], Complex]:
+    '''
+    Computes the output states of a (unitary) circuit for many input basis states in one simulation.
+
+    @inputs
+    - `ciruit` - the quantum circuit.
+    - `states` - (optional) list of `B` input (basis) states. Defaults to all `2^m` basis states
+        (in qiskit's ordering, i.e. the `k`-th input is the basis state with index `k`).
+
+    @returns
+    array of shape `(B, 2^m)`, whose `b`-th row is the output state for the `b`-th input.
+
+    NOTE: The inputs are evolved together as a batch (in chunks of bounded size).
+    '''
+    m = circuit.num_qubits;
+    check_number_of_qubits(m);
+    N = 2**m;
+    if states is None:
+        indexes = np.arange(N, dtype=np.int64);
+    else:
+        indexes = np.asarray([
+            sum(int(value) << i for i, value in enumerate(state))
+            for state in states
+        ], dtype=np.int64);
+    B = len(indexes);
+    chunk = max(1, _MAX_AMPLITUDES_PER_BATCH // N);
+    result = np.empty(shape=(B, N), dtype=complex);
+    for start in range(0, B, chunk):
+        indexes_chunk = indexes[start:start + chunk];
+        psi = basis_states(m, indexes_chunk);
+        result[start:start + chunk] = evolve_statevectors(circuit=circuit, vectors=psi);
+    return result;
+
+def evolve_statevectors(
+    circuit: QuantumCircuit,
+    vectors: NDArray[Shape['B, N'], Complex],
+    snapshots: Optional[dict[str, NDArray[Shape['B, *'], Any]]] = None,
+) -> NDArray[Shape['B, N'], Complex]:
+    '''
+    Applies a (unitary) circuit to a batch of state vectors simultaneously.
+
+    The states are held as a tensor of shape `(B, 2, ..., 2)`, where the leading axis is the batch axis
+    and qbit `i` corresponds to axis `m - i`.
+    Gates are applied as tensor contractions on the axes of the qbits they act upon.
+    Controlled gates only act on the slice, in which the controls are set,
+    and gates without a known matrix are applied via their definitions.
+
+    @inputs
+    - `ciruit` - the quantum circuit on `m` qbits.
+    - `vectors` - array of shape `(B, 2^m)` of input states.
+    - `snapshots` - (optional) if set, the snapshots of `save_probabilities` / `save_statevector` instructions
+        are stored here by label (as arrays with a leading batch axis).
+        Otherwise these instructions are ignored.
+
+    @returns
+    array of shape `(B, 2^m)` of output states.
+
+    NOTE: Raises a `ValueError` for non-unitary instructions (measurements, resets, classical conditions)
+    and for circuits beyond `LIMIT_QUBITS_NATIVE_SIMULATOR` qbits.
+    '''
+    m = circuit.num_qubits;
+    check_number_of_qubits(m);
+    vectors = np.asarray(vectors, dtype=complex);
+    B = vectors.shape[0];
+    psi = vectors.reshape((B,) + (2,)*m).copy();
+    axes = [ m - i for i in range(m) ];
+    psi = apply_circuit(psi, circuit, axes, snapshots=snapshots);
+    return np.ascontiguousarray(psi).reshape((B, 2**m));
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def check_number_of_qubits(m: int):
+    if m > LIMIT_QUBITS_NATIVE_SIMULATOR:
+        raise ValueError(f'The native simulator is limited to {LIMIT_QUBITS_NATIVE_SIMULATOR} qubits (circuit has {m})!');
+    return;
+
+def basis_states(
+    m: int,
+    indexes: list[int] | NDArray[Shape['*'], Int64],
+) -> NDArray[Shape['B, N'], Complex]:
+    '''
+    Creates the batch of basis states on `m` qbits with the given indexes.
+    '''
+    check_number_of_qubits(m);
+    indexes = np.asarray(indexes, dtype=np.int64);
+    psi = np.zeros(shape=(len(indexes), 2**m), dtype=complex);
+    psi[np.arange(len(indexes)), indexes] = 1.;
+    return psi;
+
+def apply_circuit(
+    psi: NDArray[Any, Complex],
+    circuit: QuantumCircuit,
+    axes: list[int],
+    snapshots: Optional[dict[str, NDArray[Any, Any]]] = None,
+) -> NDArray[Any, Complex]:
+    '''
+    Applies the instructions of a circuit, whose `i`-th qbit lives on axis `axes[i]` of `psi`.
+    '''
+    position = { qubit: i for i, qubit in enumerate(circuit.qubits) };
+    for instruction in circuit.data:
+        op = instruction.operation;
+        axes_op = [ axes[position[qubit]] for qubit in instruction.qubits ];
+        if snapshots is not None and op.name in [ 'save_probabilities', 'save_statevector' ]:
+            snapshots[op.label] = capture_snapshot(psi, op.name, axes_op);
+            continue;
+        psi = apply_operation(psi, op, axes_op);
+    if circuit.global_phase != 0:
+        psi = psi * np.exp(1j * float(circuit.global_phase));
+    return psi;
+
+def apply_operation(
+    psi: NDArray[Any, Complex],
+    op: QkInstruction,
+    axes: list[int],
+) -> NDArray[Any, Complex]:
+    '''
+    Applies a single instruction, whose `i`-th qbit lives on axis `axes[i]` of `psi`.
+    '''
+    name = op.name;
+    if name in _IGNORED_INSTRUCTIONS or name.startswith('save_'):
+        return psi;
+    if name in _NON_UNITARY_INSTRUCTIONS or getattr(op, 'condition', None) is not None:
+        raise ValueError(f'The native simulator cannot apply the non-unitary instruction \'{name}\'!');
+
+    if name == 'x':
+        return np.flip(psi, axis=axes[0]);
+
+    if name == 'diagonal':
+        k = len(axes);
+        diag = np.asarray(op.params, dtype=complex).reshape((2,)*k);
+        # NOTE: axis j of `diag` corresponds to qbit k - 1 - j of the gate.
+        axes_diag = axes[::-1];
+        order = np.argsort(axes_diag);
+        shape = [1] * psi.ndim;
+        for ax in axes_diag:
+            shape[ax] = 2;
+        return psi * diag.transpose(order).reshape(shape);
+
+    if isinstance(op, QkControlledGate) and not requires_clean_ancillas(op):
+        c = op.num_ctrl_qubits;
+        base = op.base_gate;
+        axes_controls = axes[:c];
+        axes_target = axes[c:c + base.num_qubits];
+        # NOTE: further qbits (e.g. dirty ancillas of v-chain decompositions) are left unchanged.
+        index = [ slice(None) ] * psi.ndim;
+        for i, ax in enumerate(axes_controls):
+            index[ax] = (op.ctrl_state >> i) & 1;
+        index = tuple(index);
+        axes_sub = [ ax - sum(1 for ax_c in axes_controls if ax_c < ax) for ax in axes_target ];
+        psi[index] = apply_operation(psi[index], base, axes_sub);
+        return psi;
+
+    if hasattr(op, '__array__') and (len(axes) <= _MAX_QUBITS_DENSE_OPERATION or op.definition is None):
+        return apply_matrix(psi, np.asarray(op.to_matrix(), dtype=complex), axes);
+
+    if op.definition is not None:
+        return apply_circuit(psi, op.definition, axes);
+
+    raise ValueError(f'The native simulator cannot apply the instruction \'{name}\'!');
+
+def requires_clean_ancillas(op: QkControlledGate) -> bool:
+    '''
+    Determines whether a controlled gate acts on further qbits (e.g. `mcx` in mode `'v-chain'`),
+    which must be in state `|0⟩` for the gate to act as the ideal controlled gate.
+    Such gates are applied via their definitions.
+    '''
+    num_ancillas = op.num_qubits - op.num_ctrl_qubits - op.base_gate.num_qubits;
+    return num_ancillas > 0 and not getattr(op, '_dirty_ancillas', True) and op.definition is not None;
+
+def apply_matrix(
+    psi: NDArray[Any, Complex],
+    U: NDArray[Shape['N, N'], Complex],
+    axes: list[int],
+) -> NDArray[Any, Complex]:
+    '''
+    Contracts a `2^k x 2^k` unitary (in qiskit's ordering) with the axes of the `k` qbits it acts upon.
+    '''
+    k = len(axes);
+    if k == 1 and U[0, 1] == 0 and U[1, 0] == 0:
+        # NOTE: diagonal single-qbit gates (phases) are applied in place.
+        shape = [1] * psi.ndim;
+        shape[axes[0]] = 2;
+        psi *= np.diag(U).reshape(shape);
+        return psi;
+    U = U.reshape((2,)*(2*k));
+    # NOTE: the input indices of `U` correspond to qbits k - 1, ..., 0 of the gate.
+    axes_in = axes[::-1];
+    psi = np.tensordot(U, psi, axes=(list(range(k, 2*k)), axes_in));
+    return np.moveaxis(psi, list(range(k)), axes_in);
+
+def capture_snapshot(
+    psi: NDArray[Any, Complex],
+    name: str,
+    axes: list[int],
+) -> NDArray[Shape['B, *'], Any]:
+    '''
+    Captures the probabilities over, resp. the state vector of, the qbits living on the given axes
+    (in qiskit's ordering, i.e. bit `i` of an index is the value of the `i`-th of these qbits).
+    '''
+    B = psi.shape[0];
+    k = len(axes);
+    # NOTE: the most significant qbit comes first.
+    axes_out = axes[::-1];
+    if name == 'save_statevector':
+        psi = np.moveaxis(psi, axes_out, list(range(1, k + 1)));
+        # NOTE: copy, as the state is subsequently modified in place.
+        return np.array(psi, copy=True, order='C').reshape((B, 2**k));
+    probs = np.abs(psi)**2;
+    axes_traced = tuple(ax for ax in range(1, psi.ndim) if ax not in axes);
+    probs = probs.sum(axis=axes_traced, keepdims=True);
+    probs = np.moveaxis(probs, axes_out, list(range(1, k + 1)));
+    return np.ascontiguousarray(probs).reshape((B, 2**k));
@@ -11,6 +11,7 @@ from src.thirdparty.render import *;
 from src.thirdparty.types import *;
 
 from src.api import *;
+from src.models.quantum.simulator import *;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
@@ -18,6 +19,8 @@ from src.api import *;
 
 __all__ = [
     'get_ouput_state_of_circuit',
+    'get_ouput_states_of_circuit',
+    'get_snapshots_of_circuit',
     'plot_ouput_state_of_circuit',
     'PLOT_VALUES',
 ];
@@ -26,12 +29,12 @@ __all__ = [
 # METHODS - compute output state for test purposes
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-@connect_to_backend(option=BACKEND_SIMULATOR.QASM)
 def get_ouput_state_of_circuit(
-    option: BACKEND | BACKEND_SIMULATOR,
-    backend: QkBackend,
     circuit: QuantumCircuit,
     state: Optional[list[Literal[0]|Literal[1]]] = None,
+    threshold: float = 0.,
+    top_k: Optional[int] = None,
+    option: BACKEND_SIMULATOR = BACKEND_SIMULATOR.NATIVE,
 ) -> dict[str, complex]:
     '''
     Extends the circuit, so that an initial state is forced
@@ -40,53 +43,121 @@ def get_ouput_state_of_circuit(
     @inputs
     - `ciruit` - the quantum circuit.
     - `state` - (optional) desired input (basis) state. Defaults to `[0, 0, ..., 0]`.
+    - `threshold` - <float> (optional) only components with probability `≥ threshold` are returned.
+    - `top_k` - <integer | None> (optional) only the `k` components of largest magnitude are returned.
+    - `option` - <enum> (optional) simulator used to compute the state.
+        Defaults to `BACKEND_SIMULATOR.NATIVE`, which computes the state in-process.
+        Circuits, which the native simulator cannot handle, are passed on to Aer.
 
     @returns
     The output state as a vector represented as a dictionary.
     '''
-    # clone circuit and extract shape:
-    circuit = circuit.copy().decompose();
-    m = circuit.num_qubits;
-    n = circuit.num_clbits;
-    a = circuit.num_ancillas;
-
-    # set input state if not set:
-    if state is None:
-        state = [0]*m;
-
-    # extend the circuit with initialisation + state capture.
-    test_circuit = QuantumCircuit(m, n);
-    for index, value in zip(range(m), state):
-        if value == 1:
-            test_circuit.x(index);
-    test_circuit.append(circuit, range(m), range(n));
-    test_circuit.save_statevector();
-    test_circuit = test_circuit.decompose();
-
-    # create and run a single job in the simulator
-    job = qk_execute(
-        experiments = test_circuit,
-        backend = backend,
-        shots = 1,
-    );
-
-    # wait for job to be finished and store results:
-    if not job.done():
-        job.wait_for_final_state(timeout=30);
-    result = job.result();
-
-    # extract results as a vector
-    try:
-        vector = result.get_statevector(test_circuit);
-    except:
+    vector = None;
+    if option == BACKEND_SIMULATOR.NATIVE:
+        try:
+            vector = simulate_statevector(circuit=circuit, state=state);
+        except ValueError:
+            vector = None;
+    if vector is None:
+        option_aer = option if option != BACKEND_SIMULATOR.NATIVE else BACKEND_SIMULATOR.QASM;
+        vector = get_ouput_vector_of_circuit_aer(circuit=circuit, state=state, option=option_aer);
+    if vector is None:
         # if this fails, then return empty state:
         return dict();
 
     # store state as a dictionary for ease of use:
-    state_out = convert_state_to_dictionary(vector, sort=True, clean=True);
+    state_out = convert_state_to_dictionary(vector, sort=True, clean=True, threshold=threshold, top_k=top_k);
 
     return state_out;
 
+def get_ouput_states_of_circuit(
+    circuit: QuantumCircuit,
+    states: Optional[list[list[Literal[0]|Literal[1]]]] = None,
+    option: BACKEND_SIMULATOR = BACKEND_SIMULATOR.NATIVE,
+) -> Optional[NDArray[Shape['B, N'], Complex]]:
+    '''
+    Captures the output states of a circuit for many input basis states in a single simulation
+    (e.g. to verify the truth table of an oracle).
+
+    @inputs
+    - `ciruit` - the quantum circuit.
+    - `states` - (optional) list of `B` input (basis) states. Defaults to all `2^m` basis states.
+    - `option` - <enum> (optional) simulator used to compute the states.
+        Defaults to `BACKEND_SIMULATOR.NATIVE`, which evolves all inputs together in-process.
+        Otherwise (or if the native simulator cannot handle the circuit)
+        the unitary of the circuit is computed once by Aer and its columns are extracted.
+
+    @returns
+    array of shape `(B, 2^m)` of amplitudes, whose `b`-th row is the output state for the `b`-th input
+    (in qiskit's ordering, i.e. bit `i` of a column index is the value of qbit `i`).
+    '''
+    if option == BACKEND_SIMULATOR.NATIVE:
+        try:
+            return simulate_statevectors(circuit=circuit, states=states);
+        except ValueError:
+            pass;
+
+    U = get_unitary_of_circuit_aer(circuit=circuit);
+    if U is None:
+        return None;
+    if states is None:
+        return U.T.copy();
+    indexes = [ sum(int(value) << i for i, value in enumerate(state)) for state in states ];
+    return U[:, indexes].T.copy();
+
+def get_snapshots_of_circuit(
+    circuit: QuantumCircuit,
+    state: Optional[list[Literal[0]|Literal[1]]] = None,
+    option: BACKEND_SIMULATOR = BACKEND_SIMULATOR.NATIVE,
+) -> dict[str, NDArray[Shape['*'], Any]]:
+    '''
+    Captures the labelled snapshots (`save_probabilities` / `save_statevector` instructions)
+    of a circuit in a single simulation run.
+
+    @inputs
+    - `ciruit` - the quantum circuit.
+    - `state` - (optional) desired input (basis) state. Defaults to `[0, 0, ..., 0]`.
+    - `option` - <enum> (optional) simulator used to compute the snapshots.
+        Defaults to `BACKEND_SIMULATOR.NATIVE`.
+        Circuits, which the native simulator cannot handle, are passed on to Aer.
+
+    @returns
+    dictionary of snapshots by label.
+    '''
+    if option == BACKEND_SIMULATOR.NATIVE:
+        try:
+            return simulate_snapshots(circuit=circuit, state=state);
+        except ValueError:
+            option = BACKEND_SIMULATOR.AER;
+
+    with CreateBackend(option=option) as (_, backend):
+        if backend is None:
+            return dict();
+        m = circuit.num_qubits;
+        if state is None:
+            state = [0]*m;
+        test_circuit = QuantumCircuit(*circuit.qregs, *circuit.cregs);
+        for index, value in zip(range(m), state):
+            if value == 1:
+                test_circuit.x(index);
+        test_circuit.compose(circuit, inplace=True);
+        job = qk_execute(
+            experiments = test_circuit,
+            backend = backend,
+            shots = 1,
+        );
+        if not job.done():
+            job.wait_for_final_state(timeout=30, wait=0.05);
+        try:
+            data = job.result().data(0);
+        except:
+            return dict();
+        return {
+            label: np.asarray(values)
+            for label, values in data.items()
+            if label not in [ 'counts', 'memory' ]
+        };
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # METHODS - plot output state for test purposes
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -96,6 +167,7 @@ def plot_ouput_state_of_circuit(
     state: Optional[list[Literal[0]|Literal[1]]] = None,
     sort_by: Optional[Callable[[str, complex], Any]] = None,
     filter_by: Optional[Callable[[str, complex], bool]] = None,
+    threshold: float = 0.,
     # options for plots:
     mode: PLOT_VALUES = PLOT_VALUES.POWER,
     title: str = 'State of output under input {state} \n ({part})',
@@ -113,6 +185,8 @@ def plot_ouput_state_of_circuit(
     - `state` - (optional) desired input (basis) state. Defaults to `[0, 0, ..., 0]`.
     - `sort_by` - <function> sort components of output state by key/value.
     - `filter_by` - <function> filter components of output state by key/value.
+    - `threshold` - <float> (optional) only components with probability `≥ threshold` are considered.
+        Unlike `filter_by`, this is applied before the keys of the components are formed.
 
     options for plots:
 
@@ -138,7 +212,7 @@ def plot_ouput_state_of_circuit(
         state = [0]*m;
 
     # get state and optionally sort:
-    state_out = get_ouput_state_of_circuit(circuit=circuit, state=state);
+    state_out = get_ouput_state_of_circuit(circuit=circuit, state=state, threshold=threshold);
     if len(state_out) == 0:
         display(HTML('<p style="color:red;"><b>[WARNING]</b> Output state was empty. Plot cancelled.</p>'))
         return;
@@ -204,3 +278,91 @@ def plot_ouput_state_of_circuit(
     ax.set_xticklabels(X);
 
     return fig;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY METHODS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def get_ouput_vector_of_circuit_aer(
+    circuit: QuantumCircuit,
+    state: Optional[list[Literal[0]|Literal[1]]] = None,
+    option: BACKEND_SIMULATOR = BACKEND_SIMULATOR.QASM,
+) -> Optional[QkStatevector]:
+    '''
+    Extends the circuit, so that an initial state is forced
+    and captures the output state as a vector (without measuring it).
+
+    @inputs
+    - `ciruit` - the quantum circuit.
+    - `state` - (optional) desired input (basis) state. Defaults to `[0, 0, ..., 0]`.
+    - `option` - <enum> (optional) the Aer simulator to be used.
+
+    @returns
+    The output state as a vector computed by an Aer simulator job (or `None` if this fails).
+    '''
+    with CreateBackend(option=option) as (_, backend):
+        if backend is None:
+            return None;
+
+        # clone circuit and extract shape:
+        circuit = circuit.copy().decompose();
+        m = circuit.num_qubits;
+        n = circuit.num_clbits;
+        a = circuit.num_ancillas;
+
+        # set input state if not set:
+        if state is None:
+            state = [0]*m;
+
+        # extend the circuit with initialisation + state capture.
+        test_circuit = QuantumCircuit(m, n);
+        for index, value in zip(range(m), state):
+            if value == 1:
+                test_circuit.x(index);
+        test_circuit.append(circuit, range(m), range(n));
+        test_circuit.save_statevector();
+        test_circuit = test_circuit.decompose();
+
+        # create and run a single job in the simulator
+        job = qk_execute(
+            experiments = test_circuit,
+            backend = backend,
+            shots = 1,
+        );
+
+        # wait for job to be finished and store results:
+        if not job.done():
+            # NOTE: poll frequently (the default interval of 5s dominates the runtime for local simulations).
+            job.wait_for_final_state(timeout=30, wait=0.05);
+        result = job.result();
+
+        # extract results as a vector
+        try:
+            return result.get_statevector(test_circuit);
+        except:
+            return None;
+
+def get_unitary_of_circuit_aer(circuit: QuantumCircuit) -> Optional[NDArray[Shape['N, N'], Complex]]:
+    '''
+    Computes the unitary of a circuit via a single job in Aer's unitary simulator.
+
+    @returns
+    The unitary as a matrix (or `None` if this fails).
+
+    NOTE: The result may differ from the exact unitary by a global phase.
+    '''
+    with CreateBackend(option=BACKEND_SIMULATOR.UNITARY) as (_, backend):
+        if backend is None:
+            return None;
+        test_circuit = circuit.copy().decompose();
+        job = qk_execute(
+            experiments = test_circuit,
+            backend = backend,
+            shots = 1,
+        );
+        if not job.done():
+            job.wait_for_final_state(timeout=30, wait=0.05);
+        try:
+            return np.asarray(job.result().get_unitary(test_circuit), dtype=complex);
+        except:
+            return None;
@@ -17,6 +17,8 @@ from src.parsers.methods import *;
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'parse_file_as_dimacs',
+    'parse_lines_as_dimacs',
     'parse_text_as_dimacs',
 ];
 
@@ -35,7 +37,69 @@ TYPE_CNF: TypeAlias = list[TYPE_DISJ];
 # MAIN METHODS string -> Expression
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-def parse_text_as_dimacs(text: str) -> TYPE_CNF:
+def parse_text_as_dimacs(text: str, validate: bool = False) -> TYPE_CNF:
+    '''
+    Parses text in the DIMACS format to a list of clauses.
+
+    @inputs
+    - `text` - <string> contents of a DIMACS cnf file.
+    - `validate` - <boolean> if `true`, the text is first validated against the full grammar
+        (slow for large problems). Otherwise (default) the text is read line by line.
+    '''
+    if validate:
+        return parse_text_as_dimacs_via_grammar(text);
+    return list(parse_lines_as_dimacs(text.splitlines()));
+
+def parse_file_as_dimacs(path: str) -> Generator[TYPE_DISJ, None, None]:
+    '''
+    Lazily reads the clauses of a file in the DIMACS format.
+    The file is read line by line and never held in memory as a whole.
+    '''
+    with open(path, 'r') as fp:
+        yield from parse_lines_as_dimacs(fp);
+    return;
+
+def parse_lines_as_dimacs(lines: Iterable[str]) -> Generator[TYPE_DISJ, None, None]:
+    '''
+    Lazily parses lines in the DIMACS format to clauses.
+
+    NOTE: Unlike the grammar-based parser, this does not validate the header
+    and simply yields a clause each time a terminating `0` is read.
+    Reading stops at a line starting with `%` (end-of-file marker used e.g. in the SATLIB benchmarks).
+    '''
+    clause: TYPE_DISJ = [];
+    for lineno, line in enumerate(lines, start=1):
+        line = line.strip();
+        if line == '' or line.startswith('c'):
+            continue;
+        if line.startswith('%'):
+            break;
+        if line.startswith('p'):
+            # NOTE: the instructions are superfluous
+            if not re.match(pattern=r'^p\s+cnf(\s|$)', string=line):
+                raise Exception(f'Could not parse instruction in line {lineno} with \x1b[1m{_GRAMMAR_NAME}\x1b[0m.');
+            continue;
+        for word in line.split():
+            try:
+                value = int(word);
+            except:
+                raise Exception(f'Could not read literal \x1b[1m{word}\x1b[0m in line {lineno} with \x1b[1m{_GRAMMAR_NAME}\x1b[0m.');
+            if value == 0:
+                yield clause;
+                clause = [];
+            # NOTE: indexes are 1-based in text file ---> replace by 0-based
+            elif value > 0:
+                clause.append((1, value - 1));
+            else:
+                clause.append((0, -value - 1));
+    if len(clause) > 0:
+        raise Exception(f'Could not parse text with \x1b[1m{_GRAMMAR_NAME}\x1b[0m: last clause is not terminated by 0.');
+    return;
+
+def parse_text_as_dimacs_via_grammar(text: str) -> TYPE_CNF:
+    '''
+    Parses text in the DIMACS format via the (Earley) grammar.
+    '''
     try:
         u = tokenise_input(
             grammar_name = _GRAMMAR_NAME,
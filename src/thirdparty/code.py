@@ -5,6 +5,7 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from collections import OrderedDict;
 from functools import partial;
 from functools import reduce;
 from functools import wraps;
@@ -63,6 +64,7 @@ __all__ = [
     'MISSING',
     'Nothing',
     'Ok',
+    'OrderedDict',
     'Option',
     'partial',
     'reduce',
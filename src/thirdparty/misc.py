@@ -8,12 +8,14 @@
 from datetime import datetime;
 from datetime import timedelta;
 from functools import wraps;
+from hashlib import sha256;
 from textwrap import dedent as textwrap_dedent;
 from textwrap import dedent;
 from typing import Callable;
 from typing import TypeVar;
 import lorem;
 import re;
+import zlib;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # MODIFICATIONS
@@ -74,5 +76,7 @@ __all__ = [
     'dedent',
     'lorem',
     're',
+    'sha256',
     'timedelta',
+    'zlib',
 ];
@@ -12,6 +12,8 @@ from qiskit import Aer as QkBackendAer;
 from qiskit import ClassicalRegister;
 from qiskit import IBMQ;
 from qiskit import QuantumCircuit;
+from qiskit.circuit import ControlledGate as QkControlledGate;
+from qiskit.circuit import Instruction as QkInstruction;
 from qiskit.circuit import Parameter as QkParameter;
 from qiskit.circuit.gate import Gate as QkGate;
 from qiskit import QuantumRegister;
@@ -19,10 +21,13 @@ from qiskit import assemble as qk_assemble;
 from qiskit import execute as qk_execute;
 from qiskit import transpile as qk_transpile;
 from qiskit import visualization as QkVisualisation;
+from qiskit.circuit.library import Diagonal as QkDiagonal;
 from qiskit.circuit.library import MCXGate as QkControlledX;
 from qiskit.extensions import UnitaryGate as QkUnitaryGate;
 from qiskit.providers import ibmq;
 from qiskit.providers import Backend as QkBackend;
+from qiskit.providers import JobStatus as QkJobStatus;
+from qiskit.providers.jobstatus import JOB_FINAL_STATES as QK_JOB_FINAL_STATES;
 from qiskit.providers.ibmq.job.ibmqjob import IBMQJob;
 from qiskit.providers.ibmq.ibmqbackend import IBMQBackend;
 from qiskit.providers.ibmq.ibmqbackend import IBMQSimulator;
@@ -34,6 +39,8 @@ from qiskit.quantum_info import random_unitary as qk_random_unitary;
 from qiskit.result.result import Result as QkResult;
 from qiskit.tools import jupyter as QkJupyter;
 from qiskit_textbook import problems as QkProblems;
+from typing import Generator;
+from typing import Optional;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # MODIFICATIONS
@@ -79,6 +86,31 @@ class BACKEND_SIMULATOR(Enum):
     STATE_VECTOR = 'simulator_statevector';
     # Matrix Product State
     STATE_MATRIXPRODUCT = 'simulator_mps';
+    # In-process NumPy statevector engine (no jobs)
+    NATIVE = 'native_statevector';
+    # Choice of simulator based upon an analysis of the circuit
+    AUTO = 'auto';
+
+def aer_backend_name(option: BACKEND_SIMULATOR) -> str:
+    '''
+    Returns the name of the Aer backend for a simulator option.
+
+    NOTE: The names of the special simulators refer to IBM's cloud simulators,
+    whereas Aer provides these methods under different names.
+    '''
+    match option:
+        case BACKEND_SIMULATOR.CLIFFORD:
+            return 'aer_simulator_stabilizer';
+        case BACKEND_SIMULATOR.CLIFFORD_EXTENDED:
+            return 'aer_simulator_extended_stabilizer';
+        case BACKEND_SIMULATOR.STATE_VECTOR:
+            return 'aer_simulator_statevector';
+        case BACKEND_SIMULATOR.STATE_MATRIXPRODUCT:
+            return 'aer_simulator_matrix_product_state';
+        case BACKEND_SIMULATOR.NATIVE | BACKEND_SIMULATOR.AUTO:
+            return BACKEND_SIMULATOR.AER.value;
+        case _:
+            return option.value;
 
 class DRAW_MODE(Enum):
     # images with color rendered purely in Python using matplotlib.
@@ -130,10 +162,44 @@ def qk_unitary_gate_pair(
     u_inv.name = f'${label}^{{\\dagger}}$';
     return (u, u_inv);
 
+def qk_mcz(
+    circuit: QuantumCircuit,
+    controls: list[int],
+    target: int,
+    ancillas: Optional[list[int]] = None,
+):
+    '''
+    Appends a multi-controlled Z-gate to a circuit (in place).
+
+    @inputs
+    - `circuit` - the circuit to be modified.
+    - `controls` - <[integer]> the control qubits.
+    - `target` - <integer> the target qubit.
+    - `ancillas` - <[integer]> (optional) qubits, which may be used as dirty ancillas
+        (i.e. in an arbitrary state, which is restored).
+        These reduce the depth of the decomposition of the gate.
+    '''
+    if len(controls) == 0:
+        circuit.z(target);
+        return;
+    ancillas = ancillas or [];
+    k = len(controls);
+    circuit.h(target);
+    if k >= 3 and len(ancillas) >= k - 2:
+        circuit.mcx(controls, target, ancilla_qubits=ancillas[:k-2], mode='v-chain-dirty');
+    elif k >= 5 and len(ancillas) >= 1:
+        circuit.mcx(controls, target, ancilla_qubits=ancillas[:1], mode='recursion');
+    else:
+        circuit.mcx(controls, target);
+    circuit.h(target);
+    return;
+
 def convert_state_to_dictionary(
     vector: QkStatevector,
     sort: bool = False,
     clean: bool = False,
+    threshold: float = 0.,
+    top_k: Optional[int] = None,
 ) -> dict[str, complex]:
     '''
     Converts a qiskit state vector to a dictionary object.
@@ -147,47 +213,94 @@ def convert_state_to_dictionary(
     qbit3 = 0
     qbit4 = 1
     ```
+
+    @inputs
+    - `vector` - the state vector.
+    - `sort` - <boolean> if `true`, the keys are sorted lexicographically.
+    - `clean` - <boolean> if `true`, real and imaginary parts within machine error of 0 are set to 0.
+    - `threshold` - <float> (optional) only components with probability `≥ threshold` are kept.
+    - `top_k` - <integer | None> (optional) only the `k` components of largest magnitude are kept
+        (in descending order of magnitude, unless `sort=true`).
     '''
-    vector = np.asarray(vector).reshape(vector.dims());
-
-    MACHINE_ERROR = .5e-15;
-    def remove_machine_error(x: complex) -> complex:
-        return (0 if abs(x.real) < MACHINE_ERROR  else x.real) \
-            + (0 if abs(x.imag) < MACHINE_ERROR else x.imag)*1j;
-
-    iterator = np.nditer(vector, flags=['f_index', 'multi_index'])
-    state = dict();
-    for obj in iterator:
-        e = iterator.multi_index;
-        key = (''.join(map(str, e)))[::-1];
-        value = complex(vector[e]);
-        state[key] = value;
-    if sort:
-        state = dict(sorted(state.items(), key=lambda pair: pair[0]));
+    return dict(iterate_state_components(
+        vector = vector,
+        sort = sort,
+        clean = clean,
+        threshold = threshold,
+        top_k = top_k,
+    ));
+
+def iterate_state_components(
+    vector: QkStatevector,
+    sort: bool = False,
+    clean: bool = False,
+    threshold: float = 0.,
+    top_k: Optional[int] = None,
+) -> Generator[tuple[str, complex], None, None]:
+    '''
+    Yields the components of a qiskit state vector as pairs `(key, value)` lazily.
+    See `convert_state_to_dictionary` for the meaning of keys and options.
+
+    NOTE: The selection of components is carried out with vectorised masks;
+    only the keys of the selected components are formatted (on demand).
+    '''
+    amplitudes = np.asarray(vector, dtype=complex).ravel();
+    N = len(amplitudes);
+    n = max(N - 1, 0).bit_length();
+
     if clean:
-        state = {key: remove_machine_error(value) for key, value in state.items()};
-    return state;
+        MACHINE_ERROR = .5e-15;
+        real = np.where(np.abs(amplitudes.real) < MACHINE_ERROR, 0., amplitudes.real);
+        imag = np.where(np.abs(amplitudes.imag) < MACHINE_ERROR, 0., amplitudes.imag);
+        amplitudes = real + 1j*imag;
+
+    # NOTE: bit i of an index is the value of qbit i.
+    indexes = np.arange(N, dtype=np.int64);
+    if threshold > 0:
+        indexes = np.flatnonzero(np.abs(amplitudes)**2 >= threshold);
+    if top_k is not None and top_k < len(indexes):
+        magnitudes = np.abs(amplitudes[indexes]);
+        selection = np.argpartition(-magnitudes, top_k - 1)[:top_k] if top_k > 0 else np.zeros(shape=(0,), dtype=np.int64);
+        indexes = indexes[selection];
+    if sort:
+        # lexicographic order of keys = order of bit-reversed indexes:
+        reversed_indexes = np.zeros(shape=indexes.shape, dtype=np.int64);
+        for i in range(n):
+            reversed_indexes |= ((indexes >> i) & 1) << (n - 1 - i);
+        indexes = indexes[np.argsort(reversed_indexes, kind='stable')];
+    elif top_k is not None:
+        indexes = indexes[np.argsort(-np.abs(amplitudes[indexes]), kind='stable')];
+
+    fmt = f'0{n}b';
+    for k, value in zip(indexes.tolist(), amplitudes[indexes].tolist()):
+        yield (format(k, fmt)[::-1] if n > 0 else ''), value;
+    return;
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # EXPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 __all__ = [
+    'aer_backend_name',
     'backend_from_name',
     'BACKEND',
     'BACKEND_SIMULATOR',
     'ClassicalRegister',
     'convert_state_to_dictionary',
+    'iterate_state_components',
     'DRAW_MODE',
     'ibmq',
     'IBMQ',
     'IBMQBackend',
     'IBMQJob',
     'IBMQSimulator',
+    'QkControlledGate',
     'QkControlledX',
+    'QkDiagonal',
     'qk',
     'qk_assemble',
     'qk_execute',
+    'qk_mcz',
     'qk_unitary_gate_pair',
     'qk_random_unitary',
     'qk_transpile',
@@ -195,10 +308,13 @@ __all__ = [
     'QkBackend',
     'QkBackendAer',
     'QkGate',
+    'QkInstruction',
     'QkJupyter',
     'QkOperator',
     'QkParameter',
     'QkProblems',
+    'QK_JOB_FINAL_STATES',
+    'QkJobStatus',
     'QkResult',
     'QkStatevector',
     'QkUnitaryGate',
@@ -11,10 +11,13 @@ from asyncio import Future;
 from asyncio import ensure_future as asyncio_ensure_future;
 from asyncio import gather as asyncio_gather;
 from asyncio import get_event_loop as asyncio_get_event_loop;
+from asyncio import get_running_loop as asyncio_get_running_loop;
 from asyncio import new_event_loop as asyncio_new_event_loop;
 from asyncio import run as asyncio_run;
 from asyncio import set_event_loop as asyncio_set_event_loop;
 from asyncio import sleep as asyncio_sleep;
+from concurrent.futures import ThreadPoolExecutor;
+from threading import Lock;
 from time import sleep as time_sleep;
 from codetiming import Timer;
 from multiprocessing import Pool;
@@ -27,13 +30,16 @@ __all__ = [
     'asyncio_ensure_future',
     'asyncio_gather',
     'asyncio_get_event_loop',
+    'asyncio_get_running_loop',
     'asyncio_new_event_loop',
     'asyncio_run',
     'asyncio_set_event_loop',
     'asyncio_sleep',
     'AbstractEventLoop',
     'Future',
+    'Lock',
     'Pool',
+    'ThreadPoolExecutor',
     'time_sleep',
     'Timer',
 ];
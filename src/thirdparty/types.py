@@ -5,6 +5,7 @@
 # IMPORTS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+from array import array;
 from enum import Enum;
 from io import BytesIO;
 from nptyping import NDArray;
@@ -20,6 +21,7 @@ from nptyping import Int64;
 from nptyping import Float;
 from nptyping import Float32;
 from nptyping import Float64;
+from nptyping import Complex;
 from numpy import uint8;
 from numpy import int32;
 from numpy import int64;
@@ -35,6 +37,8 @@ from typing import ClassVar;
 from typing import Coroutine;
 from typing import Generator;
 from typing import Generic;
+from typing import Iterable;
+from typing import Mapping;
 from typing import Optional;
 from typing import Type;
 from typing import TypeAlias;
@@ -49,11 +53,13 @@ from typing import Literal;
 
 __all__ = [
     'Any',
+    'array',
     'Awaitable',
     'Bool',
     'BytesIO',
     'Callable',
     'ClassVar',
+    'Complex',
     'complex128',
     'complex64',
     'Concatenate',
@@ -72,7 +78,9 @@ __all__ = [
     'int32',
     'Int64',
     'int64',
+    'Iterable',
     'Literal',
+    'Mapping',
     'NDArray',
     'Optional',
     'ParamSpec',
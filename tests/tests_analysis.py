@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+
+from src.api.analysis import *;
+
+# NOTE: Aer is imported upon the first simulation (which may warn about its packaging).
+pytestmark = pytest.mark.filterwarnings('ignore::ImportWarning');
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def run_on_chosen_simulator(circuit: QuantumCircuit) -> tuple[BACKEND_SIMULATOR, dict[str, int]]:
+    '''
+    Chooses a simulator for the circuit and runs the circuit on it.
+    '''
+    # NOTE: Aer is loaded directly, as pytest touches the lazy wrapper `QkBackendAer` during collection.
+    import qiskit_aer;
+    option = choose_simulator(circuit);
+    backend = qiskit_aer.Aer.get_backend(aer_backend_name(option));
+    job = qk_execute(circuit, backend, shots=16, seed_simulator=7);
+    return option, job.result().get_counts();
+
+def create_wide_circuit(m: int = 30) -> QuantumCircuit:
+    '''
+    Creates a wide circuit, whose gates cross the middle cut many times (but which creates little entanglement).
+    '''
+    circuit = QuantumCircuit(m);
+    circuit.h(0);
+    circuit.x(range(1, m, 2));
+    for _ in range(2):
+        for i in range(1, m // 2):
+            circuit.cx(i, m - 1 - i);
+    return circuit;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_analyse_circuit():
+    circuit = QuantumCircuit(4);
+    circuit.h(0);
+    circuit.cx(0, 3);
+    circuit.t(1);
+    circuit.rz(pi/2, 2);
+    circuit.ccx(0, 1, 2);
+    analysis = analyse_circuit(circuit);
+    assert analysis.num_qubits == 4;
+    # `ccx` is expanded into 7 `t`/`tdg` gates:
+    assert analysis.num_non_clifford == 1 + 7;
+    assert 'rz' in analysis.gates and 'ccx' not in analysis.gates;
+    assert analysis.max_cut == 2;
+
+def test_clifford_circuit():
+    circuit = QuantumCircuit(3);
+    circuit.h(0);
+    circuit.cx(0, 1);
+    circuit.iswap(1, 2);
+    circuit.measure_all();
+    option, counts = run_on_chosen_simulator(circuit);
+    assert option == BACKEND_SIMULATOR.CLIFFORD;
+    assert sum(counts.values()) == 16;
+
+def test_clifford_rotation_circuit():
+    # rz(π/2) is a Clifford gate, but not a basis gate of the stabiliser method:
+    circuit = QuantumCircuit(2);
+    circuit.h(0);
+    circuit.rz(pi/2, 0);
+    circuit.cx(0, 1);
+    circuit.measure_all();
+    option, counts = run_on_chosen_simulator(circuit);
+    assert option == BACKEND_SIMULATOR.STATE_VECTOR;
+    assert sum(counts.values()) == 16;
+
+def test_wide_circuit_little_entanglement():
+    circuit = QuantumCircuit(30);
+    circuit.h(range(30));
+    circuit.rz(pi/2, 0);
+    for i in range(29):
+        circuit.cx(i, i + 1);
+    circuit.measure_all();
+    option, counts = run_on_chosen_simulator(circuit);
+    assert option == BACKEND_SIMULATOR.STATE_MATRIXPRODUCT;
+    assert sum(counts.values()) == 16;
+
+def test_wide_circuit_few_non_clifford_gates():
+    circuit = create_wide_circuit();
+    circuit.t(0);
+    circuit.p(0.3, 0);
+    circuit.measure_all();
+    option, counts = run_on_chosen_simulator(circuit);
+    assert option == BACKEND_SIMULATOR.CLIFFORD_EXTENDED;
+    assert sum(counts.values()) == 16;
+
+def test_wide_circuit_unsupported_rotation():
+    # arbitrary rotations rx are not basis gates of the extended stabiliser method:
+    circuit = create_wide_circuit();
+    circuit.rx(0.3, 0);
+    circuit.measure_all();
+    option, counts = run_on_chosen_simulator(circuit);
+    assert option == BACKEND_SIMULATOR.STATE_MATRIXPRODUCT;
+    assert sum(counts.values()) == 16;
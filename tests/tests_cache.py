@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+
+from src.algorithms.deutsch_jozsa import *;
+from src.core.cache import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class Builder():
+    '''
+    A builder, which notes its calls.
+    '''
+    def __init__(self):
+        self.calls = [];
+
+    def __call__(self, *args, **kwargs) -> tuple:
+        self.calls.append((args, kwargs));
+        return (args, kwargs);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS - CACHE
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_hits_and_misses():
+    cache = LruCache(maxsize=4);
+    created = [];
+    create = lambda value: (lambda: created.append(value) or value);
+    assert cache.get_or_create('a', create(1)) == 1;
+    assert cache.get_or_create('a', create(2)) == 1;
+    assert cache.get_or_create('b', create(3)) == 3;
+    assert created == [ 1, 3 ];
+    statistics = cache.statistics();
+    assert (statistics.hits, statistics.misses, statistics.size, statistics.maxsize) == (1, 2, 2, 4);
+    assert statistics.hit_rate == pytest.approx(1/3);
+    cache.clear();
+    assert len(cache) == 0 and cache.statistics().hit_rate == 0.;
+
+def test_eviction_of_least_recently_used():
+    cache = LruCache(maxsize=2);
+    cache.get_or_create('a', lambda: 1);
+    cache.get_or_create('b', lambda: 2);
+    # a hit renews the entry:
+    cache.get_or_create('a', lambda: 3);
+    cache.get_or_create('c', lambda: 4);
+    assert 'a' in cache and 'b' not in cache and 'c' in cache;
+    assert len(cache) == 2;
+    assert cache.get_or_create('b', lambda: 5) == 5;
+    assert 'a' not in cache;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS - DECORATOR
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_cached_gate_key_includes_all_arguments():
+    cache = LruCache(maxsize=16);
+    builder = Builder();
+    @cached_gate(cache)
+    def build(*args, **kwargs):
+        return builder(*args, **kwargs);
+    value = build(1, 2, mode='a');
+    assert build(1, 2, mode='a') is value;
+    # every argument (positional and keyword) is part of the key:
+    build(1, 3, mode='a');
+    build(2, 2, mode='a');
+    build(1, 2, mode='b');
+    build(1, 2);
+    assert len(builder.calls) == 5;
+    # the order of keyword arguments is irrelevant:
+    assert build(x=1, y=2) is build(y=2, x=1);
+    assert len(builder.calls) == 6;
+    assert cache.statistics().hits == 2;
+
+def test_cached_gate_distinguishes_builders():
+    cache = LruCache(maxsize=16);
+    @cached_gate(cache)
+    def build_a(k: int) -> str:
+        return f'a{k}';
+    @cached_gate(cache)
+    def build_b(k: int) -> str:
+        return f'b{k}';
+    assert [ build_a(1), build_b(1), build_a(1), build_b(1) ] == [ 'a1', 'b1', 'a1', 'b1' ];
+    assert len(cache) == 2;
+
+def test_cached_gate_default_cache():
+    @cached_gate()
+    def build(k: int) -> list[int]:
+        return [ k ];
+    hits = gate_cache.statistics().hits;
+    assert build(7) is build(7);
+    assert gate_cache.statistics().hits == hits + 1;
+
+def test_deutsch_jozsa_oracle_varies():
+    # the random constant is drawn outside of the cache, so that repeated calls still vary:
+    np.random.seed(4);
+    n = 2;
+    gates = [ deutsch_jozsa_oracle(n=n, oraclenr=1) for _ in range(32) ];
+    outputs = set(
+        int(np.isclose(abs(QkOperator(gate).data[2**n, 0]), 1.))
+        for gate in gates
+    );
+    assert outputs == { 0, 1 };
+    # but the gates themselves are shared:
+    assert len(set(map(id, gates))) == 2;
+    # the balanced oracle is deterministic:
+    assert deutsch_jozsa_oracle(n=n, oraclenr=0) is deutsch_jozsa_oracle(n=n, oraclenr=0);
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import itertools;
+import pytest;
+
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.types import *;
+
+from src.algorithms.grover import *;
+import src.models.boolsat.circuits;
+from src.models.boolsat import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def create_problem(clauses: list[list[tuple[int, int]]]) -> ProblemSAT:
+    problem = ProblemSAT(clauses=clauses);
+    problem.setup();
+    return problem;
+
+def create_random_clauses(rng: np.random.Generator, n: int, Nc: int) -> list[list[tuple[int, int]]]:
+    # NOTE: the variables 0, 1, ..., n - 1 all occur, so that they coincide with the search qubits.
+    clauses = [
+        [ (int(rng.integers(2)), int(index)) for index in rng.choice(n, size=int(rng.integers(1, 4)), replace=False) ]
+        for _ in range(Nc - 1)
+    ];
+    clauses.append([ (int(rng.integers(2)), index) for index in range(n) ]);
+    return clauses;
+
+def models_of(problem: ProblemSAT) -> NDArray[Shape['*'], Bool]:
+    '''
+    Returns for each basis state `|x⟩` of the search qubits, whether `x` is a model.
+    NOTE: Qubit `i` (of little endian basis states) corresponds to variable `i`.
+    '''
+    n = problem.number_of_variables;
+    X = (np.arange(2**n)[:, np.newaxis] >> np.arange(n)) & 1;
+    satisfied, _ = problem.verify_many(X.astype(bool));
+    return satisfied;
+
+def apply_phase_oracle(oracle: QuantumCircuit, n: int, psi: NDArray[Shape['*'], Complex]) -> NDArray[Shape['*'], Complex]:
+    '''
+    Applies the oracle to `|ψ⟩|0...0⟩|−⟩` and returns the state of the search qubits,
+    after asserting that the clause ancillas are clean and that the final qubit remains in `|−⟩`.
+    '''
+    p = oracle.num_qubits - n - 1;
+    minus = np.asarray([ 1, -1 ]) / np.sqrt(2);
+    state = np.kron(minus, np.kron(np.eye(2**p)[0], psi));
+    state = QkStatevector(state).evolve(oracle).data.reshape((2, 2**p, 2**n));
+    assert np.allclose(state[:, 1:, :], 0.);
+    phi = minus @ state[:, 0, :];
+    assert np.isclose(np.linalg.norm(phi), 1.);
+    return phi;
+
+def capacities_by_recursion(p_max: int) -> list[int]:
+    C = [ 1 ];
+    for p in range(1, p_max + 1):
+        C.append(max(g * C[p - g] for g in range(1, p + 1)));
+    return C;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS - CNF ORACLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@pytest.mark.parametrize('code', [ (1,), (0,), (1, 0), (0, 0, 1), (0, 1, 1) ])
+def test_oracle_disjunct(code: tuple[int, ...]):
+    n = len(code);
+    U = QkOperator(oracle_disjunct(code)).data;
+    # the gate is self-inverse, i.e. it restores the inputs (including negative literals):
+    assert np.allclose(U @ U, np.eye(2**(n + 1)));
+    for x in range(2**n):
+        value = any(((x >> i) & 1) == c for i, c in enumerate(code));
+        y = x + (int(value) << n);
+        assert np.isclose(abs(U[y, x]), 1.);
+
+@pytest.mark.parametrize('seed', range(6))
+def test_oracle_cnf_flips_final_qubit(seed: int):
+    rng = np.random.default_rng(seed);
+    n = 3;
+    Nc = int(rng.integers(3, 7));
+    problem = create_problem(create_random_clauses(rng, n=n, Nc=Nc));
+    satisfied = models_of(problem);
+    for max_ancillas in [ None, minimal_ancillas_cnf(Nc) ]:
+        oracle = oracle_cnf(n=n, clauses=problem.clauses, max_ancillas=max_ancillas);
+        N = oracle.num_qubits;
+        for x in range(2**n):
+            # the clause ancillas are returned to |0⟩:
+            state = QkStatevector.from_int(x, 2**N).evolve(oracle);
+            y = x + (int(satisfied[x]) << (N - 1));
+            assert np.isclose(abs(state.data[y]), 1.);
+
+@pytest.mark.parametrize('seed', range(6))
+def test_oracle_cnf_recycled_ancillas(seed: int):
+    rng = np.random.default_rng(seed);
+    n = 4;
+    Nc = int(rng.integers(3, 8));
+    problem = create_problem(create_random_clauses(rng, n=n, Nc=Nc));
+    psi = rng.normal(size=2**n) + 1j * rng.normal(size=2**n);
+    psi /= np.linalg.norm(psi);
+    expected = np.where(models_of(problem), -1., 1.) * psi;
+    for max_ancillas in [ None ] + list(range(minimal_ancillas_cnf(Nc), Nc)):
+        oracle = oracle_cnf(n=n, clauses=problem.clauses, max_ancillas=max_ancillas);
+        assert oracle.num_qubits == n + (Nc if max_ancillas is None else max_ancillas) + 1;
+        assert np.allclose(apply_phase_oracle(oracle, n=n, psi=psi), expected);
+
+def test_oracle_cnf_insufficient_ancillas():
+    # C(4) = 4 < 6 = C(5):
+    problem = create_problem([ [ (1, k) ] for k in range(6) ]);
+    assert minimal_ancillas_cnf(6) == 5;
+    oracle_cnf(n=6, clauses=problem.clauses, max_ancillas=5);
+    with pytest.raises(ValueError):
+        oracle_cnf(n=6, clauses=problem.clauses, max_ancillas=4);
+
+def test_capacities():
+    C = capacities_by_recursion(64);
+    assert src.models.boolsat.circuits._CAPACITIES == C;
+    assert C[:8] == [ 1, 1, 2, 3, 4, 6, 9, 12 ];
+    assert [ src.models.boolsat.circuits.capacity_cnf(p) for p in range(65) ] == [ max(p, c) for p, c in enumerate(C) ];
+    # beyond the tabulated range a lower bound is returned:
+    assert src.models.boolsat.circuits.capacity_cnf(100) >= C[64];
+    # the least number of ancillas is the least p with C(p) ≥ Nc:
+    for Nc in range(1, 100):
+        p = minimal_ancillas_cnf(Nc);
+        assert max(p, C[p]) >= Nc and (p == 0 or max(p - 1, C[p - 1]) < Nc);
+
+def test_grover_algorithm_finds_models():
+    # (x0 ⋁ ¬x1) ⋀ (x1 ⋁ x2) ⋀ (¬x0 ⋁ ¬x2) has the 2 models 100, 011 (as x2x1x0).
+    problem = create_problem([ [ (1, 0), (0, 1) ], [ (1, 1), (1, 2) ], [ (0, 0), (0, 2) ] ]);
+    satisfied = models_of(problem);
+    assert satisfied.sum() == 2;
+    for max_qubits in [ None, 3 + minimal_ancillas_cnf(3) + 1 ]:
+        circuit = grover_algorithm_from_sat(problem=problem, prob=2/8, max_qubits=max_qubits);
+        circuit.remove_final_measurements();
+        probs = QkStatevector(circuit).probabilities(qargs=range(3));
+        assert np.isclose(probs[satisfied].sum(), 1.);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS - DNF PHASE ORACLES
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def phase_oracle_dnf_dense(n: int, codes: list[tuple[int, ...]]) -> NDArray[Shape['*, *'], Complex]:
+    '''
+    The unitary of the (original) dense construction of `phase_oracle_dnf`.
+    '''
+    u = np.ones(shape=[2]*n);
+    for code in codes:
+        u[tuple(code[::-1])] = -1;
+    return np.diag(u.reshape(2**n));
+
+@pytest.mark.parametrize(('n', 'codes', 'diagonal'), [
+    # few conjuncts ⟹ multi-controlled Z-gates:
+    (1, [ (0,) ], False),
+    (3, [ (1, 0, 1) ], False),
+    (4, [ (0, 0, 1, 1), (1, 0, 0, 0), (0, 0, 1, 1) ], False),
+    (5, [ (1, 1, 0, 1, 0), (0, 0, 0, 0, 0), (1, 1, 1, 1, 1) ], False),
+    # many conjuncts ⟹ diagonal gate:
+    (1, [ (0,), (1,) ], True),
+    (2, [ (1, 0), (0, 1) ], True),
+    (3, [ (1, 0, 1), (0, 0, 0), (1, 1, 0) ], True),
+    (4, [ code for code in itertools.product([ 0, 1 ], repeat=4) if sum(code) % 2 == 1 ], True),
+])
+def test_phase_oracle_dnf(n: int, codes: list[tuple[int, ...]], diagonal: bool):
+    circuit = phase_oracle_dnf(n=n, codes=codes);
+    names = [ instruction.operation.name for instruction in circuit.data ];
+    assert (names == [ QkDiagonal([ 1, 1 ]).name ]) == diagonal;
+    assert np.allclose(QkOperator(circuit).data, phase_oracle_dnf_dense(n, codes));
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import itertools;
+
+from src.thirdparty.maths import *;
+
+from src.models.boolsat import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def create_problem(clauses: list[list[tuple[int, int]]]) -> ProblemSAT:
+    problem = ProblemSAT(clauses=clauses);
+    problem.setup();
+    return problem;
+
+def count_models_brute_force(problem: ProblemSAT) -> int:
+    return sum(
+        problem.verify(list(solution))
+        for solution in itertools.product([ False, True ], repeat=problem.number_of_variables)
+    );
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_count_models_brute_force():
+    rng = np.random.default_rng(7);
+    for _ in range(10):
+        n = int(rng.integers(1, 9));
+        clauses = [
+            [ (int(rng.integers(2)), int(index)) for index in rng.choice(n, size=min(n, 3), replace=False) ]
+            for _ in range(int(rng.integers(1, 6)))
+        ];
+        problem = create_problem(clauses);
+        assert count_models(problem, processes=1) == count_models_brute_force(problem);
+
+def test_count_models_relabels_variables():
+    # variables 3, 10, 42 (not contiguous): x3 ⋀ (¬x10 ⋁ x42)
+    problem = create_problem([ [ (1, 3) ], [ (0, 10), (1, 42) ] ]);
+    assert count_models(problem, processes=1) == 3;
+
+def test_count_models_across_words():
+    # 10 variables ⟹ 2¹⁰ assignments span several 64-bit words; only x0 ⋀ x9 is constrained.
+    problem = create_problem([ [ (1, 0) ], [ (1, 9) ] ] + [ [ (1, k), (0, k) ] for k in range(1, 9) ]);
+    assert count_models(problem, processes=1) == 2**8;
+
+def test_count_models_across_chunks():
+    # 23 variables ⟹ 2¹⁷ words, i.e. more than one chunk.
+    problem = create_problem([ [ (1, 0), (1, 22) ] ] + [ [ (1, k), (0, k) ] for k in range(1, 22) ]);
+    assert count_models(problem, processes=1) == 3 * 2**21;
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+
+from src.api.statistics import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class FakeResult():
+    '''
+    Provides the `get_counts` method of job results.
+    '''
+    def __init__(self, counts: dict[str, int] | list[dict[str, int]]):
+        self.counts = counts;
+
+    def get_counts(self):
+        return self.counts;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_from_dict_reverses_qiskit_order():
+    # qiskit: last character = classical bit 0; whitespace separates registers.
+    counts = Counts.from_dict({ '1 01': 3, '0 00': 1 });
+    assert counts.num_bits == 3;
+    assert counts.total == 4;
+    assert counts.to_dict() == { '000': 1, '101': 3 };
+
+def test_from_dict_without_reversal():
+    counts = Counts.from_dict({ '110': 2, '001': 5 }, reverse=False);
+    assert counts.to_dict() == { '001': 5, '110': 2 };
+
+def test_from_dict_too_many_bits():
+    with pytest.raises(ValueError):
+        Counts.from_dict({ '1' * 80: 1 });
+
+def test_from_result_merges_experiments():
+    result = FakeResult([ { '01': 1, '10': 2 }, { '01': 3 }, { '11': 4, '10': 1 } ]);
+    counts = Counts.from_result(result);
+    assert counts.to_dict() == { '01': 3, '10': 4, '11': 4 };
+
+def test_marginalise_and_padding():
+    counts = Counts.from_dict({ '110': 2, '011': 5 }, reverse=False);
+    assert counts.marginalise([ 1 ]).to_dict() == { '1': 7 };
+    assert counts.marginalise([ 0, 2 ]).to_dict(pad=True) == { '00': 0, '01': 5, '10': 2, '11': 0 };
+
+def test_get_counts_falls_back_for_long_keys():
+    result = FakeResult({ '1' + '0' * 69: 2, '0' * 70: 1 });
+    N, counts, [ counts_first ] = get_counts(result, [ 69 ]);
+    assert N == 3;
+    assert counts == { '0' * 69 + '1': 2, '0' * 70: 1 };
+    assert dict(counts_first) == { '0': 1, '1': 2 };
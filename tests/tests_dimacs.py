@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+
+from src.parsers.dimacs import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_parse_lines_multiline_clauses():
+    text = 'c comment\np cnf 3 2\n1 -2 0\n2\n3 0\n';
+    assert parse_text_as_dimacs(text) == [
+        [ (1, 0), (0, 1) ],
+        [ (1, 1), (1, 2) ],
+    ];
+
+def test_parse_lines_satlib_end_marker():
+    # SATLIB files end with `%`, followed by `0` and blank lines:
+    text = 'p cnf 2 1\n1 -2 0\n%\n0\n\n';
+    assert parse_text_as_dimacs(text) == [ [ (1, 0), (0, 1) ] ];
+
+def test_parse_lines_unterminated_clause():
+    with pytest.raises(Exception):
+        parse_text_as_dimacs('p cnf 2 1\n1 -2\n');
+
+def test_parse_lines_invalid_literal():
+    with pytest.raises(Exception):
+        parse_text_as_dimacs('p cnf 2 1\n1 x 0\n');
+
+def test_parse_file_lazily(tmp_path):
+    path = tmp_path / 'problem.cnf';
+    path.write_text('p cnf 2 2\n1 0\n-1 2 0\n%\n0\n');
+    clauses = parse_file_as_dimacs(str(path));
+    assert next(clauses) == [ (1, 0) ];
+    assert list(clauses) == [ [ (0, 0), (1, 1) ] ];
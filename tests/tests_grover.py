@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+from src.thirdparty.types import *;
+
+from src.algorithms.grover import *;
+from src.models.boolsat import *;
+from src.models.quantum.simulator import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def create_problem(clauses: list[list[tuple[int, int]]], name: str = 'SAT problem') -> ProblemSAT:
+    problem = ProblemSAT(name=name, clauses=clauses);
+    problem.setup();
+    return problem;
+
+@pytest.fixture
+def problem() -> ProblemSAT:
+    # (x0 ⋁ ¬x1) ⋀ (x1 ⋁ x2) ⋀ (¬x0 ⋁ ¬x2 ⋁ x3) has 6 models out of 16.
+    return create_problem([ [ (1, 0), (0, 1) ], [ (1, 1), (1, 2) ], [ (0, 0), (0, 2), (1, 3) ] ]);
+
+def simulate_grover_rounds(problem: ProblemSAT, r: int) -> NDArray[Shape['*'], Complex]:
+    '''
+    Simulates `r` rounds of Grover's Algorithm gate by gate
+    and returns the state of the search register
+    (after asserting that the clause ancillas are clean and that the final qubit remains in `|-⟩`).
+    '''
+    n = problem.number_of_variables;
+    grit = grover_iterator_from_sat(problem=problem);
+    N = grit.num_qubits;
+    circuit = QuantumCircuit(N);
+    circuit.x(N - 1);
+    circuit.h(N - 1);
+    circuit.h(range(n));
+    for _ in range(r):
+        circuit.compose(grit, inplace=True);
+    state = simulate_statevector(circuit).reshape((2, 2**(N - n - 1), 2**n));
+    assert np.allclose(state[:, 1:, :], 0.);
+    return np.asarray([ 1, -1 ]) / np.sqrt(2) @ state[:, 0, :];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS - PREDICTIONS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_predict_grover_single_model():
+    prediction = predict_grover(n=4, m=1);
+    # sin(θ)² = 1/16 ⟹ 3 rounds are optimal with success ≈ 0.96.
+    assert int(prediction.rounds) == 3;
+    assert abs(float(prediction.success) - 0.9613) < 1e-3;
+    assert np.isclose(prediction.curve[0], 1/16);
+    assert int(prediction.shots) == 1;
+
+def test_predict_grover_edge_cases():
+    prediction = predict_grover(n=[ 3, 3, 3 ], m=[ 0, 2, 8 ]);
+    # no models:
+    assert prediction.rounds.tolist()[0] == 0;
+    assert prediction.success.tolist()[0] == 0.;
+    assert np.isinf(prediction.shots[0]);
+    # m/2ⁿ = 1/4 ⟹ one round succeeds with certainty.
+    assert prediction.rounds.tolist()[1] == 1;
+    assert np.isclose(prediction.success[1], 1.);
+    # all assignments are models:
+    assert prediction.rounds.tolist()[2] == 0;
+    assert np.isclose(prediction.success[2], 1.);
+
+def test_predict_grover_broadcasts():
+    n = np.arange(2, 10)[:, np.newaxis];
+    m = np.asarray([ 1, 2, 3 ])[np.newaxis, :];
+    prediction = predict_grover(n=n, m=m);
+    assert prediction.rounds.shape == (8, 3);
+    # the default length of the curves covers the optimal numbers of rounds:
+    assert prediction.curve.shape == (8, 3, prediction.rounds.max() + 2);
+    # the optimal number of rounds maximises the curve upto (and including) the first peak:
+    best = np.take_along_axis(prediction.curve, prediction.rounds[..., np.newaxis], axis=-1)[..., 0];
+    assert np.allclose(best, prediction.success);
+    r = np.arange(prediction.curve.shape[-1]);
+    first_peak = np.where(r <= prediction.rounds[..., np.newaxis] + 1, prediction.curve, 0.);
+    assert np.all(first_peak.max(axis=-1) <= prediction.success + 1e-12);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS - EXACT EVOLUTION
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_grover_evolution_agrees_with_simulator(problem: ProblemSAT):
+    evolution = grover_evolution_from_sat(problem);
+    states = evolution.states(r_max=4);
+    for r in range(5):
+        expected = simulate_grover_rounds(problem, r=r);
+        # matrix powers agree with repeated application as well as with the gate by gate simulation:
+        assert np.allclose(evolution.state(r), states[r]);
+        assert np.allclose(evolution.state(r), expected, atol=1e-8);
+
+def test_grover_evolution_agrees_with_prediction(problem: ProblemSAT):
+    evolution = grover_evolution_from_sat(problem);
+    m = int(evolution.satisfied.sum());
+    assert m == count_models(problem, processes=1) == 6;
+    curve, _ = evolution.success_curve(r_max=12);
+    prediction = predict_grover(n=4, m=m, r_max=12);
+    assert np.allclose(curve, prediction.curve);
+
+@pytest.mark.parametrize('m', [ 1, 3, 5 ])
+def test_grover_evolution_success_curve(m: int):
+    n = 5;
+    satisfied = np.zeros(shape=(2**n,), dtype=bool);
+    satisfied[np.random.default_rng(m).choice(2**n, size=m, replace=False)] = True;
+    evolution = GroverEvolution(n=n, satisfied=satisfied);
+    prediction = predict_grover(n=n, m=m, r_max=10);
+    curve, _ = evolution.success_curve(r_max=10);
+    assert np.allclose(curve, prediction.curve);
+    # upto the first peak, the optimal numbers of rounds agree:
+    _, r = evolution.success_curve(r_max=int(prediction.rounds) + 1);
+    assert r == int(prediction.rounds);
+
+def test_grover_evolution_cache(problem: ProblemSAT):
+    grover_evolution_cache.clear();
+    evolution = grover_evolution_from_sat(problem);
+    # problems are identified by their clauses (not by their names):
+    assert grover_evolution_from_sat(create_problem(problem.clauses, name='renamed')) is evolution;
+    other = create_problem([ [ (1, 0), (0, 1) ], [ (1, 1), (1, 2) ] ]);
+    assert grover_evolution_from_sat(other) is not evolution;
+    statistics = grover_evolution_cache.statistics();
+    assert (statistics.hits, statistics.misses) == (1, 2);
+
+def test_grover_evolution_limit():
+    grover_evolution_cache.clear();
+    n = LIMIT_QUBITS_EXACT_GROVER + 1;
+    problem = create_problem([ [ (1, k) ] for k in range(n) ]);
+    with pytest.raises(ValueError):
+        grover_evolution_from_sat(problem);
+    # failures are not cached:
+    assert len(grover_evolution_cache) == 0;
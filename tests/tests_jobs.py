@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+
+from src.thirdparty.quantum import *;
+
+import src.api.jobs;
+from src.api.registry import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class FakeJob():
+    def __init__(self, id: str):
+        self.id = id;
+
+    def job_id(self) -> str:
+        return self.id;
+
+class FakeBackend():
+    '''
+    Lists a fixed number of jobs and notes the pages requested.
+    '''
+    def __init__(self, num_jobs: int):
+        self.all_jobs = [ FakeJob(str(k)) for k in range(num_jobs) ];
+        self.requests = [];
+
+    def jobs(self, limit: int, skip: int, **_) -> list[FakeJob]:
+        self.requests.append(skip);
+        return self.all_jobs[skip:skip + limit];
+
+class FakeCreateBackend():
+    backend: FakeBackend;
+
+    def __init__(self, option, **_):
+        self.option = option;
+
+    def __enter__(self):
+        return self.option, FakeCreateBackend.backend;
+
+    def __exit__(self, *_):
+        return;
+
+@pytest.fixture
+def backend(monkeypatch, request) -> FakeBackend:
+    backend = FakeBackend(num_jobs=request.param);
+    FakeCreateBackend.backend = backend;
+    monkeypatch.setattr(src.api.jobs, 'CreateBackend', FakeCreateBackend);
+    monkeypatch.setattr(src.api.jobs, 'job_registry', JobRegistry(path=':memory:'));
+    return backend;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@pytest.mark.parametrize('backend', [ 0, 49, 50, 100, 101 ], indirect=True)
+def test_iterate_list_of_jobs_terminates(backend: FakeBackend):
+    pages = list(src.api.jobs.iterate_list_of_jobs(BACKEND.BELEM, page_size=50));
+    records = [ record for page in pages for record in page ];
+    assert [ record.job_id for record in records ] == [ job.job_id() for job in backend.all_jobs ];
+    # the status is not known without querying each job:
+    assert all(record.status is None and record.backend == BACKEND.BELEM.value for record in records);
+    # a full page is followed by one more request (which may be empty):
+    assert backend.requests == list(range(0, len(backend.all_jobs) + 1, 50));
+
+@pytest.mark.parametrize('backend', [ 3 ], indirect=True)
+def test_iterate_list_of_jobs_filtered_by_status(backend: FakeBackend):
+    pages = list(src.api.jobs.iterate_list_of_jobs(BACKEND.BELEM, status=QkJobStatus.DONE));
+    assert [ record.status for page in pages for record in page ] == [ 'DONE' ] * 3;
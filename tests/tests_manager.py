@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import asyncio;
+import pytest;
+
+from qiskit.providers import JobStatus;
+
+import src.api.manager;
+from src.api.manager import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class FakeJob():
+    '''
+    A job, whose status queries return the given values in turn (the last value is repeated).
+    Exceptions in the list are raised instead.
+    '''
+    def __init__(self, id: str, statuses: list[JobStatus | Exception]):
+        self.id = id;
+        self.statuses = list(statuses);
+        self.queries = 0;
+
+    def job_id(self) -> str:
+        return self.id;
+
+    def status(self) -> JobStatus:
+        value = self.statuses[min(self.queries, len(self.statuses) - 1)];
+        self.queries += 1;
+        if isinstance(value, Exception):
+            raise value;
+        return value;
+
+class FakeRegistry():
+    def __init__(self):
+        self.updates = [];
+
+    def update_status(self, job_id: str, status: str):
+        self.updates.append((job_id, status));
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    '''
+    Records the polling intervals instead of sleeping.
+    '''
+    sleeps = [];
+    async def sleep(interval: float):
+        sleeps.append(interval);
+        await asyncio.sleep(0);
+    monkeypatch.setattr(src.api.manager, 'asyncio_sleep', sleep);
+    return sleeps;
+
+@pytest.fixture
+def registry(monkeypatch) -> FakeRegistry:
+    registry = FakeRegistry();
+    monkeypatch.setattr(src.api.manager, 'job_registry', registry);
+    return registry;
+
+@pytest.fixture
+def manager() -> JobManager:
+    manager = JobManager(interval_min=1., interval_max=4., factor=2., loop=asyncio.new_event_loop());
+    yield manager;
+    manager.loop.close();
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_backoff(manager: JobManager, sleeps: list[float], registry: FakeRegistry):
+    S = JobStatus;
+    job = FakeJob('a', [ S.QUEUED, S.QUEUED, S.QUEUED, S.QUEUED, S.RUNNING, S.RUNNING, S.DONE ]);
+    statuses = [];
+    manager.track(job, on_status=lambda job, status: statuses.append(status));
+    assert manager.wait_sync() == [ job ];
+    # the interval grows upto the maximum and is reset upon changes of status:
+    assert sleeps == [ 1., 2., 4., 4., 1., 2. ];
+    assert statuses == [ S.QUEUED, S.RUNNING, S.DONE ];
+    # finished jobs are no longer tracked:
+    assert len(manager.jobs) == 0;
+
+def test_on_done_for_finished_job(manager: JobManager, sleeps: list[float], registry: FakeRegistry):
+    job = FakeJob('a', [ JobStatus.DONE ]);
+    done = [];
+    manager.track(job, on_done=done.append);
+    manager.wait_sync();
+    assert done == [ job ];
+    # registering again after completion calls back immediately (without polling):
+    manager.track(job, on_done=done.append);
+    assert done == [ job, job ];
+    assert job.queries == 1;
+    assert manager.wait_sync([ 'a' ]) == [ job ];
+
+def test_polling_survives_failed_queries(manager: JobManager, sleeps: list[float], registry: FakeRegistry):
+    job = FakeJob('a', [ ConnectionError('offline'), ConnectionError('offline'), JobStatus.DONE ]);
+    manager.track(job);
+    assert manager.wait_sync() == [ job ];
+    assert sleeps == [ 2., 4. ];
+    assert job.queries == 3;
+
+def test_registry_only_for_queued_jobs(manager: JobManager, sleeps: list[float], registry: FakeRegistry):
+    manager.track(FakeJob('simulator', [ JobStatus.DONE ]));
+    manager.track(FakeJob('queue', [ JobStatus.DONE ]), queue=True);
+    manager.wait_sync();
+    assert registry.updates == [ ('queue', 'DONE') ];
+
+def test_wait_for_unknown_job(manager: JobManager):
+    with pytest.raises(ValueError):
+        manager.wait_sync([ 'unknown' ]);
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import itertools;
+
+from src.models.boolsat import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def create_problem(clauses: list[list[tuple[int, int]]]) -> ProblemSAT:
+    problem = ProblemSAT(clauses=clauses);
+    problem.setup();
+    return problem;
+
+def models(problem: ProblemSAT) -> list[list[bool]]:
+    return [
+        list(solution)
+        for solution in itertools.product([ False, True ], repeat=problem.number_of_variables)
+        if problem.verify(list(solution))
+    ];
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_simplify_unit_propagation_solves_problem():
+    # x0 ⋀ (¬x0 ⋁ x1) ⋀ (¬x1 ⋁ x2)
+    problem = create_problem([ [ (1, 0) ], [ (0, 0), (1, 1) ], [ (0, 1), (1, 2) ] ]);
+    problem_reduced, reduction = simplify_problem(problem);
+    assert not reduction.unsatisfiable;
+    assert problem_reduced.number_of_variables == 0;
+    assert problem.verify(reduction.lift_solution([]));
+
+def test_simplify_contradiction():
+    problem = create_problem([ [ (1, 0) ], [ (0, 0) ] ]);
+    _, reduction = simplify_problem(problem);
+    assert reduction.unsatisfiable;
+
+def test_simplify_models_lift_to_models():
+    # x0 ⋀ (x1 ⋁ x2) ⋀ (¬x1 ⋁ ¬x2) ⋀ (¬x0 ⋁ x3 ⋁ x1)
+    problem = create_problem([
+        [ (1, 0) ],
+        [ (1, 1), (1, 2) ],
+        [ (0, 1), (0, 2) ],
+        [ (0, 0), (1, 3), (1, 1) ],
+    ]);
+    problem_reduced, reduction = simplify_problem(problem);
+    assert problem_reduced.number_of_variables < problem.number_of_variables;
+    solutions = models(problem_reduced);
+    assert len(solutions) > 0;
+    for solution in solutions:
+        assert problem.verify(reduction.lift_solution(solution));
+
+def test_lift_counts_keeps_suffix():
+    reduction = ReductionSAT(number_of_variables=4, positions=[ 1, 3 ], fixed={ 0: True }, free=[ 2 ]);
+    counts = reduction.lift_counts({ '101': 5, '011': 2, '100': 1 });
+    assert counts == { '11001': 5, '10011': 2, '11000': 1 };
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import itertools;
+import pytest;
+
+from src.thirdparty.maths import *;
+
+from src.models.boolsat import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def create_problem(clauses: list[list[tuple[int, int]]]) -> ProblemSAT:
+    problem = ProblemSAT(clauses=clauses);
+    problem.setup();
+    return problem;
+
+@pytest.fixture
+def problem() -> ProblemSAT:
+    # variables 1, 4, 7, 12 (not contiguous): (x1 ⋁ ¬x4) ⋀ (x4 ⋁ x7) ⋀ (¬x1 ⋁ ¬x7 ⋁ x12) ⋀ x12
+    return create_problem([ [ (1, 1), (0, 4) ], [ (1, 4), (1, 7) ], [ (0, 1), (0, 7), (1, 12) ], [ (1, 12) ] ]);
+
+def count_violated_clauses(clauses: list[list[tuple[int, int]]], values: dict[int, bool]) -> int:
+    return sum(not any(values[index] == bool(sgn) for sgn, index in clause) for clause in clauses);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_verify_many_agrees_with_verify(problem: ProblemSAT):
+    X = np.asarray(list(itertools.product([ False, True ], repeat=4)), dtype=bool);
+    satisfied, violated = problem.verify_many(X);
+    assert satisfied.tolist() == [ problem.verify(x.tolist()) for x in X ];
+    assert np.all((violated == 0) == satisfied);
+
+def test_verify_many_violated_clauses():
+    clauses = [ [ (1, 0), (0, 1) ], [ (1, 1), (1, 2) ], [ (0, 0), (0, 2), (1, 3) ], [ (1, 3) ] ];
+    problem = create_problem(clauses);
+    X = np.asarray(list(itertools.product([ False, True ], repeat=4)), dtype=bool);
+    _, violated = problem.verify_many(X);
+    assert violated.tolist() == [ count_violated_clauses(clauses, dict(enumerate(x))) for x in X.tolist() ];
+    # e.g. the assignment 0000 violates the 2nd and 4th clauses:
+    assert violated[0] == 2;
+
+def test_verify_many_packed(problem: ProblemSAT):
+    rng = np.random.default_rng(3);
+    X = rng.integers(2, size=(37, 4)).astype(bool);
+    expected = problem.verify_many(X);
+    actual = problem.verify_many(np.packbits(X, axis=1), packed=True);
+    assert np.array_equal(actual[0], expected[0]);
+    assert np.array_equal(actual[1], expected[1]);
+
+def test_verify_many_counts(problem: ProblemSAT):
+    counts = { '1011': 5, '0111': 3, '0000': 1 };
+    satisfied, violated = problem.verify_many(counts);
+    X = [ [ c == '1' for c in key ] for key in counts.keys() ];
+    # the results are ordered as the keys:
+    assert satisfied.tolist() == [ problem.verify(x) for x in X ] == [ True, False, False ];
+    assert np.array_equal(violated, problem.verify_many(np.asarray(X))[1]);
+
+def test_verify_many_counts_short_keys(problem: ProblemSAT):
+    # uncovered atoms are set to false, as in `verify`:
+    satisfied, violated = problem.verify_many({ '1': 1, '01': 1, '': 1 });
+    assert satisfied.tolist() == [ problem.verify([ True ]), problem.verify([ False, True ]), problem.verify([]) ];
+    assert violated.tolist() == problem.verify_many([ [ 1, 0, 0, 0 ], [ 0, 1, 0, 0 ], [ 0, 0, 0, 0 ] ])[1].tolist();
+    # longer keys (e.g. including ancillas) are truncated:
+    assert problem.verify_many({ '1011' + '111': 1 })[0].tolist() == [ True ];
+
+def test_verify_many_empty_inputs(problem: ProblemSAT):
+    for solutions, packed in [ ({}, False), ([], False), ([], True), (np.zeros((0, 4), dtype=bool), False) ]:
+        satisfied, violated = problem.verify_many(solutions, packed=packed);
+        assert satisfied.shape == violated.shape == (0,);
+
+def test_verify_many_without_variables():
+    # the empty conjunction is satisfied by every candidate:
+    problem = create_problem([]);
+    for solutions, packed in [ ({ '': 2, '1': 1 }, False), ([ [], [] ], False), (np.zeros((2, 0), dtype=np.uint8), True) ]:
+        satisfied, violated = problem.verify_many(solutions, packed=packed);
+        assert satisfied.tolist() == [ True, True ];
+        assert violated.tolist() == [ 0, 0 ];
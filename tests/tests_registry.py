@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+from datetime import datetime;
+from datetime import timedelta;
+import pytest;
+
+from src.api.registry import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class FakeJob():
+    def __init__(self, id: str):
+        self.id = id;
+
+    def job_id(self) -> str:
+        return self.id;
+
+    def status(self):
+        raise AssertionError('The status must not be queried upon recording!');
+
+@pytest.fixture
+def registry() -> JobRegistry:
+    registry = JobRegistry(path=':memory:');
+    registry.record(FakeJob('1'), backend='ibmq_a', queue=True, name='grover', tags=[ 'algorithm=grover', 'size=3' ]);
+    registry.record(FakeJob('2'), backend='ibmq_a', queue=True, name='grover', tags=[ 'algorithm=grover', 'size=4' ]);
+    registry.record(FakeJob('3'), backend='ibmq_b', queue=True, name='teleportation', tags=[ 'algorithm=teleportation' ]);
+    yield registry;
+    registry.close();
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_record_without_status_query(registry: JobRegistry):
+    record = registry.get('1');
+    assert record.status == 'QUEUED';
+    assert record.tags == [ 'algorithm=grover', 'size=3' ];
+
+def test_find_by_backend_and_tags(registry: JobRegistry):
+    assert [ record.job_id for record in registry.find(backend='ibmq_a') ] == [ '2', '1' ];
+    assert [ record.job_id for record in registry.find(tags=[ 'algorithm=grover', 'size=4' ]) ] == [ '2' ];
+    assert registry.find(tags=[ 'algorithm=grover', 'algorithm=teleportation' ]) == [];
+
+def test_find_by_status_and_time(registry: JobRegistry):
+    registry.update_status('3', 'DONE');
+    assert [ record.job_id for record in registry.find(status='DONE') ] == [ '3' ];
+    assert len(registry.find(since=datetime.now() - timedelta(minutes=1))) == 3;
+    assert registry.find(until=datetime.now() - timedelta(minutes=1)) == [];
+
+def test_find_paginated(registry: JobRegistry):
+    pages = [ registry.find(limit=2, offset=offset) for offset in [ 0, 2, 4 ] ];
+    assert [ len(page) for page in pages ] == [ 2, 1, 0 ];
+    assert [ record.job_id for page in pages for record in page ] == [ '3', '2', '1' ];
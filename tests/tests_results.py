@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import os;
+import pytest;
+
+from src.thirdparty.quantum import *;
+
+from src.api.results import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class FakeJob():
+    '''
+    Provides the methods of jobs, which are used by the result store.
+    '''
+    def __init__(self, id: str):
+        self.id = id;
+
+    def job_id(self) -> str:
+        return self.id;
+
+    def name(self) -> str:
+        return f'job {self.id}';
+
+    def tags(self) -> list[str]:
+        return [ 'algorithm=test' ];
+
+def create_result(job_id: str, counts: dict[str, int], **metadata) -> QkResult:
+    return QkResult.from_dict(dict(
+        backend_name = 'ibmq_fake',
+        backend_version = '1.0.0',
+        qobj_id = job_id,
+        job_id = job_id,
+        success = True,
+        results = [ dict(
+            shots = sum(counts.values()),
+            success = True,
+            data = dict(counts=counts, **metadata),
+            header = dict(memory_slots=2, name='circuit'),
+        ) ],
+    ));
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def test_store_round_trip(tmp_path):
+    store = ResultStore(path=str(tmp_path));
+    job = FakeJob('abc');
+    result = create_result('abc', { '0x0': 3, '0x3': 5 }, statevector=[ 1+0j, 0.5j ]);
+    assert 'abc' not in store;
+    store.put(job, result);
+    assert 'abc' in store;
+    cached = store.get('abc');
+    assert cached.job_id() == 'abc';
+    assert cached.name() == 'job abc';
+    assert cached.tags() == [ 'algorithm=test' ];
+    assert cached.done();
+    assert cached.result().get_counts() == result.get_counts();
+    assert cached.result().data()['statevector'] == [ 1+0j, 0.5j ];
+
+def test_store_rejects_unknown_values(tmp_path):
+    store = ResultStore(path=str(tmp_path));
+    result = create_result('abc', { '0x0': 1 }, extra=object());
+    with pytest.raises(TypeError):
+        store.put(FakeJob('abc'), result);
+    assert 'abc' not in store;
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = ResultStore(path=str(tmp_path));
+    for k, id in enumerate([ 'a', 'b', 'c' ]):
+        store.put(FakeJob(id), create_result(id, { '0x0': 1 }));
+        os.utime(store.file(id), (k, k));
+    # reading marks an entry as recently used:
+    assert store.get('a') is not None;
+    size = store.file('a').stat().st_size;
+    store.maxsize = 2 * size + size // 2;
+    store.evict();
+    assert 'a' in store and 'c' in store;
+    assert 'b' not in store;
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# IMPORTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import pytest;
+from qiskit.circuit.random import random_circuit;
+
+from src.thirdparty.maths import *;
+from src.thirdparty.quantum import *;
+
+from src.algorithms.grover import *;
+from src.models.boolsat import *;
+from src.models.quantum.simulator import *;
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# AUXILIARY
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+def assert_same_state(circuit: QuantumCircuit):
+    '''
+    Compares the native simulator with qiskit (including the global phase).
+    '''
+    expected = QkStatevector(circuit).data;
+    actual = simulate_statevector(circuit);
+    assert np.allclose(actual, expected, atol=1e-8);
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# TESTS
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+@pytest.mark.parametrize('seed', range(8))
+def test_random_circuits(seed: int):
+    circuit = random_circuit(num_qubits=5, depth=6, max_operands=3, seed=seed);
+    assert_same_state(circuit);
+
+@pytest.mark.parametrize('mode', [ 'noancilla', 'recursion', 'v-chain', 'v-chain-dirty' ])
+def test_mcx(mode: str):
+    circuit = QuantumCircuit(7);
+    circuit.h(range(4));
+    circuit.ry(0.3, 5);
+    circuit.mcx([ 0, 1, 2, 3 ], 4, ancilla_qubits=[ 5, 6 ], mode=mode);
+    assert_same_state(circuit);
+
+def test_controlled_gates():
+    circuit = QuantumCircuit(4);
+    circuit.h(range(4));
+    circuit.cz(0, 1);
+    circuit.cp(0.7, 1, 2);
+    circuit.mcp(1.1, [ 0, 1, 2 ], 3);
+    circuit.cry(0.4, 3, 0);
+    circuit.append(QkUnitaryGate(qk_random_unitary(2, seed=1)).control(2), [ 2, 3, 1 ]);
+    assert_same_state(circuit);
+
+def test_diagonal_gates():
+    circuit = QuantumCircuit(3);
+    circuit.h(range(3));
+    circuit.t(0);
+    circuit.s(1);
+    circuit.rz(0.5, 2);
+    circuit.append(QkDiagonal([ np.exp(1j * k) for k in range(8) ]), [ 0, 1, 2 ]);
+    circuit.global_phase += 0.25;
+    assert_same_state(circuit);
+
+@pytest.mark.parametrize('diffuser', [ DIFFUSION_MODE.DENSE, DIFFUSION_MODE.STRUCTURED ])
+def test_grover_iterate(diffuser: DIFFUSION_MODE):
+    problem = ProblemSAT(clauses=[ [ (1, 0), (0, 1) ], [ (1, 1), (1, 2) ], [ (0, 0), (0, 2), (1, 3) ] ]);
+    problem.setup();
+    grit = grover_iterator_from_sat(problem=problem, diffuser=diffuser);
+    circuit = QuantumCircuit(grit.num_qubits);
+    circuit.h(range(problem.number_of_variables));
+    circuit.compose(grit, inplace=True);
+    circuit.compose(grit, inplace=True);
+    assert_same_state(circuit);
+
+def test_batch_of_inputs():
+    circuit = random_circuit(num_qubits=3, depth=4, max_operands=2, seed=42);
+    states = simulate_statevectors(circuit);
+    U = QkOperator(circuit).data;
+    assert np.allclose(states, U.T, atol=1e-8);
+
+@pytest.mark.filterwarnings('ignore::ImportWarning')
+def test_snapshots_are_not_modified_by_later_gates():
+    # NOTE: registers the `save_statevector` instruction.
+    import qiskit.providers.aer;
+    circuit = QuantumCircuit(2);
+    circuit.x([ 0, 1 ]);
+    circuit.save_statevector(label='a');
+    # the following gates act in place on the state:
+    circuit.cz(0, 1);
+    circuit.z(0);
+    circuit.h(1);
+    circuit.save_statevector(label='b');
+    circuit.z(1);
+    snapshots = simulate_snapshots(circuit);
+    assert np.allclose(snapshots['a'], [ 0, 0, 0, 1 ]);
+    assert np.allclose(snapshots['b'], [ 0, 1/np.sqrt(2), 0, -1/np.sqrt(2) ]);